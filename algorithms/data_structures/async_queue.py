@@ -0,0 +1,138 @@
+import asyncio
+from typing import Any, Optional
+
+from algorithms.data_structures.double_linked_list import DoubleLinkedList
+
+
+class AsyncQueue:
+    """This class constitutes implementation of **asyncio** FIFO queue on top of `DoubleLinkedList`.
+
+    Values are kept in a `DoubleLinkedList`, and so are futures of coroutines blocked in `get` (queue empty) or
+    `put` (queue full). Coroutines are woken up one at a time in arrival order, without polling. A cancelled
+    waiter removes its own node handle in O(1). Not thread-safe, use from a single event loop.
+    """
+
+    def __init__(self, maxsize:int=0):
+        """
+        Args:
+            maxsize (int): Maximum number of values held before `put` waits, unbounded if `0`.
+        """
+
+        if maxsize < 0:
+            raise ValueError("maxsize must not be negative")
+
+        self.maxsize = maxsize
+        self._items = DoubleLinkedList()
+        self._getters = DoubleLinkedList() #~ Futures of coroutines waiting for a value
+        self._putters = DoubleLinkedList() #~ Futures of coroutines waiting for a free slot
+
+    def __len__(self):
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return len(self._items) == 0
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._items)
+
+    async def put(self, value:Any): #~ -> O(1), waits while full
+        """Adds `value` as a new *tail* of the `AsyncQueue`, waiting for a free slot if it is full.
+
+        Args:
+            value (Any): The value to be added to the `AsyncQueue`.
+        """
+
+        while self.full():
+            await self._wait(self._putters)
+
+        self.put_nowait(value)
+
+    def put_nowait(self, value:Any): #~ -> O(1)
+        """Adds `value` as a new *tail* of the `AsyncQueue` without waiting.
+
+        Raises:
+            asyncio.QueueFull: If the `AsyncQueue` holds `maxsize` values.
+        """
+
+        if self.full():
+            raise asyncio.QueueFull
+
+        self._items.append(value)
+        self._wakeup_next(self._getters)
+
+    async def get(self) -> Any: #~ -> O(1), waits while empty
+        """Deletes and returns *head* value of the `AsyncQueue`, waiting for one if it is empty.
+        """
+
+        while self.empty():
+            await self._wait(self._getters)
+
+        return self.get_nowait()
+
+    def get_nowait(self) -> Any: #~ -> O(1)
+        """Deletes and returns *head* value of the `AsyncQueue` without waiting.
+
+        Raises:
+            asyncio.QueueEmpty: If the `AsyncQueue` is empty.
+        """
+
+        if self.empty():
+            raise asyncio.QueueEmpty
+
+        value = self._items.pop_head()
+        self._wakeup_next(self._putters)
+        return value
+
+    async def get_batch(self, max_n:int, timeout:Optional[float]=None) -> list: #~ -> O(max_n)
+        """Deletes and returns up to `max_n` *head* values of the `AsyncQueue`.
+
+        Waits for the first value only - once there is one, returns what is available right away.
+
+        Args:
+            max_n (int): Maximum number of values to return.
+            timeout (Optional[float]): Seconds to wait for the first value, forever if `None`.
+
+        Returns:
+            list: Values in FIFO order, empty if none showed up within `timeout`.
+        """
+
+        if max_n < 1:
+            raise ValueError("max_n must be at least 1")
+
+        if self.empty(): #~ Timer is only armed when there is actually something to wait for
+            try:
+                async with asyncio.timeout(timeout):
+                    while self.empty():
+                        await self._wait(self._getters)
+            except TimeoutError:
+                return []
+
+        output = []
+        while len(output) < max_n and not self.empty():
+            output.append(self._items.pop_head())
+            self._wakeup_next(self._putters) #~ Each freed slot wakes up one producer
+
+        return output
+
+    async def _wait(self, waiters:DoubleLinkedList):
+        """Parks the current coroutine in `waiters` until `_wakeup_next` resolves its future.
+        """
+
+        future = asyncio.get_running_loop().create_future()
+        node = waiters.append(future)
+
+        try:
+            await future
+        except BaseException:
+            try:
+                waiters.remove_node(node)
+            except ValueError: #~ Already woken up, hand the wake-up over to the next waiter
+                self._wakeup_next(waiters)
+            raise
+
+    def _wakeup_next(self, waiters:DoubleLinkedList):
+        while len(waiters):
+            future = waiters.pop_head()
+            if not future.done():
+                future.set_result(None)
+                return
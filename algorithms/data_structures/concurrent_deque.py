@@ -0,0 +1,140 @@
+import threading
+import time
+from typing import Any, Optional
+
+from algorithms.data_structures.double_linked_list import Node
+
+
+class ConcurrentDeque:
+    """This class constitutes implementation of thread-safe **two-lock deque** (Michael & Scott queue with `prev` links).
+
+    The deque always starts with a dummy `Node`, so producers (`append`, under the *tail* lock) & consumers
+    (`pop_head`, under the *head* lock) touch disjoint nodes and never wait for each other. `prepend` &
+    `pop_tail` may have to cross the whole deque when it holds a single element, so they take both locks,
+    always in *head* → *tail* order.
+
+    `pop_head`/`pop_tail` block for up to `timeout` seconds when the deque is empty.
+    """
+
+    def __init__(self):
+        self._head = Node(None) #~ Dummy, first element is `self._head.next`
+        self._tail = self._head #~ Last element, or the dummy if empty
+        self._head_lock = threading.Lock()
+        self._tail_lock = threading.Lock()
+        self._not_empty = threading.Condition(self._head_lock)
+        self._waiting = 0 #~ Blocked consumers, changed under head lock only
+        self._added = 0 #~ Changed under tail lock only
+        self._removed = 0 #~ Changed under head lock only
+
+    def __len__(self):
+        return self._added - self._removed
+
+    def append(self, value:Any): #~ -> O(1), tail lock only
+        """Adds `value` as a new *tail* of the `ConcurrentDeque`, waking up a blocked consumer.
+
+        Args:
+            value (Any): The value to be added to the `ConcurrentDeque`.
+        """
+
+        new_node = Node(value)
+
+        with self._tail_lock:
+            new_node.prev = self._tail
+            self._tail.next = new_node #~ Publishes fully initialised node to consumers
+            self._tail = new_node
+            self._added += 1
+
+        if self._waiting: #~ Consumers register before checking for elements, so no wake-up is lost
+            with self._not_empty:
+                self._not_empty.notify()
+
+    def prepend(self, value:Any): #~ -> O(1), both locks
+        """Adds `value` as a new *head* of the `ConcurrentDeque`, waking up a blocked consumer.
+
+        Args:
+            value (Any): The value to be added to the `ConcurrentDeque`.
+        """
+
+        new_node = Node(value)
+
+        with self._head_lock, self._tail_lock:
+            first_node = self._head.next
+            new_node.prev = self._head
+            new_node.next = first_node
+
+            if first_node is None: #~ If no elements
+                self._tail = new_node
+            else:
+                first_node.prev = new_node
+
+            self._head.next = new_node
+            self._added += 1
+
+            if self._waiting:
+                self._not_empty.notify()
+
+    def pop_head(self, timeout:Optional[float]=0): #~ -> O(1), head lock only
+        """Deletes and returns *head* element from `ConcurrentDeque`.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for an element if empty - `0` does not wait, `None` waits forever.
+
+        Returns:
+            Any: Value of the removed element, or `None` if no element showed up in time.
+        """
+
+        with self._head_lock:
+            if self._head.next is None and not self._wait_for_element(timeout):
+                return None
+
+            first_node = self._head.next
+            value = first_node.value
+            first_node.value = None #~ First node becomes the new dummy
+            first_node.prev = None
+            self._head = first_node
+            self._removed += 1
+
+            return value
+
+    def pop_tail(self, timeout:Optional[float]=0): #~ -> O(1), both locks
+        """Deletes and returns *tail* element from `ConcurrentDeque`.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for an element if empty - `0` does not wait, `None` waits forever.
+
+        Returns:
+            Any: Value of the removed element, or `None` if no element showed up in time.
+        """
+
+        with self._head_lock:
+            if self._head.next is None and not self._wait_for_element(timeout):
+                return None
+
+            with self._tail_lock: #~ Holding head lock, so the deque cannot get emptied meanwhile
+                last_node = self._tail
+                self._tail = last_node.prev
+                self._tail.next = None
+                last_node.prev = None
+                self._removed += 1
+
+            return last_node.value
+
+    def _wait_for_element(self, timeout:Optional[float]) -> bool:
+        """Waits (holding head lock) until the deque is not empty. Returns `False` if `timeout` ran out.
+        """
+
+        if timeout is not None and timeout <= 0:
+            return False
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._waiting += 1
+
+        try:
+            while self._head.next is None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._not_empty.wait(remaining)
+            return True
+        finally:
+            self._waiting -= 1
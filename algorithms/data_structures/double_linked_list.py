@@ -1,10 +1,17 @@
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Optional
+
+from algorithms.data_structures.gc_utils import gc_paused
+from algorithms.data_structures.packed_values import pack_values, unpack_values
+from algorithms.data_structures.value_index import ValueIndex
+from algorithms.sort.linked_list_merge_sort import merge_sort_nodes
 
 
 class Node:
     """Represents instances to be used in `DoubleLinkedList`
     """
     
+    __slots__ = ('value', 'prev', 'next') #~ No per-instance `__dict__`
+    
     def __init__(self, value:Any):
         self.value = value
         self.prev:Optional[Node] = None
@@ -16,21 +23,124 @@ class Node:
 
 class DoubleLinkedList:
     """This class constitutes implementation of **Double Linked List** data structure.
+    
+    Positional operations remember the last accessed node & its index (the *finger*), so that the next lookup
+    starts from the closest of *head*, *tail* or the finger. `finger_hits`/`finger_misses` count how often
+    the finger was the closest starting point.
+    
+    With `value_index=True` every node is also kept in a `ValueIndex` by its value, turning `in`, `index_of`
+    & `remove_value` from scans into hash lookups. The index is updated by every mutating method, costing
+    extra memory & time per added or removed element. Values must not be changed while they are in the list.
     """
     
-    def __init__(self):
+    def __init__(self, value_index:bool=False):
         self.head:Optional[Node] = None #~ BEGINNING
         self.tail:Optional[Node] = None #~ END
         self._len = 0
+        self._mods = 0 #~ Bumped by every structural change, iterators use it to detect mutation
+        self._finger:Optional[Node] = None #~ Last accessed node
+        self._finger_idx = 0 #~ Index of the last accessed node
+        self.finger_hits = 0
+        self.finger_misses = 0
+        self._index:Optional[ValueIndex] = ValueIndex() if value_index else None
+    
+    @classmethod
+    def from_iterable(cls, iterable:Iterable, value_index:bool=False): #~ -> O(n)
+        """Creates a new `DoubleLinkedList` holding values of `iterable` in order.
+
+        Args:
+            iterable (Iterable): Values to be added to the `DoubleLinkedList`. Generators are consumed lazily.
+            value_index (bool): Keeps nodes in a `ValueIndex`, see `DoubleLinkedList`.
+        """
+        
+        output = cls(value_index=True) if value_index else cls()
+        output.extend(iterable)
+        return output
+    
+    @classmethod
+    def from_bytes(cls, data:bytes): #~ -> O(n)
+        """Creates a new `DoubleLinkedList` out of numbers packed by `to_bytes`.
+        """
+        
+        return cls.from_iterable(unpack_values(data))
     
     def __len__(self):
         return self._len
     
-    def append(self, value:Any): #~ -> O(1)
+    def __iter__(self): #~ -> O(n)
+        """Yields values from *head* to *tail*.
+        
+        Raises:
+            RuntimeError: If the `DoubleLinkedList` gets structurally changed while iterating.
+        """
+        
+        mods = self._mods
+        current_node = self.head
+        
+        while current_node is not None:
+            yield current_node.value
+            if self._mods != mods: #~ `current_node` may have been unlinked meanwhile
+                raise RuntimeError("DoubleLinkedList mutated during iteration")
+            current_node = current_node.next
+    
+    def __reversed__(self): #~ -> O(n)
+        """Yields values from *tail* to *head*.
+        
+        Raises:
+            RuntimeError: If the `DoubleLinkedList` gets structurally changed while iterating.
+        """
+        
+        mods = self._mods
+        current_node = self.tail
+        
+        while current_node is not None:
+            yield current_node.value
+            if self._mods != mods:
+                raise RuntimeError("DoubleLinkedList mutated during iteration")
+            current_node = current_node.prev
+    
+    def __contains__(self, value:Any) -> bool: #! -> O(n), O(1) with value_index
+        if self._index is not None:
+            return bool(self._index.lookup(value))
+        
+        current_node = self.head
+        
+        while current_node is not None:
+            if current_node.value is value or current_node.value == value: #~ Identity first, like `list`
+                return True
+            current_node = current_node.next
+        
+        return False
+    
+    def __reduce__(self): #~ -> O(n)
+        """Pickles as a flat sequence of values, not as a chain of nodes (which recurses once per node).
+        """
+        
+        return type(self), (() if self._index is None else (True,)), self.__getstate__()
+    
+    def __getstate__(self) -> list:
+        return self._values()
+    
+    def __setstate__(self, values:list):
+        self.extend(values) #~ Bulk linker, on a list freshly created by `__reduce__`
+    
+    def to_bytes(self, typecode:str='d') -> bytes: #~ -> O(n)
+        """Packs numeric values into a compact binary blob, several times smaller & faster than pickle.
+
+        Args:
+            typecode (str): `array` typecode of values, e.g. `'d'` (float64) or `'q'` (int64).
+        """
+        
+        return pack_values(self._values(), typecode)
+    
+    def append(self, value:Any) -> Node: #~ -> O(1)
         """Creates a new `Node` with `value` & adds it as a new *tail* of the `DoubleLinkedList`.
 
         Args:
             value (Any): The value to be added to the `DoubleLinkedList`.
+            
+        Returns:
+            Node: Handle of the new element, accepted by `remove_node`, `move_to_front` & `move_to_back`.
         """
         
         new_node = Node(value)
@@ -45,12 +155,21 @@ class DoubleLinkedList:
             old_tail.next = self.tail
         
         self._len += 1
+        self._mods += 1
+        
+        if self._index is not None:
+            self._index.add(new_node)
+        
+        return new_node
             
-    def prepend(self, value:Any): #~ -> O(1)
+    def prepend(self, value:Any) -> Node: #~ -> O(1)
         """Creates a new `Node` with `value` & adds it as a new *head* of the `DoubleLinkedList`.
 
         Args:
             value (Any): The value to be added to the `DoubleLinkedList`.
+            
+        Returns:
+            Node: Handle of the new element, accepted by `remove_node`, `move_to_front` & `move_to_back`.
         """
         
         new_node = Node(value)
@@ -65,6 +184,93 @@ class DoubleLinkedList:
             old_head.prev = self.head
             
         self._len += 1
+        self._mods += 1
+        
+        if self._finger is not None: #~ Finger shifts right by one
+            self._finger_idx += 1
+        
+        if self._index is not None:
+            self._index.add(new_node)
+        
+        return new_node
+    
+    def extend(self, iterable:Iterable): #~ -> O(k)
+        """Adds values of `iterable` after the *tail* of the `DoubleLinkedList`, linking nodes in a single pass.
+
+        Args:
+            iterable (Iterable): Values to be added to the `DoubleLinkedList`. Generators are consumed lazily.
+        """
+        
+        if iterable is self: #~ Extending with itself must not see the nodes being added
+            iterable = self._values()
+        
+        iterator = iter(iterable)
+        last_node = old_tail = self.tail
+        count = 0
+        
+        if last_node is None: #~ If no elements, first value becomes head
+            for value in iterator:
+                last_node = self.head = Node(value)
+                count = 1
+                break
+            else:
+                return
+        
+        try:
+            with gc_paused(): #~ Automatic collections would re-traverse the growing chain
+                for value in iterator:
+                    new_node = Node(value)
+                    new_node.prev = last_node
+                    last_node.next = new_node
+                    last_node = new_node
+                    count += 1
+        finally: #~ Values linked before a failing iterator raised are kept
+            self.tail = last_node
+            self._len += count
+            self._mods += 1
+            if self._index is not None and count: #~ Indexed afterwards, keeping the linking loop tight
+                self._index.add_chain(self.head if old_tail is None else old_tail.next)
+    
+    def extendleft(self, iterable:Iterable): #~ -> O(k)
+        """Adds values of `iterable` before the *head* of the `DoubleLinkedList`, linking nodes in a single pass.
+        
+        Like `collections.deque.extendleft`, every value becomes the new *head*, so they end up in reverse order.
+
+        Args:
+            iterable (Iterable): Values to be added to the `DoubleLinkedList`. Generators are consumed lazily.
+        """
+        
+        if iterable is self: #~ Extending with itself must not see the nodes being added
+            iterable = self._values()
+        
+        iterator = iter(iterable)
+        first_node = old_head = self.head
+        count = 0
+        
+        if first_node is None: #~ If no elements, first value becomes tail
+            for value in iterator:
+                first_node = self.tail = Node(value)
+                count = 1
+                break
+            else:
+                return
+        
+        try:
+            with gc_paused(): #~ Automatic collections would re-traverse the growing chain
+                for value in iterator:
+                    new_node = Node(value)
+                    new_node.next = first_node
+                    first_node.prev = new_node
+                    first_node = new_node
+                    count += 1
+        finally: #~ Values linked before a failing iterator raised are kept
+            self.head = first_node
+            self._len += count
+            self._mods += 1
+            if self._finger is not None: #~ Finger shifts right by number of added values
+                self._finger_idx += count
+            if self._index is not None and count:
+                self._index.add_chain(self.head, old_head)
     
     def pop_head(self): #~ -> O(1)
         """Deletes and returns *head* element from `DoubleLinkedList`.
@@ -81,8 +287,18 @@ class DoubleLinkedList:
             output = self.head
             self.head = output.next
             self.head.prev = None
+            output.next = None
             
         self._len -= 1
+        self._mods += 1
+        
+        if self._finger is output: #~ Finger got removed
+            self._finger = None
+        elif self._finger is not None: #~ Finger shifts left by one
+            self._finger_idx -= 1
+        
+        if self._index is not None:
+            self._index.discard(output)
             
         return output.value
             
@@ -101,11 +317,73 @@ class DoubleLinkedList:
             output = self.tail
             self.tail = output.prev
             self.tail.next = None
+            output.prev = None
         
         self._len -= 1
+        self._mods += 1
+        
+        if self._finger is output: #~ Finger got removed
+            self._finger = None
+        
+        if self._index is not None:
+            self._index.discard(output)
         
         return output.value
     
+    def insert(self, pos_idx:int, value:Any) -> Node: #! -> O(n)
+        """Creates a new `Node` with `value` & places it at `pos_idx` of the `DoubleLinkedList`.
+        
+        Follows `list.insert` semantics - negative `pos_idx` counts from the end & out of bounds indices are clamped.
+
+        Args:
+            pos_idx (int): Index the new element will have.
+            value (Any): The value to be added to the `DoubleLinkedList`.
+            
+        Returns:
+            Node: Handle of the new element, accepted by `remove_node`, `move_to_front` & `move_to_back`.
+        """
+        
+        if pos_idx < 0:
+            pos_idx = max(pos_idx + len(self), 0)
+        
+        if pos_idx == 0: #~ If pos_idx is at head
+            return self.prepend(value)
+        elif pos_idx >= len(self): #~ If pos_idx is past tail
+            return self.append(value)
+        
+        next_node = self._node_at(pos_idx)
+        new_node = Node(value)
+        new_node.prev, new_node.next = next_node.prev, next_node
+        next_node.prev.next = new_node
+        next_node.prev = new_node
+        
+        self._len += 1
+        self._mods += 1
+        self._finger = new_node #~ `next_node` moved to `pos_idx + 1`, new node took its index
+        
+        if self._index is not None:
+            self._index.add(new_node)
+        
+        return new_node
+    
+    def __getitem__(self, pos_idx:int): #! -> O(n)
+        """Returns value of element at `pos_idx`. Negative `pos_idx` counts from the end.
+
+        Args:
+            pos_idx (int): Index of the element.
+            
+        Raises:
+            IndexError: If `pos_idx` is out of bounds.
+        """
+        
+        if pos_idx < 0:
+            pos_idx += len(self)
+        
+        if not (0 <= pos_idx < len(self)):
+            raise IndexError("DoubleLinkedList index out of range")
+        
+        return self._node_at(pos_idx).value
+    
     def delete(self, pos_idx:int): #! -> O(n)
         """Deletes and returns element at `pos_idx` from `DoubleLinkedList`.
 
@@ -123,20 +401,313 @@ class DoubleLinkedList:
             return self.pop_head()
         elif pos_idx == len(self)-1: #~ If pos_idx is at tail
             return self.pop_tail()
+        
+        current_node = self._node_at(pos_idx)
+        current_node.prev.next, current_node.next.prev = current_node.next, current_node.prev
+        
+        self._len -= 1
+        self._mods += 1
+        self._finger = current_node.next #~ Following node took over `pos_idx`
+        current_node.prev = current_node.next = None
+        
+        if self._index is not None:
+            self._index.discard(current_node)
+        
+        return current_node.value
+    
+    def remove_node(self, node:Node): #~ -> O(1)
+        """Deletes element identified by `node` handle from `DoubleLinkedList` & returns its value.
+
+        Args:
+            node (Node): Handle returned by `append`, `prepend` or `insert` of this `DoubleLinkedList`.
             
-        if pos_idx < len(self)//2: #~ If pos_idx is closer to head
+        Raises:
+            ValueError: If `node` was already removed or is *head*/*tail* of another list. Handles from the middle
+                of another list are not detected & corrupt both lists.
+        """
+        
+        self._check_linked(node)
+        self._unlink(node)
+        self._len -= 1
+        self._mods += 1
+        
+        if self._index is not None:
+            self._index.discard(node)
+        
+        return node.value
+    
+    def index_of(self, value:Any) -> int: #! -> O(n), O(1) with value_index if value is missing
+        """Returns index of the first element equal to `value`, like `list.index`.
+        
+        With `value_index` the node is looked up by hash & its index counted walking back to *head*.
+
+        Args:
+            value (Any): The value to be found.
+            
+        Raises:
+            ValueError: If no element is equal to `value`.
+        """
+        
+        node = self._find(value)
+        if node is None:
+            raise ValueError(f"{value!r} is not in the DoubleLinkedList")
+        
+        pos_idx = 0
+        while node.prev is not None:
+            node = node.prev
+            pos_idx += 1
+        
+        return pos_idx
+    
+    def remove_value(self, value:Any): #! -> O(n), O(1) with value_index unless value repeats
+        """Deletes the first element equal to `value`, like `list.remove`.
+
+        Args:
+            value (Any): The value to be removed.
+            
+        Raises:
+            ValueError: If no element is equal to `value`.
+        """
+        
+        node = self._find(value)
+        if node is None:
+            raise ValueError(f"{value!r} is not in the DoubleLinkedList")
+        
+        self.remove_node(node)
+    
+    def move_to_front(self, node:Node): #~ -> O(1)
+        """Moves element identified by `node` handle to the *head* of the `DoubleLinkedList`.
+
+        Args:
+            node (Node): Handle returned by `append`, `prepend` or `insert` of this `DoubleLinkedList`.
+            
+        Raises:
+            ValueError: If `node` was already removed or is *head*/*tail* of another list. Handles from the middle
+                of another list are not detected & corrupt both lists.
+        """
+        
+        self._check_linked(node)
+        
+        if node is self.head:
+            return
+        
+        self._unlink(node)
+        node.next = self.head
+        self.head.prev = node
+        self.head = node
+        self._mods += 1
+    
+    def move_to_back(self, node:Node): #~ -> O(1)
+        """Moves element identified by `node` handle to the *tail* of the `DoubleLinkedList`.
+
+        Args:
+            node (Node): Handle returned by `append`, `prepend` or `insert` of this `DoubleLinkedList`.
+            
+        Raises:
+            ValueError: If `node` was already removed or is *head*/*tail* of another list. Handles from the middle
+                of another list are not detected & corrupt both lists.
+        """
+        
+        self._check_linked(node)
+        
+        if node is self.tail:
+            return
+        
+        self._unlink(node)
+        node.prev = self.tail
+        self.tail.next = node
+        self.tail = node
+        self._mods += 1
+    
+    def concat(self, other:'DoubleLinkedList'): #~ -> O(1), O(k) with value_index
+        """Moves all elements of `other` after the *tail* of the `DoubleLinkedList`, leaving `other` empty.
+        
+        Nodes are relinked, not copied. With `value_index` the moved nodes are indexed one by one.
+
+        Args:
+            other (DoubleLinkedList): The list to take elements from.
+            
+        Raises:
+            ValueError: If `other` is the `DoubleLinkedList` itself.
+        """
+        
+        if other is self:
+            raise ValueError("cannot concat DoubleLinkedList with itself")
+        
+        if not other.head: #~ If other has no elements
+            return
+        
+        if self._index is not None:
+            self._index.add_chain(other.head)
+        
+        if not self.head: #~ If no elements
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+            other.head.prev = self.tail
+        
+        self.tail = other.tail
+        self._len += len(other)
+        self._mods += 1
+        
+        other.clear()
+    
+    def split_at(self, pos_idx:int) -> 'DoubleLinkedList': #! -> O(n), O(1) once node at pos_idx is located
+        """Cuts the `DoubleLinkedList` before `pos_idx` & returns a new list holding the cut off suffix.
+        
+        Follows slicing semantics - negative `pos_idx` counts from the end & out of bounds indices are clamped.
+        With `value_index` the suffix gets an index too, nodes are moved to it one by one.
+
+        Args:
+            pos_idx (int): Index of the first element moved to the returned list.
+        """
+        
+        if pos_idx < 0:
+            pos_idx = max(pos_idx + len(self), 0)
+        
+        suffix = type(self)() if self._index is None else type(self)(value_index=True)
+        
+        if pos_idx >= len(self): #~ If nothing to cut off
+            return suffix
+        
+        if pos_idx == 0: #~ If everything is cut off
+            suffix.concat(self)
+            return suffix
+        
+        first_node = self._node_at(pos_idx)
+        suffix.head, suffix.tail, suffix._len = first_node, self.tail, len(self) - pos_idx
+        
+        if self._index is not None:
+            current_node = first_node
+            while current_node is not None:
+                self._index.discard(current_node)
+                current_node = current_node.next
+            suffix._index.add_chain(first_node)
+        
+        self.tail = first_node.prev
+        self.tail.next = None
+        first_node.prev = None
+        self._len = pos_idx
+        self._mods += 1
+        self._finger = None #~ Finger sits on the cut off node
+        
+        return suffix
+    
+    def sort(self, *, key:Optional[Callable]=None, reverse:bool=False): #~ -> O(n log n), O(1) extra space
+        """Sorts the `DoubleLinkedList` in place with stable bottom-up merge sort, relinking nodes (handles stay valid).
+
+        Args:
+            key (Optional[Callable]): Computes comparison key out of a value, values themselves if `None`.
+            reverse (bool): Sorts in descending order.
+        """
+        
+        self.head, self.tail = merge_sort_nodes(self.head, key, reverse)
+        
+        prev_node, current_node = None, self.head
+        while current_node is not None: #~ Merging only relinked `next`
+            current_node.prev = prev_node
+            prev_node, current_node = current_node, current_node.next
+        
+        self._mods += 1
+        self._finger = None
+    
+    def clear(self): #~ -> O(1)
+        """Removes all elements from the `DoubleLinkedList`.
+        """
+        
+        self.head = None
+        self.tail = None
+        self._len = 0
+        self._mods += 1
+        self._finger = None
+        
+        if self._index is not None:
+            self._index.clear()
+    
+    def _values(self) -> list: #~ -> O(n)
+        """Collects values from *head* to *tail* - a plain loop, about a third faster than `list(self)`.
+        """
+        
+        values = []
+        append = values.append
+        current_node = self.head
+        
+        while current_node is not None:
+            append(current_node.value)
+            current_node = current_node.next
+        
+        return values
+    
+    def _find(self, value:Any) -> Optional[Node]: #! -> O(n), O(1) with value_index unless value repeats
+        """Returns the first `Node` holding a value equal to `value`, `None` if there is none.
+        """
+        
+        if self._index is None:
             current_node = self.head
-            while pos_idx > 0:
+            while current_node is not None and not (current_node.value is value or current_node.value == value):
+                current_node = current_node.next
+            return current_node
+        
+        nodes = self._index.lookup(value)
+        if len(nodes) <= 1:
+            return next(iter(nodes), None)
+        
+        current_node = self.head #~ Index knows no order, the first of equal values is found walking from head
+        while current_node not in nodes:
+            current_node = current_node.next
+        return current_node
+    
+    def _check_linked(self, node:Node):
+        """Rejects handles of removed elements & of *head*/*tail* of other lists in O(1).
+        
+        A node in the middle of another list looks like one of this list's nodes. Telling them apart would take
+        a walk to *head*, so passing such a handle is undefined behaviour - both lists get corrupted.
+        """
+        
+        if (node.prev is None and node is not self.head) or (node.next is None and node is not self.tail):
+            raise ValueError(f"{node!r} is not linked to the DoubleLinkedList")
+    
+    def _unlink(self, node:Node):
+        """Detaches `node` from its neighbours (fixing *head*/*tail*). Drops finger, as indices may have shifted.
+        """
+        
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        
+        node.prev = node.next = None
+        self._finger = None
+    
+    def _node_at(self, pos_idx:int) -> Node: #! -> O(n), O(distance from finger) for local access
+        """Returns `Node` at `pos_idx` (assumed to be in bounds), walking from the closest of *head*, *tail* & finger.
+        """
+        
+        from_tail = len(self) - 1 - pos_idx
+        
+        if self._finger is not None and abs(pos_idx - self._finger_idx) < min(pos_idx, from_tail): #~ If finger is closest
+            self.finger_hits += 1
+            current_node = self._finger
+            for _ in range(pos_idx - self._finger_idx):
+                current_node = current_node.next
+            for _ in range(self._finger_idx - pos_idx):
+                current_node = current_node.prev
+        elif pos_idx <= from_tail: #~ If pos_idx is closer to head
+            self.finger_misses += 1
+            current_node = self.head
+            for _ in range(pos_idx):
                 current_node = current_node.next
-                pos_idx -= 1
-            current_node.prev.next, current_node.next.prev = current_node.next, current_node.prev
         else: #~ If pos_idx is closer to tail
+            self.finger_misses += 1
             current_node = self.tail
-            while pos_idx > 0:
+            for _ in range(from_tail):
                 current_node = current_node.prev
-                pos_idx -= 1
-            current_node.prev.next, current_node.next.prev = current_node.next, current_node.prev
         
-        self._len -= 1
+        self._finger, self._finger_idx = current_node, pos_idx
         
-        return current_node.value
\ No newline at end of file
+        return current_node
@@ -0,0 +1,19 @@
+import gc
+from contextlib import contextmanager
+
+
+@contextmanager
+def gc_paused():
+    """Pauses cyclic garbage collector for the duration of the block.
+
+    Bulk linking allocates nodes that reference each other, so every automatic collection triggered midway
+    re-traverses the whole chain built so far. Collection resumes (if it was enabled) once the block exits.
+    """
+
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
@@ -0,0 +1,504 @@
+import random
+from typing import Any, Callable, Iterable, Optional
+
+from algorithms.data_structures.double_linked_list import DoubleLinkedList, Node
+from algorithms.data_structures.gc_utils import gc_paused
+
+
+MAX_LEVEL = 32
+
+
+class IndexedNode(Node):
+    """Represents instances to be used in `IndexedDoubleLinkedList`.
+
+    Besides `prev`/`next` (level 0) every node carries a tower of express links. `skips[k]` is the next node
+    having a tower of at least `k+1` entries & `widths[k]` is how many level 0 steps that link jumps over.
+    """
+
+    __slots__ = ('skips', 'widths')
+
+    def __init__(self, value:Any, height:int=0):
+        super().__init__(value)
+        self.skips:list[Optional[IndexedNode]] = [None] * height
+        self.widths:list[int] = [0] * height
+
+
+class IndexedDoubleLinkedList(DoubleLinkedList):
+    """This class constitutes implementation of **Double Linked List** with an **indexable skip list** over its nodes.
+
+    Positional access (`__getitem__`, `insert`, `delete`) is O(log n) expected. The price is that operations at
+    both ends are also O(log n) instead of O(1), since the index has to be kept consistent on every mutation.
+    """
+
+    def __init__(self, seed:Optional[int]=None):
+        super().__init__()
+        self._random = random.Random(seed)
+        self._sentinel = IndexedNode(None, MAX_LEVEL) #~ Sits at position -1, its express links start every level
+        self._height = 0 #~ Number of levels in use above level 0
+
+    def append(self, value:Any) -> IndexedNode: #~ -> O(log n)
+        """Creates a new `IndexedNode` with `value` & adds it as a new *tail* of the `IndexedDoubleLinkedList`.
+
+        Args:
+            value (Any): The value to be added to the `IndexedDoubleLinkedList`.
+
+        Returns:
+            IndexedNode: Handle of the new element, accepted by `remove_node`, `move_to_front` & `move_to_back`.
+        """
+
+        return self._insert_at(len(self), value)
+
+    def prepend(self, value:Any) -> IndexedNode: #~ -> O(log n)
+        """Creates a new `IndexedNode` with `value` & adds it as a new *head* of the `IndexedDoubleLinkedList`.
+
+        Args:
+            value (Any): The value to be added to the `IndexedDoubleLinkedList`.
+
+        Returns:
+            IndexedNode: Handle of the new element, accepted by `remove_node`, `move_to_front` & `move_to_back`.
+        """
+
+        return self._insert_at(0, value)
+
+    def insert(self, pos_idx:int, value:Any) -> IndexedNode: #~ -> O(log n)
+        """Creates a new `IndexedNode` with `value` & places it at `pos_idx` of the `IndexedDoubleLinkedList`.
+
+        Follows `list.insert` semantics - negative `pos_idx` counts from the end & out of bounds indices are clamped.
+
+        Args:
+            pos_idx (int): Index the new element will have.
+            value (Any): The value to be added to the `IndexedDoubleLinkedList`.
+
+        Returns:
+            IndexedNode: Handle of the new element, accepted by `remove_node`, `move_to_front` & `move_to_back`.
+        """
+
+        if pos_idx < 0:
+            pos_idx = max(pos_idx + len(self), 0)
+
+        return self._insert_at(min(pos_idx, len(self)), value)
+
+    def extend(self, iterable:Iterable): #~ -> O(k + log n)
+        """Adds values of `iterable` after the *tail* of the `IndexedDoubleLinkedList` in a single pass.
+
+        Express links are threaded through the new nodes as they are created, starting from the last node
+        of every level, so the index does not have to be searched per value.
+
+        Args:
+            iterable (Iterable): Values to be added to the `IndexedDoubleLinkedList`. Generators are consumed lazily.
+        """
+
+        if iterable is self: #~ Extending with itself must not see the nodes being added
+            iterable = self._values()
+
+        last_node, update, update_pos = self._search(len(self)) #~ Last node of every level
+        pos_idx = len(self)
+
+        try:
+            with gc_paused(): #~ Automatic collections would re-traverse the growing chain
+                for value in iterable:
+                    height = self._random_height()
+
+                    while self._height < height: #~ New levels start at sentinel, widths get fixed below
+                        self._sentinel.skips[self._height] = None
+                        update.append(self._sentinel)
+                        update_pos.append(-1)
+                        self._height += 1
+
+                    new_node = IndexedNode(value, height)
+
+                    for level in range(height):
+                        update[level].skips[level] = new_node
+                        update[level].widths[level] = pos_idx - update_pos[level]
+                        update[level] = new_node
+                        update_pos[level] = pos_idx
+
+                    if last_node is self._sentinel: #~ If new node becomes head
+                        self.head = new_node
+                    else:
+                        new_node.prev = last_node
+                        last_node.next = new_node
+
+                    last_node = new_node
+                    pos_idx += 1
+        finally: #~ Values linked before a failing iterator raised are kept
+            for level in range(self._height): #~ Last links on every level jump to the end
+                update[level].widths[level] = pos_idx - update_pos[level]
+
+            if pos_idx > len(self):
+                self.tail = last_node
+                self._len = pos_idx
+                self._mods += 1
+
+    def extendleft(self, iterable:Iterable): #~ -> O(k log n)
+        """Adds values of `iterable` before the *head* of the `IndexedDoubleLinkedList`.
+
+        Like `collections.deque.extendleft`, every value becomes the new *head*, so they end up in reverse order.
+
+        Args:
+            iterable (Iterable): Values to be added to the `IndexedDoubleLinkedList`. Generators are consumed lazily.
+        """
+
+        if iterable is self: #~ Extending with itself must not see the nodes being added
+            iterable = self._values()
+
+        for value in iterable:
+            self._insert_at(0, value)
+
+    def pop_head(self): #~ -> O(log n)
+        """Deletes and returns *head* element from `IndexedDoubleLinkedList`.
+        """
+
+        if not self.head: #~ If no elements
+            return None
+
+        return self._delete_at(0)
+
+    def pop_tail(self): #~ -> O(log n)
+        """Deletes and returns *tail* element from `IndexedDoubleLinkedList`.
+        """
+
+        if not self.head: #~ If no elements
+            return None
+
+        return self._delete_at(len(self) - 1)
+
+    def delete(self, pos_idx:int): #~ -> O(log n)
+        """Deletes and returns element at `pos_idx` from `IndexedDoubleLinkedList`.
+
+        Args:
+            pos_idx (int): Index of the element to delete.
+        """
+
+        if not (0 <= pos_idx < len(self)): #~ If pos_idx out of bounds (or no elements)
+            return None
+
+        return self._delete_at(pos_idx)
+
+    def remove_node(self, node:IndexedNode): #! -> O(n)
+        """Deletes element identified by `node` handle from `IndexedDoubleLinkedList` & returns its value.
+
+        Nodes keep no backward express links, so the position of `node` is found by walking towards *head*.
+
+        Args:
+            node (IndexedNode): Handle returned by `append`, `prepend` or `insert` of this `IndexedDoubleLinkedList`.
+
+        Raises:
+            ValueError: If `node` was already removed or belongs to another list.
+        """
+
+        self._check_linked(node)
+
+        return self._delete_at(self._position_of(node))
+
+    def move_to_front(self, node:IndexedNode): #! -> O(n)
+        """Moves element identified by `node` handle to the *head* of the `IndexedDoubleLinkedList`.
+
+        Args:
+            node (IndexedNode): Handle returned by `append`, `prepend` or `insert` of this `IndexedDoubleLinkedList`.
+
+        Raises:
+            ValueError: If `node` was already removed or belongs to another list.
+        """
+
+        self._check_linked(node)
+        self._unlink_at(self._position_of(node))
+        self._link_at(0, node)
+
+    def move_to_back(self, node:IndexedNode): #! -> O(n)
+        """Moves element identified by `node` handle to the *tail* of the `IndexedDoubleLinkedList`.
+
+        Args:
+            node (IndexedNode): Handle returned by `append`, `prepend` or `insert` of this `IndexedDoubleLinkedList`.
+
+        Raises:
+            ValueError: If `node` was already removed or belongs to another list.
+        """
+
+        self._check_linked(node)
+        self._unlink_at(self._position_of(node))
+        self._link_at(len(self), node)
+
+    def concat(self, other:DoubleLinkedList): #~ -> O(log n)
+        """Moves all elements of `other` after the *tail* of the `IndexedDoubleLinkedList`, leaving `other` empty.
+
+        Express links of `other` are spliced onto the last node of every level. Elements of a list without
+        an index are re-added one by one instead, in O(k).
+
+        Args:
+            other (DoubleLinkedList): The list to take elements from.
+
+        Raises:
+            ValueError: If `other` is the `IndexedDoubleLinkedList` itself.
+        """
+
+        if other is self:
+            raise ValueError("cannot concat IndexedDoubleLinkedList with itself")
+
+        if not isinstance(other, IndexedDoubleLinkedList): #~ Nodes lack express links
+            values = other._values()
+            other.clear()
+            return self.extend(values)
+
+        if not other.head: #~ If other has no elements
+            return
+
+        last_node, update, update_pos = self._search(len(self)) #~ Last node of every level
+
+        while self._height < other._height:
+            update.append(self._sentinel)
+            update_pos.append(-1)
+            self._height += 1
+
+        for level in range(self._height):
+            if level < other._height: #~ Target is at `len(self) + widths - 1` after the splice
+                update[level].skips[level] = other._sentinel.skips[level]
+                update[level].widths[level] = len(self) + other._sentinel.widths[level] - 1 - update_pos[level]
+            else:
+                update[level].widths[level] = len(self) + len(other) - update_pos[level]
+
+        if last_node is self._sentinel: #~ If no elements
+            self.head = other.head
+        else:
+            last_node.next = other.head
+            other.head.prev = last_node
+
+        self.tail = other.tail
+        self._len += len(other)
+        self._mods += 1
+
+        other.clear()
+
+    def split_at(self, pos_idx:int) -> 'IndexedDoubleLinkedList': #~ -> O(log n)
+        """Cuts the `IndexedDoubleLinkedList` before `pos_idx` & returns a new list holding the cut off suffix.
+
+        Follows slicing semantics - negative `pos_idx` counts from the end & out of bounds indices are clamped.
+
+        Args:
+            pos_idx (int): Index of the first element moved to the returned list.
+        """
+
+        if pos_idx < 0:
+            pos_idx = max(pos_idx + len(self), 0)
+
+        suffix = type(self)()
+
+        if pos_idx >= len(self): #~ If nothing to cut off
+            return suffix
+
+        last_node, update, update_pos = self._search(pos_idx)
+        suffix._height = self._height
+
+        for level in range(self._height): #~ Links crossing the cut start from the suffix sentinel
+            suffix._sentinel.skips[level] = update[level].skips[level]
+            suffix._sentinel.widths[level] = update_pos[level] + update[level].widths[level] - pos_idx + 1
+            update[level].skips[level] = None
+            update[level].widths[level] = pos_idx - update_pos[level]
+
+        suffix.tail, suffix._len = self.tail, len(self) - pos_idx
+
+        if last_node is self._sentinel: #~ If everything is cut off
+            suffix.head = self.head
+            self.head = self.tail = None
+        else:
+            suffix.head = last_node.next
+            suffix.head.prev = None
+            last_node.next = None
+            self.tail = last_node
+
+        self._len = pos_idx
+        self._mods += 1
+
+        return suffix
+
+    def sort(self, *, key:Optional[Callable]=None, reverse:bool=False): #~ -> O(n log n)
+        """Sorts the `IndexedDoubleLinkedList` in place with stable merge sort, then re-threads the index in O(n).
+
+        Args:
+            key (Optional[Callable]): Computes comparison key out of a value, values themselves if `None`.
+            reverse (bool): Sorts in descending order.
+        """
+
+        super().sort(key=key, reverse=reverse)
+
+        update = [self._sentinel] * self._height #~ Last node of every level so far
+        update_pos = [-1] * self._height
+        pos_idx, current_node = 0, self.head
+
+        while current_node is not None: #~ Nodes keep their tower heights, only links & widths change
+            for level in range(len(current_node.skips)):
+                update[level].skips[level] = current_node
+                update[level].widths[level] = pos_idx - update_pos[level]
+                update[level] = current_node
+                update_pos[level] = pos_idx
+            pos_idx, current_node = pos_idx + 1, current_node.next
+
+        for level in range(self._height): #~ Last links on every level jump to the end
+            update[level].skips[level] = None
+            update[level].widths[level] = pos_idx - update_pos[level]
+
+    def clear(self): #~ -> O(1)
+        """Removes all elements from the `IndexedDoubleLinkedList`.
+        """
+
+        super().clear()
+        self._sentinel = IndexedNode(None, MAX_LEVEL)
+        self._height = 0
+
+    def _node_at(self, pos_idx:int) -> IndexedNode: #~ -> O(log n)
+        """Returns `IndexedNode` at `pos_idx` (assumed to be in bounds) using the express links.
+        """
+
+        node, _, _ = self._search(pos_idx + 1)
+        return node
+
+    def _position_of(self, node:IndexedNode) -> int: #! -> O(n)
+        """Counts nodes before `node` on level 0.
+
+        Raises:
+            ValueError: If the walk ends at *head* of another list.
+        """
+
+        pos_idx, first_node = 0, node
+        while first_node.prev is not None:
+            first_node = first_node.prev
+            pos_idx += 1
+        if first_node is not self.head: #~ The walk happens anyway, so foreign handles are caught in full
+            raise ValueError(f"{node!r} is not linked to the IndexedDoubleLinkedList")
+        return pos_idx
+
+    def _search(self, pos_idx:int) -> tuple[IndexedNode, list[IndexedNode], list[int]]:
+        """Finds the last node before `pos_idx` on every level.
+
+        Returns:
+            tuple: Level 0 predecessor of `pos_idx` (the sentinel for `pos_idx == 0`), then predecessors on upper
+                levels together with their positions.
+        """
+
+        node, node_pos = self._sentinel, -1
+        update = [self._sentinel] * self._height
+        update_pos = [-1] * self._height
+
+        for level in reversed(range(self._height)):
+            while node.skips[level] is not None and node_pos + node.widths[level] < pos_idx:
+                node_pos += node.widths[level]
+                node = node.skips[level]
+            update[level] = node
+            update_pos[level] = node_pos
+
+        while node_pos + 1 < pos_idx: #~ Expected O(1) steps left on level 0
+            node = self.head if node is self._sentinel else node.next
+            node_pos += 1
+
+        return node, update, update_pos
+
+    def _random_height(self) -> int:
+        """Draws tower height from geometric distribution with p=1/2.
+        """
+
+        bits = self._random.getrandbits(MAX_LEVEL - 1)
+        return (bits & -bits).bit_length() - 1 if bits else MAX_LEVEL - 1
+
+    def _insert_at(self, pos_idx:int, value:Any) -> IndexedNode:
+        """Creates new `IndexedNode` with random tower height & links it at `pos_idx`.
+        """
+
+        return self._link_at(pos_idx, IndexedNode(value, self._random_height()))
+
+    def _link_at(self, pos_idx:int, new_node:IndexedNode) -> IndexedNode:
+        """Links detached `new_node` at `pos_idx` (assumed to be within `0..len`) on every level.
+        """
+
+        self._raise_height(len(new_node.skips))
+        return self._link_after(new_node, pos_idx, *self._search(pos_idx))
+
+    def _raise_height(self, height:int):
+        """Adds levels up to `height`, each starting with a single link from sentinel to just past the end.
+
+        Called before searching for the position of a new node, so the search already sees its levels.
+        """
+
+        while self._height < height:
+            self._sentinel.skips[self._height] = None
+            self._sentinel.widths[self._height] = len(self) + 1
+            self._height += 1
+
+    def _link_after(
+        self,
+        new_node:IndexedNode,
+        pos_idx:int,
+        prev_node:IndexedNode,
+        update:list[IndexedNode],
+        update_pos:list[int],
+    ) -> IndexedNode:
+        """Links detached `new_node` at `pos_idx` after `prev_node`, `update` & `update_pos` being as returned by `_search`.
+        """
+
+        height = len(new_node.skips)
+
+        for level in range(self._height):
+            if level < height:
+                new_node.skips[level] = update[level].skips[level]
+                new_node.widths[level] = update_pos[level] + update[level].widths[level] + 1 - pos_idx
+                update[level].skips[level] = new_node
+                update[level].widths[level] = pos_idx - update_pos[level]
+            else:
+                update[level].widths[level] += 1
+
+        if prev_node is self._sentinel: #~ If new node becomes head
+            new_node.next = self.head
+            self.head = new_node
+        else:
+            new_node.prev = prev_node
+            new_node.next = prev_node.next
+            prev_node.next = new_node
+
+        if new_node.next is None: #~ If new node becomes tail
+            self.tail = new_node
+        else:
+            new_node.next.prev = new_node
+
+        self._len += 1
+        self._mods += 1
+
+        return new_node
+
+    def _delete_at(self, pos_idx:int):
+        """Unlinks `IndexedNode` at `pos_idx` (assumed to be in bounds) & returns its value.
+        """
+
+        return self._unlink_at(pos_idx).value
+
+    def _unlink_at(self, pos_idx:int) -> IndexedNode:
+        """Unlinks `IndexedNode` at `pos_idx` (assumed to be in bounds) from every level & returns it.
+        """
+
+        prev_node, update, _ = self._search(pos_idx)
+        return self._unlink_node(self.head if prev_node is self._sentinel else prev_node.next, update)
+
+    def _unlink_node(self, node:IndexedNode, update:list[IndexedNode]) -> IndexedNode:
+        """Unlinks `node` from every level, `update` being its predecessors as returned by `_search`, & returns it.
+        """
+
+        for level in range(self._height):
+            if update[level].skips[level] is node:
+                update[level].widths[level] += node.widths[level] - 1
+                update[level].skips[level] = node.skips[level]
+            else:
+                update[level].widths[level] -= 1
+
+        if node.prev is None: #~ If node is head
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+
+        if node.next is None: #~ If node is tail
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+        node.prev = node.next = None
+        self._len -= 1
+        self._mods += 1
+
+        return node
@@ -0,0 +1,255 @@
+import sys
+import time
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Hashable, Optional
+
+from algorithms.data_structures.double_linked_list import DoubleLinkedList, Node
+
+
+_MISSING = object()
+
+
+class CacheEntry:
+    """Represents values stored in `LRUCache`, kept as `Node` values of its recency list.
+    """
+
+    __slots__ = ('key', 'value', 'size', 'expires_at')
+
+    def __init__(self, key:Hashable, value:Any, size:int, expires_at:Optional[float]):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+    def __repr__(self):
+        return f"CacheEntry(key={self.key!r}, value={self.value!r})"
+
+
+@dataclass
+class CacheStats:
+    """Counters collected by `LRUCache`.
+    """
+
+    hits:int = 0
+    misses:int = 0
+    evictions:int = 0 #~ Entries dropped to respect `max_entries`/`max_bytes`
+    expirations:int = 0 #~ Entries dropped because their TTL ran out
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache:
+    """This class constitutes implementation of **Least Recently Used** cache.
+
+    Entries live in a `DoubleLinkedList` ordered from least (*head*) to most (*tail*) recently used, and a dict
+    maps keys to their node handles, so lookups, updates & evictions are all O(1). Not thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_entries:Optional[int]=None,
+        max_bytes:Optional[int]=None,
+        ttl:Optional[float]=None,
+        sizeof:Callable[[Any], int]=sys.getsizeof,
+        clock:Callable[[], float]=time.monotonic,
+    ):
+        """
+        Args:
+            max_entries (Optional[int]): Maximum number of entries, unbounded if `None`.
+            max_bytes (Optional[int]): Maximum total size of values as measured by `sizeof`, unbounded if `None`.
+            ttl (Optional[float]): Default number of seconds entries stay valid, forever if `None`.
+            sizeof (Callable[[Any], int]): Measures size of a value in bytes.
+            clock (Callable[[], float]): Source of current time in seconds.
+        """
+
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries = DoubleLinkedList() #~ HEAD: least recently used, TAIL: most recently used
+        self._nodes:dict[Hashable, Node] = {} #~ Handles never leave the cache, so all of them belong to `_entries`
+        self._bytes = 0
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, key:Hashable) -> bool:
+        """Checks whether `key` holds a live entry, without touching its recency or the statistics.
+        """
+
+        node = self._nodes.get(key)
+        return node is not None and not self._expired(node.value, self.clock())
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key:Hashable, default:Any=None) -> Any: #~ -> O(1)
+        """Returns value stored under `key` & marks it as most recently used.
+
+        Args:
+            key (Hashable): Key to look up.
+            default (Any): Returned when `key` is missing or expired.
+        """
+
+        node = self._nodes.get(key)
+
+        if node is None:
+            self.stats.misses += 1
+            return default
+
+        if self._expired(node.value, self.clock()):
+            self._remove(node)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return default
+
+        self._entries.move_to_back(node)
+        self.stats.hits += 1
+        return node.value.value
+
+    def put(self, key:Hashable, value:Any, ttl:Optional[float]=None): #~ -> O(1) + evictions
+        """Stores `value` under `key` as most recently used entry, evicting least recently used ones if needed.
+
+        Values larger than `max_bytes` on their own are not stored at all.
+
+        Args:
+            key (Hashable): Key to store value under.
+            value (Any): Value to be stored.
+            ttl (Optional[float]): Seconds this entry stays valid, defaults to cache-wide `ttl`.
+        """
+
+        ttl = self.ttl if ttl is None else ttl
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        expires_at = None if ttl is None else self.clock() + ttl
+
+        node = self._nodes.get(key)
+        if node is not None: #~ Replacing, old value no longer counts
+            self._remove(node)
+
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        self._nodes[key] = self._entries.append(CacheEntry(key, value, size, expires_at))
+        self._bytes += size
+
+        while (self.max_entries is not None and len(self._nodes) > self.max_entries) or \
+              (self.max_bytes is not None and self._bytes > self.max_bytes):
+            self._remove(self._entries.head)
+            self.stats.evictions += 1
+
+    def pop(self, key:Hashable, default:Any=_MISSING) -> Any: #~ -> O(1)
+        """Removes entry stored under `key` & returns its value.
+
+        Raises:
+            KeyError: If `key` is missing (or expired) & no `default` was given.
+        """
+
+        node = self._nodes.get(key)
+
+        if node is None or self._expired(node.value, self.clock()):
+            if node is not None:
+                self._remove(node)
+                self.stats.expirations += 1
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+
+        self._remove(node)
+        return node.value.value
+
+    def __getitem__(self, key:Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key:Hashable, value:Any):
+        self.put(key, value)
+
+    def __delitem__(self, key:Hashable):
+        self.pop(key)
+
+    def purge_expired(self) -> int: #! -> O(n)
+        """Removes all expired entries & returns how many were removed.
+        """
+
+        now = self.clock()
+        expired = [node for node in self._nodes.values() if self._expired(node.value, now)]
+
+        for node in expired:
+            self._remove(node)
+
+        self.stats.expirations += len(expired)
+        return len(expired)
+
+    def clear(self):
+        """Removes all entries. Statistics are kept.
+        """
+
+        self._entries.clear()
+        self._nodes.clear()
+        self._bytes = 0
+
+    def _expired(self, entry:CacheEntry, now:float) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= now
+
+    def _remove(self, node:Node):
+        entry = self._entries.remove_node(node)
+        del self._nodes[entry.key]
+        self._bytes -= entry.size
+
+
+def _make_key(args:tuple, kwargs:dict) -> Hashable:
+    """Builds cache key out of call arguments, keyword arguments order does not matter.
+    """
+
+    if not kwargs:
+        return args
+    return args + (_MISSING,) + tuple(sorted(kwargs.items())) #~ Marker separates positional from keyword arguments
+
+
+def memoize(
+    max_entries:Optional[int]=128,
+    max_bytes:Optional[int]=None,
+    ttl:Optional[float]=None,
+    sizeof:Callable[[Any], int]=sys.getsizeof,
+):
+    """Caches results of decorated function in an `LRUCache`, exposed as its `cache` attribute.
+
+    Arguments of the decorated function must be hashable.
+
+    Args:
+        max_entries (Optional[int]): Maximum number of cached results, unbounded if `None`.
+        max_bytes (Optional[int]): Maximum total size of cached results, unbounded if `None`.
+        ttl (Optional[float]): Number of seconds results stay valid, forever if `None`.
+        sizeof (Callable[[Any], int]): Measures size of a result in bytes.
+    """
+
+    def decorator(function:Callable) -> Callable:
+        cache = LRUCache(max_entries=max_entries, max_bytes=max_bytes, ttl=ttl, sizeof=sizeof)
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = function(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,47 @@
+import struct
+import sys
+from array import array
+from typing import Iterable
+
+
+MAGIC = b'LLV1'
+HEADER = struct.Struct('<4sccB') #~ Magic, `array` typecode, byte order (`<`/`>`), item size
+
+
+def pack_values(values:Iterable, typecode:str='d') -> bytes: #~ -> O(n)
+    """Packs numeric `values` into a compact binary blob - a small header followed by raw `array` items.
+
+    Args:
+        values (Iterable): Numbers representable with `typecode`.
+        typecode (str): `array` typecode of items, e.g. `'d'` (float64), `'q'` (int64) or `'B'` (uint8).
+
+    Raises:
+        OverflowError, TypeError: If some value does not fit `typecode`.
+    """
+
+    items = array(typecode, values)
+    byteorder = b'<' if sys.byteorder == 'little' else b'>'
+    return HEADER.pack(MAGIC, typecode.encode(), byteorder, items.itemsize) + items.tobytes()
+
+
+def unpack_values(data:bytes) -> array: #~ -> O(n)
+    """Unpacks a blob made by `pack_values` into an `array`, fixing byte order if it was packed on another platform.
+
+    Raises:
+        ValueError: If `data` is not a blob of `pack_values` or its items have a different size on this platform.
+    """
+
+    magic, typecode, byteorder, itemsize = HEADER.unpack_from(data)
+
+    if magic != MAGIC:
+        raise ValueError("data was not made by pack_values")
+
+    items = array(typecode.decode())
+    if items.itemsize != itemsize:
+        raise ValueError(f"typecode {typecode.decode()!r} has {items.itemsize} byte items here, data has {itemsize}")
+
+    items.frombytes(memoryview(data)[HEADER.size:])
+    if byteorder != (b'<' if sys.byteorder == 'little' else b'>'):
+        items.byteswap()
+
+    return items
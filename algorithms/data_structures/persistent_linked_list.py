@@ -0,0 +1,157 @@
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Union
+
+from algorithms.data_structures.slot_arena import NIL, NEXT, PREV, SlotArena, arena_size
+
+
+FSYNC_POLICIES = ('always', 'batched', 'never')
+
+RECORD = struct.Struct('<Q6q6q') #~ Sequence number, header state, two `(slot, field, index)` link writes
+CRC = struct.Struct('<I')
+RECORD_OFFSETS = (32, 32 + RECORD.size + CRC.size) #~ Two copies, written alternately
+NO_LINK = (NIL, 0, 0)
+
+
+class PersistentLinkedList(SlotArena):
+    """This class constitutes implementation of **Double Linked List** persisted in a memory-mapped file.
+
+    The file holds a `SlotArena` whose header state is double-buffered: every operation writes a new header
+    record (sequence number, state, checksum) over the older of two copies, so a torn write leaves the
+    previous record intact. A record also carries the link writes of its operation (at most two), which are
+    applied only after the record is written & are replayed when the file is opened - an interrupted
+    `delete` in the middle of the list cannot leave neighbours pointing past each other.
+
+    Opening an existing file only reads the header, no matter how many elements it holds. The arena
+    doubles in size whenever it runs out of slots.
+
+    Durability depends on `fsync`:
+
+    - `'always'` - data is synced before & after every header record, so completed operations survive
+      power loss. Two `msync` calls per operation.
+    - `'batched'` - synced every `batch_size` operations & on `flush`/`close`.
+    - `'never'` - left to the OS.
+
+    With any policy, a crashing *process* leaves a consistent file, as the page cache keeps its writes.
+    Not safe for concurrent use by several processes.
+    """
+
+    def __init__(
+        self,
+        path:Union[str, Path],
+        fmt:str='q',
+        capacity:int=1024,
+        fsync:str='batched',
+        batch_size:int=1024,
+    ):
+        """
+        Args:
+            path (Union[str, Path]): File to open, created (formatted with `fmt` & `capacity`) if missing or empty.
+            fmt (str): `struct` format of payloads of a new file. Existing files keep their own format.
+            capacity (int): Initial number of slots of a new file.
+            fsync (str): One of `'always'`, `'batched'` or `'never'`.
+            batch_size (int): Number of operations between syncs with `'batched'` policy.
+        """
+
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {fsync!r}")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.path = Path(path)
+        self.fsync = fsync
+        self.batch_size = batch_size
+        self._unsynced = 0 #~ Operations since the last sync
+        self._seq = 0
+
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            new_file = os.fstat(self._fd).st_size == 0
+            if new_file:
+                os.ftruncate(self._fd, arena_size(fmt, capacity))
+            self._mmap = mmap.mmap(self._fd, 0)
+            super().__init__(self._mmap, fmt if new_file else None, capacity)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def flush(self):
+        """Syncs all changes to disk.
+        """
+
+        self._mmap.flush()
+        self._unsynced = 0
+
+    def close(self):
+        """Syncs (unless `fsync='never'`) & closes the file. The instance is unusable afterwards.
+        """
+
+        if self.fsync != 'never':
+            self.flush()
+        self._buffer = None
+        self._mmap.close()
+        os.close(self._fd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _load(self):
+        """Picks the valid header record with the highest sequence number & finishes its operation.
+        """
+
+        records = []
+        for offset in RECORD_OFFSETS:
+            raw = self._buffer[offset:offset + RECORD.size]
+            (crc,) = CRC.unpack_from(self._buffer, offset + RECORD.size)
+            if zlib.crc32(raw) == crc:
+                records.append(RECORD.unpack(raw))
+
+        if not records:
+            raise ValueError(f"{self.path} has no valid header record")
+
+        seq, *fields = max(records)
+        self._seq = seq
+        self.capacity, self._len, self._head, self._tail, self._free, self._high = fields[:6]
+
+        self._apply([tuple(fields[6:9]), tuple(fields[9:12])]) #~ Redo link writes, they may not have happened
+        self._apply([(self._head, PREV, NIL), (self._tail, NEXT, NIL)]) #~ Ends may still point at slots of a lost operation
+
+    def _commit(self, links:list[tuple[int, int, int]]):
+        """Writes a new header record carrying `links`, syncing around it as `fsync` policy says, then applies `links`.
+        """
+
+        if self.fsync == 'always': #~ Slots referenced by the record must hit the disk first
+            self._mmap.flush()
+
+        self._seq += 1
+        intent = (links + [NO_LINK, NO_LINK])[:2]
+        raw = RECORD.pack(
+            self._seq, self.capacity, self._len, self._head, self._tail, self._free, self._high, *intent[0], *intent[1]
+        )
+        offset = RECORD_OFFSETS[self._seq % 2]
+        self._buffer[offset:offset + RECORD.size + CRC.size] = raw + CRC.pack(zlib.crc32(raw))
+
+        if self.fsync == 'always':
+            self._mmap.flush()
+        elif self.fsync == 'batched':
+            self._unsynced += 1
+            if self._unsynced >= self.batch_size:
+                self.flush()
+
+        self._apply(links)
+
+    def _apply(self, links:list[tuple[int, int, int]]):
+        super()._apply([link for link in links if link[0] != NIL])
+
+    def _grow(self):
+        """Doubles the file. New capacity is recorded by the header record of the ongoing operation.
+        """
+
+        self._mmap.resize(arena_size(self.fmt, 2 * self.capacity))
+        self.capacity *= 2
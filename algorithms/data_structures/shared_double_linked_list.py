@@ -0,0 +1,106 @@
+import multiprocessing
+import sys
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+from algorithms.data_structures.slot_arena import SlotArena, arena_size
+
+
+class _LoadedLock:
+    """Context acquiring the lock of a `SharedDoubleLinkedList` & reloading its header state.
+
+    Cheaper than a `contextmanager` generator, which matters as every single operation enters it.
+    """
+
+    __slots__ = ('_lock', '_load')
+
+    def __init__(self, lock, load):
+        self._lock = lock
+        self._load = load
+
+    def __enter__(self):
+        self._lock.acquire()
+        try:
+            self._load()
+        except BaseException:
+            self._lock.release()
+            raise
+
+    def __exit__(self, *exc_info):
+        self._lock.release()
+
+
+class SharedDoubleLinkedList(SlotArena):
+    """This class constitutes implementation of **Double Linked List** living in `multiprocessing.shared_memory`.
+
+    Nodes are fixed-size slots of a `SlotArena` holding payloads of `struct` format `fmt` (numbers or
+    fixed-width bytes), so processes append & pop without pickling anything. Every operation runs under
+    a `multiprocessing.Lock` & re-reads the header, as other processes may have changed it meanwhile.
+
+    Instances are handed to child processes by passing them as `Process` arguments (or through a pool
+    `initializer`) - they are pickled as shared memory name & lock, and attach to the same arena.
+    The creating process should `unlink` the memory once all processes `close`d it.
+    """
+
+    def __init__(self, capacity:int, fmt:str='q', lock=None, *, _name:Optional[str]=None):
+        """
+        Args:
+            capacity (int): Maximum number of elements. Shared memory cannot grow once other processes attach.
+            fmt (str): `struct` format of payloads, e.g. `'q'`, `'d'` or `'64s'` (bytes are NUL-padded).
+            lock: `multiprocessing.Lock` guarding the arena, a new one if `None`.
+        """
+
+        self._lock = lock if lock is not None else multiprocessing.Lock()
+        self._guard = _LoadedLock(self._lock, self._load)
+
+        if _name is None: #~ Creates a new arena
+            self._shm = SharedMemory(create=True, size=arena_size(fmt, capacity))
+            super().__init__(self._shm.buf, fmt, capacity)
+        else:
+            track = {'track': False} if sys.version_info >= (3, 13) else {} #~ Only the creator may unlink
+            self._shm = SharedMemory(name=_name, **track)
+            super().__init__(self._shm.buf)
+
+    @classmethod
+    def attach(cls, name:str, lock) -> 'SharedDoubleLinkedList':
+        """Attaches to an existing arena by name of its shared memory.
+
+        Args:
+            name (str): `name` of the `SharedDoubleLinkedList` to attach to.
+            lock: The lock that `SharedDoubleLinkedList` was created with.
+        """
+
+        return cls(0, lock=lock, _name=name)
+
+    def __reduce__(self):
+        return type(self).attach, (self.name, self._lock)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def __len__(self):
+        with self._locked():
+            return self._len
+
+    def close(self):
+        """Detaches this process from the shared memory. The instance is unusable afterwards.
+        """
+
+        self._buffer = None
+        self._shm.close()
+
+    def unlink(self):
+        """Frees the shared memory once every process closed it. Call once, from the creating process.
+        """
+
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _locked(self):
+        return self._guard
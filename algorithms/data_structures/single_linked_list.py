@@ -1,5 +1,15 @@
+from collections import deque
+
+from algorithms.data_structures.gc_utils import gc_paused
+from algorithms.data_structures.packed_values import pack_values, unpack_values
+from algorithms.data_structures.value_index import ValueIndex
+from algorithms.sort.linked_list_merge_sort import merge_sort_nodes
+
+
 class Node:
     
+    __slots__ = ('value', 'next') #~ No per-instance `__dict__`
+    
     def __init__(self, value):
         self.value = value
         self.next = None
@@ -11,9 +21,80 @@ class Node:
 
 class SingleLinkedList:
 
-    def __init__(self):
+    def __init__(self, predecessor_index=False, value_index=False):
         self.head = None
         self.tail = None
+        self._len = 0
+        self._mods = 0 # Bumped by every structural change, iterators use it to detect mutation
+        # With predecessor_index=True the nodes are also kept (in order) in a deque,
+        # so the predecessor of the tail is always self._spine[-2] - pop_tail becomes O(1)
+        # Indexing the deque elsewhere is still O(n) - it walks its blocks from the nearer end
+        self._spine = deque() if predecessor_index else None
+        # With value_index=True the nodes are also kept in a ValueIndex by their values,
+        # so in, index_of & remove_value look values up by hash instead of scanning
+        self._index = ValueIndex() if value_index else None
+    
+    @classmethod
+    def from_iterable(cls, iterable, predecessor_index=False, value_index=False): #~ -> O(n)
+        ll = cls(predecessor_index=predecessor_index, value_index=value_index)
+        ll.extend(iterable)
+        return ll
+    
+    @classmethod
+    def from_bytes(cls, data, predecessor_index=False, value_index=False): #~ -> O(n)
+        # Rebuilds a list out of numbers packed by to_bytes
+        return cls.from_iterable(unpack_values(data), predecessor_index=predecessor_index, value_index=value_index)
+    
+    def __reduce__(self): #~ -> O(n)
+        # Pickles as a flat sequence of values - pickling the chain of nodes would recurse once per node
+        return type(self), (self._spine is not None, self._index is not None), self.__getstate__()
+    
+    def __getstate__(self):
+        return self._values()
+    
+    def __setstate__(self, values):
+        self.extend(values) # Bulk linker, on a list freshly created by __reduce__
+    
+    def to_bytes(self, typecode='d'): #~ -> O(n)
+        # Packs numeric values into a compact binary blob (array typecode, e.g. 'd' or 'q')
+        return pack_values(self._values(), typecode)
+    
+    def __len__(self): #~ -> O(1)
+        return self._len
+    
+    def __iter__(self): #~ -> O(n)
+        mods = self._mods
+        track = self.head
+        while track is not None:
+            yield track.value
+            if self._mods != mods: # track may have been unlinked meanwhile
+                raise RuntimeError("SingleLinkedList mutated during iteration")
+            track = track.next
+    
+    def __contains__(self, value): #! -> O(n), O(1) with value_index
+        if self._index is not None:
+            return bool(self._index.lookup(value))
+        
+        track = self.head
+        while track is not None:
+            if track.value is value or track.value == value: # Identity first, like list
+                return True
+            track = track.next
+        return False
+    
+    def __getitem__(self, pos_idx): #! -> O(n), faster near the ends with predecessor_index
+        if pos_idx < 0: # Negative pos_idx counts from the end
+            pos_idx += self._len
+        if not (0 <= pos_idx < self._len):
+            raise IndexError("SingleLinkedList index out of range")
+        
+        if self._spine is not None:
+            return self._spine[pos_idx].value
+        
+        track = self.head
+        for _ in range(pos_idx):
+            track = track.next
+        return track.value
         
     def append(self, value): #~ -> O(1)
         new_node = Node(value)
@@ -23,6 +104,12 @@ class SingleLinkedList:
         else:
             self.tail.next = new_node
             self.tail = new_node
+        self._len += 1
+        self._mods += 1
+        if self._spine is not None:
+            self._spine.append(new_node)
+        if self._index is not None:
+            self._index.add(new_node)
     
     def prepend(self, value): #~ -> O(1)
         new_node = Node(value)
@@ -32,30 +119,153 @@ class SingleLinkedList:
         else:
             new_node.next = self.head
             self.head = new_node        
+        self._len += 1
+        self._mods += 1
+        if self._spine is not None:
+            self._spine.appendleft(new_node)
+        if self._index is not None:
+            self._index.add(new_node)
+    
+    def extend(self, iterable): #~ -> O(k)
+        # Links new nodes after the tail in a single pass, generators are consumed lazily
+        if iterable is self: # Extending with itself must not see the nodes being added
+            iterable = self._values()
+        
+        iterator = iter(iterable)
+        spine = self._spine
+        last_node = old_tail = self.tail
+        count = 0
+        
+        if not last_node: # If list is empty then first value becomes head
+            for value in iterator:
+                last_node = self.head = Node(value)
+                count = 1
+                if spine is not None:
+                    spine.append(last_node)
+                break
+            else:
+                return
+        
+        try:
+            with gc_paused(): # Automatic collections would re-traverse the growing chain
+                for value in iterator:
+                    new_node = Node(value)
+                    last_node.next = new_node
+                    last_node = new_node
+                    count += 1
+                    if spine is not None:
+                        spine.append(new_node)
+        finally: # Values linked before a failing iterator raised are kept
+            self.tail = last_node
+            self._len += count
+            self._mods += 1
+            if self._index is not None and count: # Indexed afterwards, keeping the linking loop tight
+                self._index.add_chain(self.head if old_tail is None else old_tail.next)
+    
+    def extendleft(self, iterable): #~ -> O(k)
+        # Like deque.extendleft - every value becomes the new head, so they end up in reverse order
+        if iterable is self: # Extending with itself must not see the nodes being added
+            iterable = self._values()
+        
+        iterator = iter(iterable)
+        spine = self._spine
+        first_node = old_head = self.head
+        count = 0
+        
+        if not first_node: # If list is empty then first value becomes tail
+            for value in iterator:
+                first_node = self.tail = Node(value)
+                count = 1
+                if spine is not None:
+                    spine.appendleft(first_node)
+                break
+            else:
+                return
+        
+        try:
+            with gc_paused(): # Automatic collections would re-traverse the growing chain
+                for value in iterator:
+                    new_node = Node(value)
+                    new_node.next = first_node
+                    first_node = new_node
+                    count += 1
+                    if spine is not None:
+                        spine.appendleft(new_node)
+        finally: # Values linked before a failing iterator raised are kept
+            self.head = first_node
+            self._len += count
+            self._mods += 1
+            if self._index is not None and count:
+                self._index.add_chain(self.head, old_head)
+    
+    def sort(self, *, key=None, reverse=False): #~ -> O(n log n), O(1) extra space
+        # Stable bottom-up merge sort relinking the nodes, same arguments as list.sort
+        self.head, self.tail = merge_sort_nodes(self.head, key, reverse)
+        self._mods += 1
+        if self._spine is not None: # Nodes changed positions
+            self._spine = deque(self._nodes())
+    
+    def _nodes(self): #~ -> O(n)
+        track = self.head
+        while track:
+            yield track
+            track = track.next
+    
+    def _values(self): #~ -> O(n)
+        # Plain loop, about a third faster than list(self)
+        values = []
+        append = values.append
+        track = self.head
+        while track:
+            append(track.value)
+            track = track.next
+        return values
     
     def pop_head(self): #~ -> O(1)
         if not self.head:
             return None
         
-        popped_value = self.head.value
+        popped_node = self.head
         self.head = self.head.next
+        self._len -= 1
+        self._mods += 1
         
         if not self.head:
             self.tail = None
         
-        return popped_value
+        if self._spine is not None:
+            self._spine.popleft()
+        
+        if self._index is not None:
+            self._index.discard(popped_node)
+        
+        return popped_node.value
         
     
-    def pop_tail(self): #! -> O(n)
+    def pop_tail(self): #! -> O(n), O(1) with predecessor_index
         if not self.head:
             return None
         
-        popped_value = self.tail.value
+        popped_node = self.tail
+        self._len -= 1
+        self._mods += 1
+        if self._index is not None:
+            self._index.discard(popped_node)
+        
+        if self._spine is not None: # Predecessor of the tail is known - no traversal needed
+            self._spine.pop()
+            if self._spine:
+                self.tail = self._spine[-1]
+                self.tail.next = None
+            else:
+                self.head = None
+                self.tail = None
+            return popped_node.value
 
         if self.head == self.tail:
             self.head = None
             self.tail = None
-            return popped_value
+            return popped_node.value
         
         track = self.head
         
@@ -65,7 +275,7 @@ class SingleLinkedList:
         track.next = None
         self.tail = track
         
-        return popped_value
+        return popped_node.value
         
     
     def delete(self, pos_idx): #! -> O(n)
@@ -74,6 +284,22 @@ class SingleLinkedList:
         
         if pos_idx == 0: # If pos_idx is 0 then use O(1) pop_head() function
             return self.pop_head() 
+        
+        if self._spine is not None: # Deque walks its blocks to the predecessor - O(n), faster near the ends
+            if pos_idx >= len(self._spine):
+                return None
+            pre_track = self._spine[pos_idx - 1]
+            track = pre_track.next
+            del self._spine[pos_idx]
+            pre_track.next = track.next
+            track.next = None
+            self._len -= 1
+            self._mods += 1
+            if track == self.tail:
+                self.tail = pre_track
+            if self._index is not None:
+                self._index.discard(track)
+            return track.value
     
         track = self.head # Tracks current element - last one will be to delete
         pre_track = None # Looks at previous element
@@ -92,4 +318,76 @@ class SingleLinkedList:
             pre_track.next = track.next
             track.next = None
         
-        return track.value
\ No newline at end of file
+        self._len -= 1
+        self._mods += 1
+        
+        if self._index is not None:
+            self._index.discard(track)
+        
+        return track.value
+    
+    def index_of(self, value): #! -> O(n), O(1) with value_index if value is missing
+        # Returns index of the first element equal to value, like list.index
+        pos_idx, node = self._find(value)
+        if node is None:
+            raise ValueError(f"{value!r} is not in the SingleLinkedList")
+        
+        return self._position_of(node) if pos_idx is None else pos_idx
+    
+    def remove_value(self, value): #! -> O(n), O(1) with value_index alone unless value repeats or is at the tail
+        # Deletes the first element equal to value, like list.remove
+        pos_idx, node = self._find(value)
+        if node is None:
+            raise ValueError(f"{value!r} is not in the SingleLinkedList")
+        
+        if self._spine is not None: # Unlinked by position, the spine entry is deleted without searching the deque
+            self.delete(self._position_of(node) if pos_idx is None else pos_idx)
+            return
+        if node is self.head:
+            self.pop_head()
+            return
+        if node is self.tail: # Needs the predecessor - O(n)
+            self.pop_tail()
+            return
+        
+        # No predecessor at hand - the successor's value moves into node & the successor gets unlinked instead
+        successor = node.next
+        if self._index is not None:
+            self._index.discard(node)
+            self._index.discard(successor)
+        node.value, node.next = successor.value, successor.next
+        successor.next = None
+        if successor is self.tail:
+            self.tail = node
+        if self._index is not None:
+            self._index.add(node)
+        self._len -= 1
+        self._mods += 1
+    
+    def _find(self, value): #! -> O(n), O(1) with value_index unless value repeats
+        # Returns the first node holding a value equal to value (None if there is none) with its index,
+        # the index is None if the node was looked up without walking from head
+        if self._index is None:
+            pos_idx, track = 0, self.head
+            while track is not None and not (track.value is value or track.value == value):
+                track = track.next
+                pos_idx += 1
+            return pos_idx, track
+        
+        nodes = self._index.lookup(value)
+        if len(nodes) <= 1:
+            return None, next(iter(nodes), None)
+        
+        pos_idx, track = 0, self.head # Index knows no order, the first of equal values is found walking from head
+        while track not in nodes:
+            track = track.next
+            pos_idx += 1
+        return pos_idx, track
+    
+    def _position_of(self, node): #! -> O(n)
+        # Counts nodes before node
+        pos_idx, track = 0, self.head
+        while track is not node:
+            track = track.next
+            pos_idx += 1
+        return pos_idx
\ No newline at end of file
@@ -0,0 +1,269 @@
+import struct
+from contextlib import nullcontext
+from typing import Any, Optional
+
+
+NIL = -1 #~ Index of no slot
+PREV, NEXT, FREE_NEXT, PAYLOAD = 0, 8, 16, 24 #~ Byte offsets of fields within a slot
+SLOTS_OFFSET = 256 #~ Bytes reserved for the header, slot 0 starts here
+
+MAGIC = b'SLOTARN1'
+PREFIX = struct.Struct('<8s16s') #~ Magic, payload format - written once when the arena is created
+STATE = struct.Struct('<qqqqqq') #~ Capacity, length, head, tail, free head, high water
+LINK = struct.Struct('<q')
+LINKS = struct.Struct('<qq') #~ Prev, next
+
+
+class SlotArena:
+    """This class constitutes implementation of **Double Linked List** over a flat buffer of fixed-size slots.
+
+    Every slot holds `prev`/`next` indices, a `free_next` index & a payload packed with `struct` format `fmt`.
+    Freed slots are kept in a free list threaded through `free_next` (a separate field, so linking a slot
+    never corrupts the free list), while slots never used yet are handed out from a high water mark, so
+    creating a large arena does not have to touch every slot.
+
+    Subclasses provide the buffer & decide how header state is shared (`_locked`, `_load`) and made
+    visible (`_commit`). Structural changes of already linked slots are not written directly - every
+    operation passes them to `_commit` as `(slot, field, index)` link writes, to be applied after the header.
+    """
+
+    def __init__(self, buffer:memoryview, fmt:Optional[str]=None, capacity:int=0):
+        """
+        Args:
+            buffer (memoryview): Writable buffer of at least `SLOTS_OFFSET + capacity * slot_size` bytes.
+            fmt (Optional[str]): `struct` format of payloads (e.g. `'q'`, `'d'`, `'32s'`) for a new arena,
+                `None` to use the arena already formatted in `buffer`.
+            capacity (int): Number of slots of a new arena.
+        """
+
+        self._buffer = buffer
+        new_arena = fmt is not None
+
+        if new_arena:
+            if len(fmt.encode()) > PREFIX.size - len(MAGIC):
+                raise ValueError(f"fmt {fmt!r} is too long")
+            PREFIX.pack_into(buffer, 0, MAGIC, fmt.encode())
+            self.capacity, self._len, self._head, self._tail, self._free, self._high = capacity, 0, NIL, NIL, NIL, 0
+        else:
+            magic, raw_fmt = PREFIX.unpack_from(buffer, 0)
+            if magic != MAGIC:
+                raise ValueError("buffer does not hold a SlotArena")
+            fmt = raw_fmt.rstrip(b'\0').decode()
+
+        self.fmt = fmt
+        self._payload = struct.Struct('<' + fmt)
+        self._slot = struct.Struct('<qqq' + fmt)
+        self._single = len(self._payload.unpack(bytes(self._payload.size))) == 1 #~ Payload is a scalar, not a tuple
+
+        if new_arena:
+            self._commit([])
+        else:
+            self._load()
+
+    @property
+    def slot_size(self) -> int:
+        return self._slot.size
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self): #~ -> O(n)
+        """Iterates over a snapshot of values from *head* to *tail*, taken at once.
+        """
+
+        with self._locked():
+            return iter(self._values())
+
+    def append(self, value:Any): #~ -> O(1)
+        """Stores `value` in a free slot & links it as a new *tail*.
+
+        Args:
+            value (Any): Payload matching `fmt` - a tuple if `fmt` has several fields.
+        """
+
+        payload = self._encode(value) #~ Bad values are rejected before anything is allocated
+
+        with self._locked():
+            slot = self._allocate()
+            self._write_slot(slot, self._tail, NIL, payload)
+            links = [(self._tail, NEXT, slot)] if self._tail != NIL else []
+
+            if self._head == NIL: #~ If no elements
+                self._head = slot
+            self._tail = slot
+            self._len += 1
+
+            self._commit(links)
+
+    def prepend(self, value:Any): #~ -> O(1)
+        """Stores `value` in a free slot & links it as a new *head*.
+
+        Args:
+            value (Any): Payload matching `fmt` - a tuple if `fmt` has several fields.
+        """
+
+        payload = self._encode(value)
+
+        with self._locked():
+            slot = self._allocate()
+            self._write_slot(slot, NIL, self._head, payload)
+            links = [(self._head, PREV, slot)] if self._head != NIL else []
+
+            if self._tail == NIL: #~ If no elements
+                self._tail = slot
+            self._head = slot
+            self._len += 1
+
+            self._commit(links)
+
+    def pop_head(self): #~ -> O(1)
+        """Deletes and returns *head* value, or `None` if empty.
+        """
+
+        with self._locked():
+            if self._head == NIL: #~ If no elements
+                return None
+            return self._remove(self._head)
+
+    def pop_tail(self): #~ -> O(1)
+        """Deletes and returns *tail* value, or `None` if empty.
+        """
+
+        with self._locked():
+            if self._tail == NIL: #~ If no elements
+                return None
+            return self._remove(self._tail)
+
+    def delete(self, pos_idx:int): #! -> O(n)
+        """Deletes and returns value at `pos_idx`, or `None` if `pos_idx` is out of bounds.
+
+        Args:
+            pos_idx (int): Index of the element to delete.
+        """
+
+        with self._locked():
+            if not (0 <= pos_idx < self._len): #~ If pos_idx out of bounds (or no elements)
+                return None
+            return self._remove(self._slot_at(pos_idx))
+
+    def _locked(self):
+        """Context holding exclusive access to the arena, with header state loaded.
+        """
+
+        return nullcontext()
+
+    def _load(self):
+        """Reads header state into `capacity`, `_len`, `_head`, `_tail`, `_free` & `_high`.
+        """
+
+        self.capacity, self._len, self._head, self._tail, self._free, self._high = STATE.unpack_from(
+            self._buffer, PREFIX.size
+        )
+
+    def _commit(self, links:list[tuple[int, int, int]]):
+        """Publishes header state, then applies `links` - `(slot, field, index)` writes to already linked slots.
+        """
+
+        STATE.pack_into(
+            self._buffer, PREFIX.size, self.capacity, self._len, self._head, self._tail, self._free, self._high
+        )
+        self._apply(links)
+
+    def _grow(self):
+        """Makes room for more slots when every slot is taken.
+        """
+
+        raise MemoryError(f"{type(self).__name__} is full ({self.capacity} slots)")
+
+    def _apply(self, links:list[tuple[int, int, int]]):
+        for slot, field, index in links:
+            LINK.pack_into(self._buffer, self._offset(slot) + field, index)
+
+    def _allocate(self) -> int:
+        """Takes a slot off the free list, or the first never used one. Header state is not committed yet.
+        """
+
+        if self._free != NIL:
+            slot = self._free
+            self._free = self._link(slot, FREE_NEXT)
+            return slot
+
+        if self._high >= self.capacity:
+            self._grow()
+
+        self._high += 1
+        return self._high - 1
+
+    def _remove(self, slot:int):
+        """Unlinks `slot`, puts it on the free list, commits & returns its value.
+        """
+
+        value = self._read_value(slot)
+        prev_slot, next_slot = self._link(slot, PREV), self._link(slot, NEXT)
+        LINK.pack_into(self._buffer, self._offset(slot) + FREE_NEXT, self._free) #~ Slot is still linked, field unused
+        links = []
+
+        if prev_slot == NIL: #~ If slot is head
+            self._head = next_slot
+        else:
+            links.append((prev_slot, NEXT, next_slot))
+
+        if next_slot == NIL: #~ If slot is tail
+            self._tail = prev_slot
+        else:
+            links.append((next_slot, PREV, prev_slot))
+
+        self._free = slot
+        self._len -= 1
+        self._commit(links)
+
+        return value
+
+    def _slot_at(self, pos_idx:int) -> int: #! -> O(n)
+        """Returns slot at `pos_idx` (assumed to be in bounds), walking from the closer end.
+        """
+
+        if pos_idx < self._len // 2: #~ If pos_idx is closer to head
+            slot = self._head
+            for _ in range(pos_idx):
+                slot = self._link(slot, NEXT)
+        else:
+            slot = self._tail
+            for _ in range(self._len - 1 - pos_idx):
+                slot = self._link(slot, PREV)
+
+        return slot
+
+    def _values(self) -> list: #~ -> O(n)
+        values, slot = [], self._head
+
+        for _ in range(self._len):
+            values.append(self._read_value(slot))
+            slot = self._link(slot, NEXT)
+
+        return values
+
+    def _offset(self, slot:int) -> int:
+        return SLOTS_OFFSET + slot * self._slot.size
+
+    def _link(self, slot:int, field:int) -> int:
+        return LINK.unpack_from(self._buffer, self._offset(slot) + field)[0]
+
+    def _read_value(self, slot:int) -> Any:
+        value = self._payload.unpack_from(self._buffer, self._offset(slot) + PAYLOAD)
+        return value[0] if self._single else value
+
+    def _encode(self, value:Any) -> bytes:
+        return self._payload.pack(value) if self._single else self._payload.pack(*value)
+
+    def _write_slot(self, slot:int, prev_slot:int, next_slot:int, payload:bytes):
+        offset = self._offset(slot)
+        LINKS.pack_into(self._buffer, offset, prev_slot, next_slot) #~ `free_next` is left alone, slot may still be on the free list
+        self._buffer[offset + PAYLOAD:offset + self._slot.size] = payload
+
+
+def arena_size(fmt:str, capacity:int) -> int:
+    """Returns number of bytes a `SlotArena` of `capacity` slots with payload format `fmt` needs.
+    """
+
+    return SLOTS_OFFSET + capacity * struct.calcsize('<qqq' + fmt)
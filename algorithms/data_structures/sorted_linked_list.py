@@ -0,0 +1,207 @@
+from typing import Any, Iterable, Iterator, Optional
+
+from algorithms.data_structures.indexed_double_linked_list import IndexedDoubleLinkedList, IndexedNode
+
+
+class SortedLinkedList:
+    """This class constitutes implementation of **Sorted Linked List** searched through a **skip list**.
+
+    Values are kept in ascending order in the nodes of a wrapped `IndexedDoubleLinkedList`, whose express links
+    are followed by value instead of by position, so `add`, `remove`, `bisect_left`/`bisect_right` & `in` take
+    O(log n) expected. Values equal to existing ones are added after them, so equal values leave in insertion
+    order. Positional access (`[]`, `delete`) is O(log n) too.
+
+    The list is wrapped rather than subclassed - operations placing values at a given position (`append`,
+    `insert`, `move_to_front`, ...) would break the order, so they are not offered.
+    """
+
+    def __init__(self, seed:Optional[int]=None):
+        self._list = IndexedDoubleLinkedList(seed)
+
+    @classmethod
+    def from_iterable(cls, iterable:Iterable) -> 'SortedLinkedList': #~ -> O(n log n)
+        """Creates a new `SortedLinkedList` holding values of `iterable` in ascending order.
+        """
+
+        output = cls()
+        output.update(iterable)
+        return output
+
+    def __len__(self):
+        return len(self._list)
+
+    def __iter__(self) -> Iterator: #~ -> O(n)
+        return iter(self._list)
+
+    def __reversed__(self) -> Iterator: #~ -> O(n)
+        return reversed(self._list)
+
+    def __getitem__(self, pos_idx:int): #~ -> O(log n)
+        return self._list[pos_idx]
+
+    def __reduce__(self): #~ -> O(n)
+        return type(self), (), self._list._values()
+
+    def __setstate__(self, values:list):
+        self._list.extend(values) #~ Pickled in order already
+
+    def __contains__(self, value:Any) -> bool: #~ -> O(log n)
+        node = self._following(self._search_value(value)[0])
+        return node is not None and node.value == value
+
+    def add(self, value:Any) -> IndexedNode: #~ -> O(log n)
+        """Creates a new `IndexedNode` with `value` & links it after all values less than or equal to `value`.
+
+        Args:
+            value (Any): The value to be added, comparable with the other values by `<`.
+
+        Returns:
+            IndexedNode: Handle of the new element, accepted by `remove_node`.
+        """
+
+        new_node = IndexedNode(value, self._list._random_height())
+        self._list._raise_height(len(new_node.skips))
+        prev_node, pos_idx, update, update_pos = self._search_value(value, right=True)
+
+        return self._list._link_after(new_node, pos_idx, prev_node, update, update_pos)
+
+    def update(self, iterable:Iterable): #~ -> O(k log k + log n) when values go after the tail, else O(k log n)
+        """Adds values of `iterable`. Values sorting after the current *tail* are linked in a single pass.
+        """
+
+        values = sorted(iterable)
+        if not values:
+            return
+
+        tail = self._list.tail
+        if tail is None or not values[0] < tail.value:
+            self._list.extend(values)
+        else:
+            for value in values:
+                self.add(value)
+
+    def remove(self, value:Any): #~ -> O(log n)
+        """Deletes the first element equal to `value`.
+
+        Raises:
+            ValueError: If no element is equal to `value`.
+        """
+
+        prev_node, _, update, _ = self._search_value(value)
+        node = self._following(prev_node)
+
+        if node is None or node.value != value:
+            raise ValueError(f"{value!r} is not in the SortedLinkedList")
+
+        self._list._unlink_node(node, update)
+
+    def remove_node(self, node:IndexedNode): #~ -> O(log n + number of values equal to node's)
+        """Deletes element identified by `node` handle & returns its value.
+
+        Raises:
+            ValueError: If `node` was already removed.
+        """
+
+        self._list._check_linked(node)
+        prev_node, _, update, _ = self._search_value(node.value)
+        current_node = self._following(prev_node)
+
+        while current_node is not node: #~ Walks over equal values, towers passed become predecessors
+            if current_node is None or current_node.value != node.value:
+                raise ValueError(f"{node!r} is not linked to the SortedLinkedList")
+            for level in range(len(current_node.skips)):
+                update[level] = current_node
+            current_node = current_node.next
+
+        return self._list._unlink_node(node, update).value
+
+    def delete(self, pos_idx:int): #~ -> O(log n)
+        """Deletes and returns element at `pos_idx`, `None` if `pos_idx` is out of bounds.
+        """
+
+        return self._list.delete(pos_idx)
+
+    def bisect_left(self, value:Any) -> int: #~ -> O(log n)
+        """Returns index where `value` would be added before equal values - the number of values less than it.
+        """
+
+        return self._search_value(value)[1]
+
+    def bisect_right(self, value:Any) -> int: #~ -> O(log n)
+        """Returns index where `value` would be added after equal values - the number of values not greater than it.
+        """
+
+        return self._search_value(value, right=True)[1]
+
+    bisect = bisect_right
+
+    def irange(self, minimum:Optional[Any]=None, maximum:Optional[Any]=None) -> Iterator: #~ -> O(log n + k)
+        """Yields values `v` such that `minimum <= v <= maximum` in ascending order, unbounded where `None`.
+
+        Raises:
+            RuntimeError: If the `SortedLinkedList` gets structurally changed while iterating.
+        """
+
+        mods = self._list._mods
+        if minimum is None:
+            current_node = self._list.head
+        else:
+            current_node = self._following(self._search_value(minimum)[0])
+
+        while current_node is not None and (maximum is None or not maximum < current_node.value):
+            yield current_node.value
+            if self._list._mods != mods:
+                raise RuntimeError("SortedLinkedList mutated during iteration")
+            current_node = current_node.next
+
+    def pop_min(self): #~ -> O(log n)
+        """Deletes and returns the smallest value, `None` if there are no elements.
+        """
+
+        return self._list.pop_head()
+
+    def pop_max(self): #~ -> O(log n)
+        """Deletes and returns the largest value, `None` if there are no elements.
+        """
+
+        return self._list.pop_tail()
+
+    def clear(self): #~ -> O(1)
+        self._list.clear()
+
+    def _following(self, node:IndexedNode) -> Optional[IndexedNode]:
+        """Returns node after `node` on level 0, where the sentinel comes before *head*.
+        """
+
+        return self._list.head if node is self._list._sentinel else node.next
+
+    def _search_value(self, value:Any, right:bool=False) -> tuple[IndexedNode, int, list[IndexedNode], list[int]]:
+        """Finds the last node with a value less than (or with `right`, not greater than) `value` on every level.
+
+        Returns:
+            tuple: Level 0 predecessor (the sentinel if there is none), index `value` would be added at, then
+                predecessors on upper levels together with their positions, as `IndexedDoubleLinkedList._search`
+                returns them.
+        """
+
+        nodes = self._list
+        node, node_pos = nodes._sentinel, -1
+        update = [nodes._sentinel] * nodes._height
+        update_pos = [-1] * nodes._height
+
+        for level in reversed(range(nodes._height)):
+            while (following := node.skips[level]) is not None and (
+                not value < following.value if right else following.value < value
+            ):
+                node_pos += node.widths[level]
+                node = following
+            update[level] = node
+            update_pos[level] = node_pos
+
+        while (following := self._following(node)) is not None and (
+            not value < following.value if right else following.value < value
+        ): #~ Expected O(1) steps left on level 0
+            node = following
+            node_pos += 1
+
+        return node, node_pos + 1, update, update_pos
@@ -0,0 +1,214 @@
+from typing import Any, Optional
+
+
+DEFAULT_BLOCK_CAPACITY = 64
+
+
+class Block:
+    """Represents fixed-capacity value arrays chained together by `UnrolledDoubleLinkedList`.
+
+    Occupied slots are always contiguous: `values[start:end]`.
+    """
+
+    __slots__ = ('values', 'start', 'end', 'prev', 'next')
+
+    def __init__(self, capacity:int, start:int):
+        self.values:list = [None] * capacity
+        self.start = start #~ First occupied slot
+        self.end = start #~ One past the last occupied slot
+        self.prev:Optional[Block] = None
+        self.next:Optional[Block] = None
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __repr__(self):
+        return f"Block(values={self.values[self.start:self.end]})"
+
+
+class UnrolledDoubleLinkedList:
+    """This class constitutes implementation of **Unrolled Double Linked List** data structure.
+
+    Exposes the same `append`/`prepend`/`pop_head`/`pop_tail`/`delete`/`__len__` API as `DoubleLinkedList`,
+    but instead of allocating one `Node` per element it stores values in `Block`s holding up to
+    `block_capacity` values each, with *prev*/*next* links kept at block level only.
+    """
+
+    def __init__(self, block_capacity:int=DEFAULT_BLOCK_CAPACITY):
+        if block_capacity < 2:
+            raise ValueError("block_capacity must be at least 2")
+
+        self.block_capacity = block_capacity
+        self.head:Block = Block(block_capacity, block_capacity//2) #~ BEGINNING
+        self.tail:Block = self.head #~ END
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def append(self, value:Any): #~ -> O(1)
+        """Stores `value` as a new *tail* element of the `UnrolledDoubleLinkedList`.
+
+        Args:
+            value (Any): The value to be added to the `UnrolledDoubleLinkedList`.
+        """
+
+        tail = self.tail
+
+        if tail.end == self.block_capacity: #~ If tail block is full
+            new_block = Block(self.block_capacity, 0)
+            new_block.prev = tail
+            tail.next = new_block
+            self.tail = tail = new_block
+
+        tail.values[tail.end] = value
+        tail.end += 1
+        self._len += 1
+
+    def prepend(self, value:Any): #~ -> O(1)
+        """Stores `value` as a new *head* element of the `UnrolledDoubleLinkedList`.
+
+        Args:
+            value (Any): The value to be added to the `UnrolledDoubleLinkedList`.
+        """
+
+        head = self.head
+
+        if head.start == 0: #~ If head block is full on the left side
+            new_block = Block(self.block_capacity, self.block_capacity)
+            new_block.next = head
+            head.prev = new_block
+            self.head = head = new_block
+
+        head.start -= 1
+        head.values[head.start] = value
+        self._len += 1
+
+    def pop_head(self): #~ -> O(1)
+        """Deletes and returns *head* element from `UnrolledDoubleLinkedList`.
+        """
+
+        if not self._len: #~ If no elements
+            return None
+
+        head = self.head
+        output = head.values[head.start]
+        head.values[head.start] = None
+        head.start += 1
+        self._len -= 1
+
+        if head.start == head.end: #~ If head block got emptied
+            self._release(head)
+
+        return output
+
+    def pop_tail(self): #~ -> O(1)
+        """Deletes and returns *tail* element from `UnrolledDoubleLinkedList`.
+        """
+
+        if not self._len: #~ If no elements
+            return None
+
+        tail = self.tail
+        tail.end -= 1
+        output = tail.values[tail.end]
+        tail.values[tail.end] = None
+        self._len -= 1
+
+        if tail.start == tail.end: #~ If tail block got emptied
+            self._release(tail)
+
+        return output
+
+    def delete(self, pos_idx:int): #! -> O(n / block_capacity + block_capacity)
+        """Deletes and returns element at `pos_idx` from `UnrolledDoubleLinkedList`.
+
+        Args:
+            pos_idx (int): Index of the element to delete.
+        """
+
+        if not (0 <= pos_idx < self._len): #~ If pos_idx out of bounds (or no elements)
+            return None
+
+        if pos_idx == 0: #~ If pos_idx is at head
+            return self.pop_head()
+        elif pos_idx == self._len-1: #~ If pos_idx is at tail
+            return self.pop_tail()
+
+        block, offset = self._locate(pos_idx)
+        values = block.values
+        slot = block.start + offset
+        output = values[slot]
+
+        if offset < len(block)//2: #~ Shift the shorter side of the block over the gap
+            values[block.start+1:slot+1] = values[block.start:slot]
+            values[block.start] = None
+            block.start += 1
+        else:
+            values[slot:block.end-1] = values[slot+1:block.end]
+            block.end -= 1
+            values[block.end] = None
+
+        self._len -= 1
+
+        if block.start == block.end: #~ Only middle blocks can get emptied here
+            self._release(block)
+        elif len(block) < self.block_capacity//2:
+            self._merge_with_next(block)
+
+        return output
+
+    def _locate(self, pos_idx:int) -> tuple[Block, int]:
+        """Finds `Block` holding element at `pos_idx` & the element's offset within that block.
+        """
+
+        if pos_idx < self._len//2: #~ If pos_idx is closer to head
+            block = self.head
+            while pos_idx >= len(block):
+                pos_idx -= len(block)
+                block = block.next
+            return block, pos_idx
+
+        pos_idx = self._len - 1 - pos_idx #~ Distance from tail
+        block = self.tail
+        while pos_idx >= len(block):
+            pos_idx -= len(block)
+            block = block.prev
+        return block, len(block) - 1 - pos_idx
+
+    def _release(self, block:Block):
+        """Unlinks emptied `block`. The last remaining block is kept & recentered instead.
+        """
+
+        if block.prev is None and block.next is None: #~ If it is the only block
+            block.start = block.end = self.block_capacity//2
+            return
+
+        if block.prev is None:
+            self.head = block.next
+        else:
+            block.prev.next = block.next
+
+        if block.next is None:
+            self.tail = block.prev
+        else:
+            block.next.prev = block.prev
+
+        block.prev = block.next = None
+
+    def _merge_with_next(self, block:Block):
+        """Moves values of the following `Block` into `block` when both fit into one block.
+        """
+
+        following = block.next
+
+        if following is None or len(block) + len(following) > self.block_capacity:
+            return
+
+        merged = block.values[block.start:block.end] + following.values[following.start:following.end]
+        start = min(block.start, self.block_capacity - len(merged))
+
+        block.values = [None] * start + merged + [None] * (self.block_capacity - start - len(merged))
+        block.start = start
+        block.end = start + len(merged)
+        self._release(following)
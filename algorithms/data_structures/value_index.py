@@ -0,0 +1,192 @@
+from typing import Any, Collection, Optional
+
+
+BLOOM_BITS_PER_VALUE = 8 #~ With 4 hashes, ~2.4% false positives at full capacity
+BLOOM_HASHES = 4
+
+
+class CountingBloomFilter:
+    """This class constitutes implementation of **Counting Bloom Filter**.
+
+    Every added key increments `BLOOM_HASHES` one-byte counters & every discarded one decrements them, so keys
+    can be removed. `might_contain` never answers `False` for a key that was added & not discarded since.
+    Counters stuck at 255 are never decremented - they only cost false positives.
+    """
+
+    __slots__ = ('_counters', '_size')
+
+    def __init__(self, capacity:int):
+        self._size = max(64, capacity * BLOOM_BITS_PER_VALUE)
+        self._counters = bytearray(self._size)
+
+    def add(self, key:Any):
+        counters = self._counters
+        for position in self._positions(key):
+            if counters[position] < 255:
+                counters[position] += 1
+
+    def discard(self, key:Any):
+        counters = self._counters
+        for position in self._positions(key):
+            if counters[position] < 255:
+                counters[position] -= 1
+
+    def might_contain(self, key:Any) -> bool:
+        counters = self._counters
+        return all(counters[position] for position in self._positions(key))
+
+    def _positions(self, key:Any) -> list[int]:
+        """Derives positions out of one `hash` - double hashing, `h1 + i * h2`."""
+
+        first = hash(key)
+        second = (first >> 17) | 1
+        return [(first + i * second) % self._size for i in range(BLOOM_HASHES)]
+
+
+class ValueIndex:
+    """Maps values of linked list nodes to the nodes holding them, for O(1) membership checks & lookups.
+
+    Hashable values are keys of a `dict` - pointing at the node itself, or at a `set` of nodes once a value
+    repeats. Unhashable values (lists, dicts, ...) cannot be keys, so their nodes are only collected in a `set`
+    & compared one by one. A `CountingBloomFilter` of their fingerprints - the value frozen into hashable
+    containers - answers most lookups of values not among them without that scan.
+
+    The index relies on values not changing while they are in the list, like keys of a `dict`.
+    """
+
+    __slots__ = ('_nodes', '_unhashable', '_opaque', '_filter', '_capacity')
+
+    def __init__(self):
+        self._nodes:dict[Any, Any] = {} #~ Value -> node, or `set` of nodes if it repeats
+        self._unhashable:set = set() #~ Nodes with unhashable values
+        self._opaque = 0 #~ Unhashable values that have no fingerprint either, the filter cannot rule them out
+        self._capacity = 0
+        self._filter:Optional[CountingBloomFilter] = None
+
+    def add(self, node:Any): #~ -> O(1) amortized
+        value = node.value
+        try:
+            entry = self._nodes.setdefault(value, node)
+        except TypeError:
+            self._add_unhashable(node)
+            return
+
+        if entry is not node:
+            if type(entry) is set:
+                entry.add(node)
+            else:
+                self._nodes[value] = {entry, node}
+
+    def add_chain(self, node:Any, stop:Any=None): #~ -> O(k)
+        """Adds `node` & nodes following it up to, but excluding, `stop`.
+        """
+
+        add = self.add
+        while node is not stop:
+            add(node)
+            node = node.next
+
+    def discard(self, node:Any): #~ -> O(1)
+        value = node.value
+        try:
+            entry = self._nodes.get(value)
+        except TypeError:
+            self._unhashable.discard(node)
+            fingerprint = _fingerprint(value)
+            if fingerprint is None:
+                self._opaque -= 1
+            else:
+                self._filter.discard(fingerprint)
+            return
+
+        if entry is node:
+            del self._nodes[value]
+        elif type(entry) is set:
+            entry.discard(node)
+            if len(entry) == 1:
+                self._nodes[value] = entry.pop()
+
+    def clear(self):
+        self._nodes.clear()
+        self._unhashable.clear()
+        self._opaque = self._capacity = 0
+        self._filter = None
+
+    def lookup(self, value:Any) -> Collection: #~ -> O(1), O(u) when unhashable values might equal `value`
+        """Returns nodes holding values equal to `value`, in no particular order - empty if there are none.
+        """
+
+        try:
+            nodes = self._entry_nodes(value)
+        except TypeError: #~ May equal a hashable value, e.g. `bytearray` & `bytes`, `set` & `frozenset`
+            fingerprint = _fingerprint(value)
+            nodes = () if fingerprint is None else [
+                node for node in self._entry_nodes(fingerprint) if node.value == value
+            ]
+
+        if self._unhashable and self._might_be_unhashable(value): #~ Slow path, e.g. `bytes` equal to a `bytearray`
+            matches = [node for node in self._unhashable if node.value is value or node.value == value]
+            if matches:
+                nodes = [*nodes, *matches]
+
+        return nodes
+
+    def _entry_nodes(self, value:Any) -> Collection:
+        entry = self._nodes.get(value, ())
+        return entry if type(entry) in (set, tuple) else (entry,)
+
+    def _might_be_unhashable(self, value:Any) -> bool:
+        if self._opaque:
+            return True
+        fingerprint = _fingerprint(value)
+        return fingerprint is None or self._filter.might_contain(fingerprint)
+
+    def _add_unhashable(self, node:Any):
+        self._unhashable.add(node)
+        if len(self._unhashable) > self._capacity: #~ Doubles filter to keep false positives in check
+            self._rebuild_filter(2 * len(self._unhashable))
+            return
+
+        fingerprint = _fingerprint(node.value)
+        if fingerprint is None:
+            self._opaque += 1
+        else:
+            self._filter.add(fingerprint)
+
+    def _rebuild_filter(self, capacity:int): #~ -> O(u)
+        self._capacity = capacity
+        self._filter = CountingBloomFilter(capacity)
+        self._opaque = 0
+        for node in self._unhashable:
+            fingerprint = _fingerprint(node.value)
+            if fingerprint is None:
+                self._opaque += 1
+            else:
+                self._filter.add(fingerprint)
+
+
+def _frozen(value:Any) -> Any:
+    """Converts built-in mutable containers into hashable ones, so that equal values are converted to equal ones.
+    """
+
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_frozen, value))
+    if isinstance(value, dict):
+        return frozenset((key, _frozen(item)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    if isinstance(value, bytearray):
+        return bytes(value)
+    return value
+
+
+def _fingerprint(value:Any) -> Optional[Any]:
+    """Returns hashable stand-in of `value` for the Bloom filter, `None` if there is none.
+    """
+
+    try:
+        frozen = _frozen(value)
+        hash(frozen)
+    except (TypeError, RecursionError):
+        return None
+    return frozen
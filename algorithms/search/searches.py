@@ -0,0 +1,123 @@
+from bisect import bisect_left
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+
+SEARCHES:dict[str, Callable[[Sequence, Any], int]] = {}
+
+
+def register(name:str) -> Callable:
+    """Adds decorated search function to `SEARCHES` under `name`.
+    """
+
+    def decorator(function:Callable) -> Callable:
+        SEARCHES[name] = function
+        return function
+
+    return decorator
+
+
+@register('binary')
+def binary_search(values:Sequence, target:Any) -> int: #~ -> O(log n)
+    """Returns index of the first occurrence of `target` in sorted `values`, or -1 if it is missing.
+
+    Bisection is left to `bisect.bisect_left`, which runs in C.
+    """
+
+    return _found(values, bisect_left(values, target), target)
+
+
+@register('exponential')
+def exponential_search(values:Sequence, target:Any, start:int=0) -> int: #~ -> O(log d), d = distance from start
+    """Returns index of the first occurrence of `target` in sorted `values` at or after `start`, or -1 if it is missing.
+
+    Gallops from `start` in steps of 1, 2, 4, ... until it passes `target`, then bisects the last step. Costs
+    depend on how far the result is from `start`, not on length of `values` - fast for targets near the
+    beginning & for increasing queries, each starting from the previous result.
+    """
+
+    size = len(values)
+    low, step = start, 1
+    while low + step <= size and values[low + step - 1] < target:
+        low += step
+        step *= 2
+
+    return _found(values, bisect_left(values, target, low, min(low + step, size)), target)
+
+
+@register('interpolation')
+def interpolation_search(values:Sequence, target:Any) -> int: #~ -> O(log log n) on uniform values, O(log n) at worst
+    """Returns index of the first occurrence of numeric `target` in sorted numeric `values`, or -1 if it is missing.
+
+    Probes where `target` would be if values grew linearly between both ends of the remaining range. After
+    `2 * log2(n)` probes without a result - skewed values - the rest of the range is bisected.
+    """
+
+    low, high = 0, len(values) #~ Result lies within [low, high]
+    probes = 2 * high.bit_length()
+
+    while high - low > 1 and probes:
+        first, last = values[low], values[high - 1]
+        if not first < target:
+            return _found(values, low, target)
+        if last < target:
+            return _found(values, high, target)
+
+        position = low + int((target - first) / (last - first) * (high - 1 - low)) #~ Divides first, NumPy integers would overflow
+        if values[position] < target:
+            low = position + 1
+        else:
+            high = position
+        probes -= 1
+
+    return _found(values, bisect_left(values, target, low, high), target)
+
+
+@register('fibonacci')
+def fibonacci_search(values:Sequence, target:Any) -> int: #~ -> O(log n)
+    """Returns index of the first occurrence of `target` in sorted `values`, or -1 if it is missing.
+
+    Splits the range at Fibonacci numbers instead of halves, so probe positions come from additions &
+    subtractions only. Probes land ~62% into the range, which takes ~4% more probes than bisection.
+    """
+
+    low, high = 0, len(values) #~ Result lies within [low, high]
+    fibonacci = [1, 1]
+    while fibonacci[-1] < high:
+        fibonacci.append(fibonacci[-1] + fibonacci[-2])
+    k = len(fibonacci) - 1 #~ Keeps `high - low <= fibonacci[k]`
+
+    while low < high:
+        probe = low + (fibonacci[k - 1] - 1 if k else 0)
+        if probe < high and values[probe] < target:
+            low = probe + 1
+            k = max(k - 2, 0)
+        else:
+            high = min(high, probe)
+            k = max(k - 1, 0)
+
+    return _found(values, low, target)
+
+
+def search_many(values:Sequence, queries:Sequence) -> np.ndarray: #~ -> O(q log n)
+    """Returns indices of first occurrences of every query in sorted `values`, -1 for missing ones.
+
+    All queries are looked up in one vectorized `np.searchsorted` pass & checked for presence in another, so
+    the per-query cost of Python function calls is paid once per batch.
+    """
+
+    values, queries = np.asarray(values), np.asarray(queries)
+    positions = np.searchsorted(values, queries, side='left')
+    if not len(values):
+        return np.full(positions.shape, -1, dtype=np.intp)
+
+    found = values[np.minimum(positions, len(values) - 1)] == queries
+    return np.where(found & (positions < len(values)), positions, -1)
+
+
+def _found(values:Sequence, index:int, target:Any) -> int:
+    """Returns `index` if `target` is there, -1 otherwise.
+    """
+
+    return index if index < len(values) and values[index] == target else -1
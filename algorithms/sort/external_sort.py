@@ -0,0 +1,154 @@
+import heapq
+import os
+import pickle
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import batched, islice
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+
+BLOCK_SIZE = 1024 #~ Records pickled together, one `pickle.load` per block instead of per record
+
+
+def external_sort(
+    records:Iterable,
+    key:Optional[Callable]=None,
+    reverse:bool=False,
+    run_size:int=1_000_000,
+    workers:Optional[int]=None,
+    fanout:int=64,
+    temp_dir:Optional[str]=None,
+    buffer_size:int=1 << 16,
+) -> Iterator: #~ -> O(n log n), O(run_size * (workers + 1) + fanout * buffer_size) memory
+    """Sorts `records` that may not fit in memory with **external merge sort**, yielding them lazily in order.
+
+    Records are read `run_size` at a time. Every run is sorted & spilled to a temporary file by a worker
+    process, at most `workers` runs are in flight, so the input is streamed. Sorted runs are then combined by a
+    k-way heap merge reading every file through a `buffer_size` buffer; with more than `fanout` runs, groups of
+    them are merged into longer runs first, so the number of open files stays bounded. Input that fits in a
+    single run is sorted in memory without touching the disk.
+
+    Sorting starts on the first `next()`. The sort is stable. Temporary files are removed once the generator is
+    exhausted or closed.
+
+    Args:
+        records (Iterable): Picklable records, e.g. lines of a file.
+        key (Optional[Callable]): Computes comparison key out of a record. Must be picklable (a module-level
+            function, not a lambda) when `workers` is not 0.
+        reverse (bool): Sorts in descending order.
+        run_size (int): Number of records sorted in memory at once.
+        workers (Optional[int]): Processes sorting runs - `os.cpu_count()` if `None`, runs are sorted in this
+            process if 0.
+        fanout (int): Largest number of runs merged at once.
+        temp_dir (Optional[str]): Directory for run files, system temp directory if `None`.
+        buffer_size (int): Bytes buffered per run file.
+
+    Raises:
+        ValueError: If `run_size` is not positive or `fanout` is less than 2.
+    """
+
+    if run_size < 1:
+        raise ValueError("run_size must be at least 1")
+    if fanout < 2:
+        raise ValueError("fanout must be at least 2")
+
+    chunks = _chunks(iter(records), run_size)
+    head = list(islice(chunks, 2))
+    if len(head) < 2: #~ Everything fits in one run
+        yield from sorted(head[0] if head else [], key=key, reverse=reverse)
+        return
+
+    with tempfile.TemporaryDirectory(prefix='external-sort-', dir=temp_dir) as directory:
+        runs = _spill_runs(_handed_over(head, chunks), key, reverse, workers, directory, buffer_size)
+
+        while len(runs) > fanout: #~ Intermediate passes, each shrinks the number of runs `fanout` times
+            merged = []
+            for group in batched(runs, fanout):
+                path = _run_path(directory)
+                _write_run(_merge_runs(group, key, reverse, buffer_size), path, buffer_size)
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+
+        yield from _merge_runs(runs, key, reverse, buffer_size)
+
+
+def _chunks(records:Iterator, run_size:int) -> Iterator[list]:
+    while chunk := list(islice(records, run_size)):
+        yield chunk
+
+
+def _handed_over(head:list[list], chunks:Iterator[list]) -> Iterator[list]:
+    """Yields chunks of `head`, dropping references to them, then the rest of `chunks`.
+    """
+
+    while head:
+        yield head.pop(0)
+    yield from chunks
+
+
+def _spill_runs(
+    chunks:Iterator[list],
+    key:Optional[Callable],
+    reverse:bool,
+    workers:Optional[int],
+    directory:str,
+    buffer_size:int,
+) -> list[str]:
+    """Sorts & writes out every chunk, returns paths of the run files in input order.
+    """
+
+    if workers == 0:
+        return [_sort_run(chunk, key, reverse, _run_path(directory), buffer_size) for chunk in chunks]
+
+    workers = workers or os.cpu_count()
+    runs = []
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            if len(pending) >= workers: #~ Bounds chunks held in memory, each pending future keeps its own
+                runs.append(pending.popleft().result())
+            pending.append(pool.submit(_sort_run, chunk, key, reverse, _run_path(directory), buffer_size))
+        runs.extend(future.result() for future in pending)
+
+    return runs
+
+
+def _sort_run(chunk:list, key:Optional[Callable], reverse:bool, path:str, buffer_size:int) -> str:
+    """Sorts `chunk` in place & writes it into `path`. Runs in worker processes, so the sorted run is never sent back.
+    """
+
+    chunk.sort(key=key, reverse=reverse)
+    _write_run(chunk, path, buffer_size)
+    return path
+
+
+def _run_path(directory:str) -> str:
+    file, path = tempfile.mkstemp(suffix='.run', dir=directory)
+    os.close(file)
+    return path
+
+
+def _write_run(records:Iterable, path:str, buffer_size:int):
+    with open(path, 'wb', buffering=buffer_size) as file:
+        for block in batched(records, BLOCK_SIZE):
+            pickle.dump(block, file, pickle.HIGHEST_PROTOCOL)
+
+
+def _read_run(path:str, buffer_size:int) -> Iterator:
+    with open(path, 'rb', buffering=buffer_size) as file:
+        while True:
+            try:
+                block = pickle.load(file)
+            except EOFError:
+                return
+            yield from block
+
+
+def _merge_runs(runs:Iterable[str], key:Optional[Callable], reverse:bool, buffer_size:int) -> Iterator[Any]:
+    """K-way heap merge of sorted run files. Ties are taken from earlier runs, which keeps the sort stable.
+    """
+
+    return heapq.merge(*(_read_run(run, buffer_size) for run in runs), key=key, reverse=reverse)
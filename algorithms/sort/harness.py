@@ -0,0 +1,134 @@
+import csv
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, fields
+from typing import Iterable, Optional, TextIO
+
+from algorithms.sort.inputs import make_input
+from algorithms.sort.sorts import SORTS, SortAlgorithm, SortStats
+
+
+FORMATS = ('csv', 'json')
+
+
+@dataclass
+class SortResult:
+    """Measurements of one sort on one input. Counters are `None` where the sort cannot report them.
+    """
+
+    algorithm:str
+    input:str
+    size:int
+    seconds:float #~ Best wall-time out of all repeats, without any instrumentation
+    comparisons:Optional[int]
+    swaps:Optional[int]
+    peak_bytes:int #~ Peak memory allocated by the sort on top of its input
+
+
+def measure(algorithm:SortAlgorithm, input_name:str, values:list, repeat:int=3) -> SortResult:
+    """Sorts copies of `values` with `algorithm` - `repeat` times for wall-time, once with counters & once for memory.
+
+    Instrumented runs are kept apart from the timed ones, so counting does not distort timings.
+
+    Raises:
+        RuntimeError: If `algorithm` produces unsorted output.
+    """
+
+    expected = sorted(values)
+    seconds = float('inf')
+
+    for _ in range(repeat):
+        copy = values[:]
+        start = time.perf_counter()
+        algorithm.function(copy)
+        seconds = min(seconds, time.perf_counter() - start)
+
+        if copy != expected:
+            raise RuntimeError(f"{algorithm.name} sort produced unsorted output on {input_name!r} input")
+
+    stats = SortStats()
+    if algorithm.comparison_based: #! Wrapping makes every comparison a Python call
+        counted = [_Counted(value, stats) for value in values]
+        algorithm.function(counted, stats)
+    else:
+        algorithm.function(values[:], stats)
+
+    copy = values[:]
+    tracemalloc.start()
+    try:
+        algorithm.function(copy)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return SortResult(
+        algorithm.name,
+        input_name,
+        len(values),
+        seconds,
+        stats.comparisons if algorithm.comparison_based else 0,
+        stats.swaps if algorithm.counts_swaps else None,
+        peak_bytes,
+    )
+
+
+def run_benchmark(
+    algorithms:Iterable[str],
+    inputs:Iterable[str],
+    sizes:Iterable[int],
+    repeat:int=3,
+    seed:int=0,
+) -> list[SortResult]:
+    """Measures every algorithm of `SORTS` named in `algorithms` on every input shape & size.
+
+    Every algorithm gets the same values for a given shape & size. Sizes above `max_size` of an algorithm are skipped.
+
+    Raises:
+        KeyError: If some algorithm or input shape is unknown.
+    """
+
+    algorithms = [SORTS[name] for name in algorithms]
+    results = []
+
+    for size in sizes:
+        for input_name in inputs:
+            values = make_input(input_name, size, seed)
+            for algorithm in algorithms:
+                if algorithm.max_size is None or size <= algorithm.max_size:
+                    results.append(measure(algorithm, input_name, values, repeat))
+
+    return results
+
+
+def write_results(results:list[SortResult], file:TextIO, format:str='csv'):
+    """Writes `results` to `file` as CSV with a header row, or as a JSON array of objects.
+
+    Raises:
+        ValueError: If `format` is not one of `FORMATS`.
+    """
+
+    if format == 'csv':
+        writer = csv.DictWriter(file, fieldnames=[field.name for field in fields(SortResult)])
+        writer.writeheader()
+        writer.writerows(asdict(result) for result in results)
+    elif format == 'json':
+        json.dump([asdict(result) for result in results], file, indent=2)
+        file.write('\n')
+    else:
+        raise ValueError(f"format must be one of {FORMATS}, got {format!r}")
+
+
+class _Counted:
+    """Value wrapper counting `<` comparisons into a `SortStats`. Sorts in this package only ever use `<`.
+    """
+
+    __slots__ = ('value', 'stats')
+
+    def __init__(self, value, stats:SortStats):
+        self.value = value
+        self.stats = stats
+
+    def __lt__(self, other:'_Counted') -> bool:
+        self.stats.comparisons += 1
+        return self.value < other.value
@@ -0,0 +1,71 @@
+import random
+from itertools import accumulate
+from typing import Callable
+
+
+INPUTS:dict[str, Callable[[int, random.Random], list[int]]] = {}
+
+
+def register(name:str) -> Callable:
+    """Adds decorated input generator to `INPUTS` under `name`.
+    """
+
+    def decorator(generator:Callable) -> Callable:
+        INPUTS[name] = generator
+        return generator
+
+    return decorator
+
+
+def make_input(name:str, size:int, seed:int=0) -> list[int]:
+    """Generates `size` integers of input shape `name`, reproducibly for a given `seed`.
+
+    Raises:
+        KeyError: If `name` is not in `INPUTS`.
+    """
+
+    return INPUTS[name](size, random.Random(seed))
+
+
+@register('random')
+def random_values(size:int, rng:random.Random) -> list[int]:
+    return [rng.randrange(size) for _ in range(size)]
+
+
+@register('sorted')
+def sorted_values(size:int, rng:random.Random) -> list[int]:
+    return list(range(size))
+
+
+@register('reversed')
+def reversed_values(size:int, rng:random.Random) -> list[int]:
+    return list(range(size, 0, -1))
+
+
+@register('few-unique')
+def few_unique_values(size:int, rng:random.Random, unique:int=10) -> list[int]:
+    return [rng.randrange(unique) for _ in range(size)]
+
+
+@register('nearly-sorted')
+def nearly_sorted_values(size:int, rng:random.Random, fraction:float=0.01) -> list[int]:
+    """Sorted values with `fraction` of positions swapped with random others.
+    """
+
+    values = list(range(size))
+    for _ in range(int(size * fraction)):
+        i, j = rng.randrange(size), rng.randrange(size)
+        values[i], values[j] = values[j], values[i]
+    return values
+
+
+@register('zipf')
+def zipf_values(size:int, rng:random.Random, exponent:float=1.2) -> list[int]: #~ -> O(n log n)
+    """Ranks `1..size` drawn with probability proportional to `1 / rank ** exponent` - a few values dominate, most are rare.
+    """
+
+    if not size:
+        return []
+    ranks = range(1, size + 1)
+    cumulative = list(accumulate(rank ** -exponent for rank in ranks))
+    return rng.choices(ranks, cum_weights=cumulative, k=size)
@@ -0,0 +1,108 @@
+from typing import Any, Callable, Optional
+
+
+def merge_sort_nodes(head:Any, key:Optional[Callable]=None, reverse:bool=False) -> tuple[Any, Any]: #~ -> O(n log n), O(1) extra space
+    """Sorts a chain of nodes linked through `next` with **bottom-up merge sort**, relinking nodes in place.
+
+    Runs of width 1, 2, 4, ... are merged pairwise until a single run is left, so no recursion & no auxiliary
+    arrays are needed. The sort is stable (also with `reverse=True`, like `sorted`). Two runs already in
+    order are joined with a single comparison, so presorted input is merged in O(n) per pass.
+
+    Only `next` links are touched - `prev` links of a doubly linked chain have to be fixed afterwards.
+
+    Args:
+        head (Any): First node of the chain, or `None`.
+        key (Optional[Callable]): Computes comparison key out of a node value, values themselves if `None`.
+        reverse (bool): Sorts in descending order.
+
+    Returns:
+        tuple[Any, Any]: New first & last node of the chain (`None, None` if empty).
+    """
+
+    if head is None:
+        return None, None
+
+    length, tail = 1, head
+    while tail.next is not None:
+        tail = tail.next
+        length += 1
+
+    width = 1
+    while width < length:
+        pending, head, tail = head, None, None
+
+        while pending is not None:
+            left, left_tail = pending, _cut(pending, width)
+            right = left_tail.next
+            left_tail.next = None
+
+            if right is None: #~ Odd run out, nothing to merge with
+                run_head, run_tail = left, left_tail
+                pending = None
+            else:
+                right_tail = _cut(right, width)
+                pending = right_tail.next
+                right_tail.next = None
+                run_head, run_tail = _merge(left, left_tail, right, right_tail, key, reverse)
+
+            if head is None:
+                head = run_head
+            else:
+                tail.next = run_head
+            tail = run_tail
+
+        width *= 2
+
+    return head, tail
+
+
+def _cut(node:Any, width:int) -> Any:
+    """Returns last node of the run of (at most) `width` nodes starting at `node`.
+    """
+
+    for _ in range(width - 1):
+        if node.next is None:
+            break
+        node = node.next
+    return node
+
+
+def _merge(left:Any, left_tail:Any, right:Any, right_tail:Any, key:Optional[Callable], reverse:bool) -> tuple[Any, Any]:
+    """Merges two sorted, `None`-terminated runs & returns first & last node of the result.
+
+    Ties are taken from `left`, which keeps the sort stable. Every key is computed once per merge.
+    """
+
+    left_key = key(left.value) if key else left.value
+    right_key = key(right.value) if key else right.value
+    last_left_key = key(left_tail.value) if key else left_tail.value
+
+    if reverse: #~ Descending order is ascending order with sides of every comparison swapped
+        if not last_left_key < right_key: #~ Runs already in order
+            left_tail.next = right
+            return left, right_tail
+    elif not right_key < last_left_key:
+        left_tail.next = right
+        return left, right_tail
+
+    head = tail = _Anchor() #~ Placeholder in front of the merged run
+
+    while True:
+        if (left_key < right_key) if reverse else (right_key < left_key): #~ Strictly before, else left wins the tie
+            tail.next = tail = right
+            right = right.next
+            if right is None:
+                tail.next = left
+                return head.next, left_tail
+            right_key = key(right.value) if key else right.value
+        else:
+            tail.next = tail = left
+            left = left.next
+            if left is None:
+                tail.next = right
+                return head.next, right_tail
+            left_key = key(left.value) if key else left.value
+
+
+class _Anchor:
+    __slots__ = ('next',)
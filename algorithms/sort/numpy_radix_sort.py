@@ -0,0 +1,226 @@
+import tempfile
+from typing import Optional
+
+import numpy as np
+
+
+DIGIT_BITS = 16 #~ Stable argsort of 16-bit digits is a counting sort inside NumPy, wider keys take several passes
+
+
+def counting_sort(keys:np.ndarray, max_span:int=1 << 24) -> np.ndarray: #~ -> O(n + span)
+    """Sorts integer `keys` with **counting sort** - one histogram of all values, expanded back into a sorted array.
+
+    No element is moved, the output is written straight out of the histogram, so it only pays off when the
+    span of values (`max - min + 1`) is not much larger than the number of keys. For sort indices use
+    `radix_argsort`, which does a single counting pass for spans up to `2 ** 16`.
+
+    Args:
+        keys (np.ndarray): One-dimensional array of any integer dtype.
+        max_span (int): Largest span of values accepted, bounds memory taken by the histogram.
+
+    Returns:
+        np.ndarray: New sorted array of the same dtype.
+
+    Raises:
+        TypeError: If `keys` are not integers.
+        ValueError: If span of `keys` exceeds `max_span`.
+    """
+
+    unsigned, flip = _unsigned(keys)
+    if not len(unsigned):
+        return keys.copy()
+
+    low = unsigned.min()
+    span = int(unsigned.max() - low) + 1
+    if span > max_span:
+        raise ValueError(f"span of keys is {span}, more than max_span={max_span} - use radix_sort")
+
+    counts = np.bincount((unsigned - low).astype(np.intp), minlength=span)
+    values = np.arange(span, dtype=unsigned.dtype) + low
+    return _signed(np.repeat(values, counts), flip, keys.dtype)
+
+
+def radix_sort(keys:np.ndarray, digit_bits:int=DIGIT_BITS) -> np.ndarray: #~ -> O(n * passes)
+    """Sorts integer `keys` with **LSD radix sort** & returns new sorted array of the same dtype.
+
+    Keys are mapped to unsigned integers (sign bit flipped) & offset by their minimum, so only digits actually
+    spanned by the keys are processed - keys within `2 ** digit_bits` of each other take a single pass. Every
+    pass orders keys by one digit with a stable vectorized counting sort & gathers them into the new order.
+
+    Raises:
+        TypeError: If `keys` are not integers.
+    """
+
+    unsigned, flip = _unsigned(keys)
+    if not len(unsigned):
+        return keys.copy()
+
+    low = unsigned.min()
+    current = unsigned - low
+    for shift in _shifts(int(current.max()), digit_bits):
+        current = current[_digit_order(current, shift, digit_bits)]
+
+    return _signed(current + low, flip, keys.dtype)
+
+
+def radix_argsort(keys:np.ndarray, digit_bits:int=DIGIT_BITS) -> np.ndarray: #~ -> O(n * passes)
+    """Returns indices that sort integer `keys` - like `np.argsort(keys, kind='stable')`, by **LSD radix sort**.
+
+    Raises:
+        TypeError: If `keys` are not integers.
+    """
+
+    unsigned, _ = _unsigned(keys)
+    order = np.arange(len(unsigned), dtype=np.intp)
+    if not len(unsigned):
+        return order
+
+    current = unsigned - unsigned.min()
+    for shift in _shifts(int(current.max()), digit_bits):
+        permutation = _digit_order(current, shift, digit_bits)
+        current, order = current[permutation], order[permutation]
+
+    return order
+
+
+def radix_sort_memmap(
+    source:np.ndarray,
+    target:np.ndarray,
+    indices:Optional[np.ndarray]=None,
+    chunk_size:int=1 << 22,
+    digit_bits:int=DIGIT_BITS,
+    scratch_dir:Optional[str]=None,
+) -> np.ndarray: #~ -> O(n * passes), O(chunk_size + 2^digit_bits) memory
+    """Sorts integer `source` into `target` with out-of-core **LSD radix sort**, `chunk_size` elements at a time.
+
+    Meant for `np.memmap` arrays larger than RAM. One read of `source` builds histograms of all digits at once.
+    Digits equal across all keys are skipped, the rest take one pass each that reads the previous output in
+    chunks & scatters every chunk into place - its elements go to the running offset of their bucket, so each
+    bucket is filled sequentially. Passes alternate between `target` & a scratch memmap in `scratch_dir`
+    (system temp directory if `None`) of the same size, which is deleted afterwards.
+
+    Args:
+        source (np.ndarray): One-dimensional integer array, typically a read-only `np.memmap`. Left untouched.
+        target (np.ndarray): Array of the same shape & dtype receiving sorted keys.
+        indices (Optional[np.ndarray]): Integer array of the same shape receiving indices that sort `source`
+            (stable), not computed if `None`.
+        chunk_size (int): Number of elements held in memory per step.
+        digit_bits (int): Bits per digit, at most 16.
+        scratch_dir (Optional[str]): Directory for scratch memmaps.
+
+    Returns:
+        np.ndarray: `target`.
+
+    Raises:
+        TypeError: If `source` is not integers.
+        ValueError: If shapes or dtypes of arrays do not match.
+    """
+
+    if source.ndim != 1 or target.shape != source.shape or target.dtype != source.dtype:
+        raise ValueError("target must be a one-dimensional array of the same shape & dtype as source")
+    if indices is not None and (indices.shape != source.shape or indices.dtype.kind not in 'iu'):
+        raise ValueError("indices must be an integer array of the same shape as source")
+
+    size = len(source)
+    buckets = 1 << digit_bits
+    shifts = range(0, source.dtype.itemsize * 8, digit_bits)
+
+    histograms = np.zeros((len(shifts), buckets), dtype=np.int64)
+    for start in range(0, size, chunk_size):
+        unsigned, _ = _unsigned(np.asarray(source[start:start + chunk_size]))
+        for row, shift in enumerate(shifts):
+            histograms[row] += np.bincount(_digits(unsigned, shift, digit_bits), minlength=buckets)
+
+    passes = [(shift, histogram) for shift, histogram in zip(shifts, histograms) if histogram.max() < size]
+
+    with tempfile.TemporaryDirectory(dir=scratch_dir) as directory:
+        scratch = np.memmap(f'{directory}/keys', dtype=source.dtype, mode='w+', shape=source.shape) if len(passes) > 1 else None
+        scratch_indices = None
+        if indices is not None and len(passes) > 1:
+            scratch_indices = np.memmap(f'{directory}/indices', dtype=indices.dtype, mode='w+', shape=source.shape)
+
+        targets = [(target, indices), (scratch, scratch_indices)]
+        step = len(passes) % 2 - 1 #~ Index into `targets`, flipped between 0 & -1 so the last pass writes into `target`
+        read, read_indices = source, None
+
+        if not passes: #~ All keys are equal
+            for start in range(0, size, chunk_size):
+                target[start:start + chunk_size] = source[start:start + chunk_size]
+            if indices is not None:
+                for start in range(0, size, chunk_size):
+                    indices[start:start + chunk_size] = np.arange(start, min(start + chunk_size, size))
+
+        for shift, histogram in passes:
+            write, write_indices = targets[step]
+            cursor = np.cumsum(histogram) - histogram #~ Next free position of every bucket
+
+            for start in range(0, size, chunk_size):
+                chunk = np.asarray(read[start:start + chunk_size])
+                unsigned, _ = _unsigned(chunk)
+                digits = _digits(unsigned, shift, digit_bits)
+
+                order = np.argsort(digits, kind='stable')
+                sorted_digits = digits[order]
+                counts = np.bincount(digits, minlength=buckets)
+                chunk_starts = np.cumsum(counts) - counts
+                positions = cursor[sorted_digits] + (np.arange(len(chunk)) - chunk_starts[sorted_digits])
+
+                write[positions] = chunk[order]
+                if write_indices is not None:
+                    if read_indices is None: #~ First pass, elements come in their original order
+                        write_indices[positions] = start + order
+                    else:
+                        write_indices[positions] = np.asarray(read_indices[start:start + chunk_size])[order]
+                cursor += counts
+
+            read, read_indices = write, write_indices
+            step = ~step
+
+        if isinstance(target, np.memmap):
+            target.flush()
+        if isinstance(indices, np.memmap):
+            indices.flush()
+        scratch = scratch_indices = targets = None #~ Unmaps scratch files before their directory is removed
+
+    return target
+
+
+def _unsigned(keys:np.ndarray) -> tuple[np.ndarray, int]:
+    """Maps integer `keys` to unsigned ones of the same width keeping their order, returns them with the sign bit used.
+    """
+
+    keys = np.asarray(keys)
+    if keys.dtype.kind == 'u':
+        return keys, 0
+    if keys.dtype.kind != 'i':
+        raise TypeError(f"radix & counting sorts need integer keys, got {keys.dtype}")
+
+    flip = 1 << (keys.dtype.itemsize * 8 - 1)
+    unsigned = np.ascontiguousarray(keys, dtype=keys.dtype.newbyteorder('=')).view(f'u{keys.dtype.itemsize}')
+    return unsigned ^ unsigned.dtype.type(flip), flip
+
+
+def _signed(unsigned:np.ndarray, flip:int, dtype:np.dtype) -> np.ndarray:
+    if not flip:
+        return unsigned.astype(dtype, copy=False)
+    return (unsigned ^ unsigned.dtype.type(flip)).view(dtype.newbyteorder('=')).astype(dtype, copy=False)
+
+
+def _shifts(largest:int, digit_bits:int) -> range:
+    """Shifts of digits needed to represent `largest`, none if it is zero.
+    """
+
+    return range(0, largest.bit_length(), digit_bits)
+
+
+def _digits(unsigned:np.ndarray, shift:int, digit_bits:int) -> np.ndarray:
+    width = min(digit_bits, unsigned.dtype.itemsize * 8 - shift) #~ Keys narrower than a digit
+    digits = (unsigned >> unsigned.dtype.type(shift)) & unsigned.dtype.type((1 << width) - 1)
+    return digits.astype(np.uint8 if digit_bits <= 8 else np.uint16)
+
+
+def _digit_order(unsigned:np.ndarray, shift:int, digit_bits:int) -> np.ndarray:
+    """Stable permutation ordering `unsigned` by one digit. NumPy sorts 8 & 16-bit keys by counting, in O(n).
+    """
+
+    return np.argsort(_digits(unsigned, shift, digit_bits), kind='stable')
@@ -0,0 +1,162 @@
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import numpy as np
+
+
+MIN_PARALLEL_SIZE = 1 << 16 #~ Smaller arrays sort faster than workers can be handed their parts
+
+
+def sample_sort(
+    values:np.ndarray,
+    workers:Optional[int]=None,
+    oversampling:int=64,
+    executor:Optional[Executor]=None,
+    seed:int=0,
+) -> np.ndarray: #~ -> O(n log n / workers + n) expected
+    """Sorts `values` across processes with **sample sort** & returns new sorted array.
+
+    Splitters are picked from a sorted random sample of `workers * oversampling` values. Values are copied into
+    a shared memory block, which worker processes attach by name, so no data is pickled. Every step is split
+    between the workers:
+
+    1. each worker assigns buckets to values of its slice of the input & counts them,
+    2. each worker scatters its slice into the output block at offsets derived from all counts, leaving the
+       output grouped by bucket,
+    3. each worker sorts one bucket in place.
+
+    This process only picks splitters, adds up counts & copies values in & out. Values repeated more often
+    than `n / workers` collapse several splitters into one, leaving fewer, bigger buckets.
+
+    Args:
+        values (np.ndarray): One-dimensional array of a fixed-size dtype (numbers, not objects).
+        workers (Optional[int]): Number of slices, buckets & processes, `os.cpu_count()` if `None`. Sorted with
+            `np.sort` in this process if 1 or fewer, or if `values` are shorter than `MIN_PARALLEL_SIZE`.
+        oversampling (int): Sample values per bucket, more give more even buckets.
+        executor (Optional[Executor]): Process pool to reuse, best made by `sample_sort_executor`. A new one
+            with `workers` processes is started (& shut down) per call if `None`.
+        seed (int): Seed of the sample.
+
+    Raises:
+        ValueError: If `values` are not one-dimensional.
+        TypeError: If `values` hold Python objects.
+    """
+
+    values = np.asarray(values)
+    if values.ndim != 1:
+        raise ValueError("sample sort needs a one-dimensional array")
+    if values.dtype.hasobject:
+        raise TypeError("object arrays cannot be placed in shared memory")
+
+    workers = os.cpu_count() if workers is None else workers
+    if workers <= 1 or len(values) < MIN_PARALLEL_SIZE:
+        return np.sort(values)
+
+    sample = np.sort(np.random.default_rng(seed).choice(values, size=workers * oversampling))
+    splitters = np.unique(sample[oversampling::oversampling]) #~ At most `workers - 1`, fewer when values repeat
+    slices = np.linspace(0, len(values), workers + 1).astype(np.int64)
+    spec = (values.dtype.str, len(values))
+
+    blocks = [SharedMemory(create=True, size=values.nbytes) for _ in range(2)]
+    buckets_block = SharedMemory(create=True, size=2 * len(values)) #~ Bucket of every value, `uint16`
+    own_executor = executor is None
+    executor = sample_sort_executor(workers) if own_executor else executor
+    try:
+        source = np.ndarray(values.shape, values.dtype, buffer=blocks[0].buf)
+        source[:] = values
+        names = (blocks[0].name, blocks[1].name, buckets_block.name)
+
+        parts = list(zip(slices, slices[1:]))
+        counts = np.array(_gather(executor, _count, [(names, spec, splitters, start, stop) for start, stop in parts]))
+        sizes = counts.sum(axis=0)
+        bucket_starts = np.cumsum(sizes) - sizes
+        offsets = bucket_starts + np.cumsum(counts, axis=0) - counts #~ Where each slice starts writing into each bucket
+
+        _gather(executor, _scatter, [(names, spec, offsets[i], start, stop) for i, (start, stop) in enumerate(parts)])
+
+        bounds = np.append(bucket_starts, len(values))
+        _gather(executor, _sort_bucket, [(names, spec, start, stop) for start, stop in zip(bounds, bounds[1:]) if stop - start > 1])
+
+        result = np.ndarray(values.shape, values.dtype, buffer=blocks[1].buf).copy()
+        del source #~ Views have to be gone before blocks are closed
+    finally:
+        if own_executor:
+            executor.shutdown()
+        for block in blocks + [buckets_block]:
+            block.close()
+            block.unlink()
+
+    return result
+
+
+def sample_sort_executor(workers:Optional[int]=None) -> ProcessPoolExecutor:
+    """Starts a process pool for `sample_sort` to reuse across calls.
+
+    The resource tracker is started first - before Python 3.13, processes forked without it run trackers of
+    their own, which would try to remove shared memory blocks of `sample_sort` once the processes exit.
+    """
+
+    resource_tracker.ensure_running()
+    return ProcessPoolExecutor(workers)
+
+
+def _gather(executor:Executor, function, tasks:list[tuple]) -> list:
+    futures = [executor.submit(function, *task) for task in tasks]
+    return [future.result() for future in futures]
+
+
+def _attach(names:tuple[str, ...], spec:tuple[str, int]) -> tuple[list[SharedMemory], np.ndarray, np.ndarray, np.ndarray]:
+    """Attaches shared memory blocks of `sample_sort` in a worker, returns them with source, output & bucket arrays.
+    """
+
+    track = {'track': False} if sys.version_info >= (3, 13) else {} #~ Only the creator may unlink
+    blocks = [SharedMemory(name=name, **track) for name in names]
+    dtype, size = spec
+    source, output = (np.ndarray((size,), dtype, buffer=block.buf) for block in blocks[:2])
+    return blocks, source, output, np.ndarray((size,), np.uint16, buffer=blocks[2].buf)
+
+
+def _count(names:tuple[str, ...], spec:tuple[str, int], splitters:np.ndarray, start:int, stop:int) -> np.ndarray:
+    """Assigns buckets to values of `[start, stop)` & returns number of them per bucket.
+    """
+
+    blocks, source, output, buckets = _attach(names, spec)
+    try:
+        buckets[start:stop] = np.searchsorted(splitters, source[start:stop], side='right')
+        return np.bincount(buckets[start:stop], minlength=len(splitters) + 1)
+    finally:
+        del source, output, buckets
+        for block in blocks:
+            block.close()
+
+
+def _scatter(names:tuple[str, ...], spec:tuple[str, int], offsets:np.ndarray, start:int, stop:int):
+    """Writes values of `[start, stop)` into the output, each bucket's values from `offsets` of that bucket on.
+    """
+
+    blocks, source, output, buckets = _attach(names, spec)
+    try:
+        for bucket, offset in enumerate(offsets): #~ One pass per bucket, cheaper than ordering the slice by bucket
+            selected = source[start:stop][buckets[start:stop] == bucket]
+            output[offset:offset + len(selected)] = selected
+    finally:
+        del source, output, buckets
+        for block in blocks:
+            block.close()
+
+
+def _sort_bucket(names:tuple[str, ...], spec:tuple[str, int], start:int, stop:int):
+    """Sorts `[start, stop)` of the output in place.
+    """
+
+    blocks, source, output, buckets = _attach(names, spec)
+    try:
+        output[start:stop].sort()
+    finally:
+        del source, output, buckets
+        for block in blocks:
+            block.close()
@@ -0,0 +1,231 @@
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass
+class SortStats:
+    """Counters collected by a sort run.
+    """
+
+    comparisons:int = 0 #~ Filled in by the harness, which counts `<` on wrapped values
+    swaps:int = 0 #~ Exchanges of two elements, or element writes for sorts that move instead of exchanging
+
+
+@dataclass(frozen=True)
+class SortAlgorithm:
+    """Entry of the `SORTS` registry.
+    """
+
+    name:str
+    function:Callable[[list, Optional[SortStats]], None] #~ Sorts list in place, counting into stats if given
+    comparison_based:bool = True #~ Values may be wrapped to count comparisons
+    max_size:Optional[int] = None #~ Larger inputs are skipped, e.g. for O(n^2) sorts
+    counts_swaps:bool = True
+
+
+SORTS:dict[str, SortAlgorithm] = {}
+
+
+def register(name:str, comparison_based:bool=True, max_size:Optional[int]=None, counts_swaps:bool=True) -> Callable:
+    """Adds decorated sort function to `SORTS` under `name`.
+    """
+
+    def decorator(function:Callable) -> Callable:
+        SORTS[name] = SortAlgorithm(name, function, comparison_based, max_size, counts_swaps)
+        return function
+
+    return decorator
+
+
+@register('insertion', max_size=5_000)
+def insertion_sort(values:list, stats:Optional[SortStats]=None): #! -> O(n^2), O(n) on sorted input
+    """Sorts `values` in place by shifting every element left past greater ones. Stable.
+    """
+
+    for i in range(1, len(values)):
+        value = values[i]
+        j = i - 1
+        while j >= 0 and value < values[j]:
+            values[j + 1] = values[j]
+            j -= 1
+        values[j + 1] = value
+
+        if stats is not None:
+            stats.swaps += i - j #~ Shifts plus the final write
+
+
+@register('merge')
+def merge_sort(values:list, stats:Optional[SortStats]=None): #~ -> O(n log n), O(n) extra space
+    """Sorts `values` in place with bottom-up merge sort, ping-ponging between `values` & one buffer. Stable.
+    """
+
+    size = len(values)
+    source, target = values, values[:]
+    width = 1
+
+    while width < size:
+        for start in range(0, size, 2 * width):
+            middle, end = min(start + width, size), min(start + 2 * width, size)
+            i, j = start, middle
+
+            for k in range(start, end):
+                if j < end and (i >= middle or source[j] < source[i]): #~ Right side only wins strictly, keeps stability
+                    target[k] = source[j]
+                    j += 1
+                else:
+                    target[k] = source[i]
+                    i += 1
+
+        if stats is not None:
+            stats.swaps += size
+        source, target = target, source
+        width *= 2
+
+    if source is not values: #~ Result ended up in the buffer
+        values[:] = source
+        if stats is not None:
+            stats.swaps += size
+
+
+@register('heap')
+def heap_sort(values:list, stats:Optional[SortStats]=None): #~ -> O(n log n), O(1) extra space
+    """Sorts `values` in place by building a max-heap & repeatedly moving its root to the end. Not stable.
+    """
+
+    size = len(values)
+
+    for start in range(size // 2 - 1, -1, -1):
+        _sift_down(values, start, size, stats)
+
+    for end in range(size - 1, 0, -1):
+        values[0], values[end] = values[end], values[0]
+        if stats is not None:
+            stats.swaps += 1
+        _sift_down(values, 0, end, stats)
+
+
+def _sift_down(values:list, root:int, end:int, stats:Optional[SortStats]):
+    while True:
+        child = 2 * root + 1
+        if child >= end:
+            return
+        if child + 1 < end and values[child] < values[child + 1]: #~ Bigger of the two children
+            child += 1
+        if not values[root] < values[child]:
+            return
+
+        values[root], values[child] = values[child], values[root]
+        if stats is not None:
+            stats.swaps += 1
+        root = child
+
+
+SMALL_PARTITION = 16 #~ Quick sort leaves partitions this small to insertion sort
+
+
+@register('quick')
+def quick_sort(values:list, stats:Optional[SortStats]=None): #~ -> O(n log n) expected, O(log n) extra space
+    """Sorts `values` in place with quick sort - median-of-three pivot & Hoare partitioning. Not stable.
+
+    Partitions are processed from an explicit stack, always pushing the larger one, so the stack stays
+    O(log n) deep. Small partitions are finished with insertion sort.
+    """
+
+    stack = [(0, len(values) - 1)]
+
+    while stack:
+        low, high = stack.pop()
+
+        if high - low < SMALL_PARTITION:
+            _insertion_sort_range(values, low, high, stats)
+            continue
+
+        middle = (low + high) // 2 #~ Orders low, middle & high, the median ends up in the middle
+        if values[middle] < values[low]:
+            _swap(values, middle, low, stats)
+        if values[high] < values[low]:
+            _swap(values, high, low, stats)
+        if values[high] < values[middle]:
+            _swap(values, high, middle, stats)
+        pivot = values[middle]
+
+        i, j = low - 1, high + 1
+        while True:
+            i += 1
+            while values[i] < pivot:
+                i += 1
+            j -= 1
+            while pivot < values[j]:
+                j -= 1
+            if i >= j:
+                break
+            _swap(values, i, j, stats)
+
+        if j - low > high - j - 1: #~ Larger partition goes first on the stack, the smaller one is popped next
+            stack.append((low, j))
+            stack.append((j + 1, high))
+        else:
+            stack.append((j + 1, high))
+            stack.append((low, j))
+
+
+def _swap(values:list, i:int, j:int, stats:Optional[SortStats]):
+    values[i], values[j] = values[j], values[i]
+    if stats is not None:
+        stats.swaps += 1
+
+
+def _insertion_sort_range(values:list, low:int, high:int, stats:Optional[SortStats]):
+    for i in range(low + 1, high + 1):
+        value = values[i]
+        j = i - 1
+        while j >= low and value < values[j]:
+            values[j + 1] = values[j]
+            j -= 1
+        values[j + 1] = value
+
+        if stats is not None:
+            stats.swaps += i - j
+
+
+RADIX_BITS = 8
+
+
+@register('radix', comparison_based=False)
+def radix_sort(values:list, stats:Optional[SortStats]=None): #~ -> O(n * bytes per key)
+    """Sorts integer `values` in place with LSD radix sort, one byte per pass. Stable.
+
+    Negative numbers are handled by offsetting everything by the minimum. Passes stop as soon as the
+    remaining bytes of every key are zero.
+
+    Raises:
+        TypeError: If some value is not an `int`.
+    """
+
+    if len(values) < 2:
+        return
+    if not all(type(value) is int for value in values):
+        raise TypeError("radix sort needs int values")
+
+    offset = min(values)
+    span = max(values) - offset
+    mask = (1 << RADIX_BITS) - 1
+    shift = 0
+
+    while span >> shift:
+        buckets = [[] for _ in range(1 << RADIX_BITS)]
+        for value in values:
+            buckets[((value - offset) >> shift) & mask].append(value)
+
+        values[:] = [value for bucket in buckets for value in bucket]
+        if stats is not None:
+            stats.swaps += len(values)
+        shift += RADIX_BITS
+
+
+@register('timsort', counts_swaps=False)
+def timsort(values:list, stats:Optional[SortStats]=None): #~ -> O(n log n), O(n) on presorted runs
+    """Baseline - built-in `list.sort`. Its element moves are not observable, so swaps are not counted.
+    """
+
+    values.sort()
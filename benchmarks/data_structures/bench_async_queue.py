@@ -0,0 +1,88 @@
+"""End-to-end latency of `AsyncQueue` versus polling `DoubleLinkedList.pop_head()` in a sleep loop, under many producers.
+
+Each producer puts timestamped values at a fixed rate; a single consumer drains them (`get_batch` for `AsyncQueue`)
+and records put-to-get latency:
+
+    python -m benchmarks.data_structures.bench_async_queue --producers 1000 --messages 20 --interval 0.005
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from algorithms.data_structures.async_queue import AsyncQueue
+from algorithms.data_structures.double_linked_list import DoubleLinkedList
+
+
+async def produce(put, messages:int, interval:float):
+    for _ in range(messages):
+        await put(time.perf_counter())
+        await asyncio.sleep(interval)
+
+
+async def run_async_queue(producers:int, messages:int, interval:float, maxsize:int, batch:int) -> tuple[list, float]:
+    queue = AsyncQueue(maxsize=maxsize)
+    latencies = []
+    total = producers * messages
+
+    async def consume():
+        while len(latencies) < total:
+            for sent in await queue.get_batch(batch):
+                latencies.append(time.perf_counter() - sent)
+
+    cpu = time.process_time()
+    await asyncio.gather(consume(), *(produce(queue.put, messages, interval) for _ in range(producers)))
+    return latencies, time.process_time() - cpu
+
+
+async def run_polling(producers:int, messages:int, interval:float, poll:float) -> tuple[list, float]:
+    items = DoubleLinkedList()
+    latencies = []
+    total = producers * messages
+
+    async def put(value):
+        items.append(value)
+
+    async def consume():
+        while len(latencies) < total:
+            sent = items.pop_head()
+            if sent is None:
+                await asyncio.sleep(poll)
+            else:
+                latencies.append(time.perf_counter() - sent)
+
+    cpu = time.process_time()
+    await asyncio.gather(consume(), *(produce(put, messages, interval) for _ in range(producers)))
+    return latencies, time.process_time() - cpu
+
+
+def report(name:str, latencies:list, cpu:float):
+    latencies = sorted(latencies)
+    p50 = latencies[len(latencies) // 2] * 1e3
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e3
+    print(f"{name:<24}{statistics.fmean(latencies) * 1e3:>10.3f}{p50:>10.3f}{p99:>10.3f}{cpu:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--producers', type=int, default=1000)
+    parser.add_argument('--messages', type=int, default=20, help="Values put by each producer")
+    parser.add_argument('--interval', type=float, default=0.005, help="Seconds between values of one producer")
+    parser.add_argument('--maxsize', type=int, default=1024, help="AsyncQueue capacity, 0 for unbounded")
+    parser.add_argument('--batch', type=int, default=256, help="AsyncQueue get_batch size")
+    parser.add_argument('--poll', type=float, nargs='+', default=[0.001, 0.0], help="Sleep of the polling consumer")
+    args = parser.parse_args()
+
+    print(f"{'consumer':<24}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}{'cpu s':>10}")
+    report('AsyncQueue.get_batch', *asyncio.run(
+        run_async_queue(args.producers, args.messages, args.interval, args.maxsize, args.batch)
+    ))
+    for poll in args.poll:
+        report(f"polling sleep({poll})", *asyncio.run(
+            run_polling(args.producers, args.messages, args.interval, poll)
+        ))
+
+
+if __name__ == '__main__':
+    main()
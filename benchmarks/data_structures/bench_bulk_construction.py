@@ -0,0 +1,40 @@
+"""Compares building linked lists with per-element `append` against `from_iterable`.
+
+    python -m benchmarks.data_structures.bench_bulk_construction --size 1000000
+"""
+
+import argparse
+import time
+
+from algorithms.data_structures.double_linked_list import DoubleLinkedList
+from algorithms.data_structures.single_linked_list import SingleLinkedList
+
+
+def build_with_append(cls, size:int) -> float:
+    start = time.perf_counter()
+    ll = cls()
+    for i in range(size):
+        ll.append(i)
+    return time.perf_counter() - start
+
+
+def build_with_from_iterable(cls, size:int) -> float:
+    start = time.perf_counter()
+    cls.from_iterable(range(size))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{'container':<20}{'append [s]':>14}{'from_iterable [s]':>20}{'speedup':>10}")
+    for cls in (SingleLinkedList, DoubleLinkedList):
+        appended = build_with_append(cls, args.size)
+        bulk = build_with_from_iterable(cls, args.size)
+        print(f"{cls.__name__:<20}{appended:>14.3f}{bulk:>20.3f}{appended / bulk:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
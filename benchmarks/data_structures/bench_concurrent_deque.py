@@ -0,0 +1,99 @@
+"""Multi-threaded producer/consumer throughput of `ConcurrentDeque`, a coarse-locked `DoubleLinkedList` & `queue.Queue`.
+
+The gap between the two-lock deque & the coarse lock is widest on free-threaded (3.13t+) builds:
+
+    python -m benchmarks.data_structures.bench_concurrent_deque --items 200000 --threads 1 2 4 8
+"""
+
+import argparse
+import queue
+import threading
+import time
+
+from algorithms.data_structures.concurrent_deque import ConcurrentDeque
+from algorithms.data_structures.double_linked_list import DoubleLinkedList
+
+
+class CoarseLockedList:
+    """Baseline - every operation of a `DoubleLinkedList` under one global lock."""
+
+    def __init__(self):
+        self._list = DoubleLinkedList()
+        self._not_empty = threading.Condition()
+
+    def append(self, value):
+        with self._not_empty:
+            self._list.append(value)
+            self._not_empty.notify()
+
+    def pop_head(self, timeout=None):
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: len(self._list), timeout):
+                return None
+            return self._list.pop_head()
+
+
+class QueueAdapter:
+    def __init__(self):
+        self._queue = queue.Queue()
+
+    def append(self, value):
+        self._queue.put(value)
+
+    def pop_head(self, timeout=None):
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+CONTAINERS = {
+    'ConcurrentDeque': ConcurrentDeque,
+    'CoarseLockedList': CoarseLockedList,
+    'queue.Queue': QueueAdapter,
+}
+
+
+def items_per_second(factory, items:int, threads:int) -> float:
+    """Runs `threads` producers & `threads` consumers exchanging `items` values in total."""
+    container = factory()
+    per_producer = items // threads
+
+    def produce():
+        for i in range(per_producer):
+            container.append(i)
+
+    def consume():
+        while container.pop_head(timeout=None) is not None:
+            pass
+
+    consumers = [threading.Thread(target=consume) for _ in range(threads)]
+    producers = [threading.Thread(target=produce) for _ in range(threads)]
+
+    start = time.perf_counter()
+    for thread in consumers + producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    for _ in consumers:
+        container.append(None) #~ Stops one consumer
+    for thread in consumers:
+        thread.join()
+
+    return per_producer * threads / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=200_000)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print(f"{'threads':>8}" + ''.join(f"{name + ' items/s':>26}" for name in CONTAINERS))
+    for threads in args.threads:
+        row = ''.join(f"{items_per_second(factory, args.items, threads):>26,.0f}" for factory in CONTAINERS.values())
+        print(f"{threads:>8}{row}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Measures the finger cache of `DoubleLinkedList` on local & random positional access traces.
+
+The "cold" column drops the finger before each operation, i.e. always walks from the closer end:
+
+    python -m benchmarks.data_structures.bench_finger_cache --size 100000 --operations 5000
+"""
+
+import argparse
+import random
+import time
+
+from algorithms.data_structures.double_linked_list import DoubleLinkedList
+
+
+def local_trace(size:int, operations:int, rng:random.Random) -> list[int]:
+    """Deletes around a slowly drifting position, like `delete(i)` followed by `delete(i+1)`."""
+    pos_idx, trace = size // 3, []
+    for _ in range(operations):
+        pos_idx = max(0, min(size - len(trace) - 2, pos_idx + rng.randrange(-2, 3)))
+        trace.append(pos_idx)
+    return trace
+
+
+def random_trace(size:int, operations:int, rng:random.Random) -> list[int]:
+    return [rng.randrange(size - i - 1) for i in range(operations)]
+
+
+def replay(trace:list[int], size:int, cold:bool) -> tuple[float, DoubleLinkedList]:
+    dll = DoubleLinkedList()
+    for i in range(size):
+        dll.append(i)
+
+    start = time.perf_counter()
+    for pos_idx in trace:
+        if cold:
+            dll._finger = None
+        dll.delete(pos_idx)
+    return time.perf_counter() - start, dll
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=100_000)
+    parser.add_argument('--operations', type=int, default=5_000)
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    print(f"{'trace':<8}{'cold [s]':>12}{'finger [s]':>12}{'hits':>10}{'misses':>10}")
+    for name, trace_factory in [('local', local_trace), ('random', random_trace)]:
+        trace = trace_factory(args.size, args.operations, rng)
+        cold, _ = replay(trace, args.size, cold=True)
+        warm, dll = replay(trace, args.size, cold=False)
+        print(f"{name:<8}{cold:>12.4f}{warm:>12.4f}{dll.finger_hits:>10}{dll.finger_misses:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Compares random positional `__getitem__`/`insert`/`delete` on `IndexedDoubleLinkedList` & `DoubleLinkedList`.
+
+    python -m benchmarks.data_structures.bench_indexed_double_linked_list --sizes 1000 10000 100000
+"""
+
+import argparse
+import random
+import time
+
+from algorithms.data_structures.double_linked_list import DoubleLinkedList
+from algorithms.data_structures.indexed_double_linked_list import IndexedDoubleLinkedList
+
+
+CONTAINERS = {
+    'DoubleLinkedList': DoubleLinkedList,
+    'IndexedDoubleLinkedList': IndexedDoubleLinkedList,
+}
+
+
+def positional_ops_per_second(factory, size:int, operations:int) -> float:
+    dll = factory()
+    for i in range(size):
+        dll.append(i)
+    rng = random.Random(0)
+
+    start = time.perf_counter()
+    for i in range(operations):
+        pos_idx = rng.randrange(len(dll))
+        if i % 3 == 0:
+            dll[pos_idx]
+        elif i % 3 == 1:
+            dll.insert(pos_idx, i)
+        else:
+            dll.delete(pos_idx)
+    return operations / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--operations', type=int, default=3_000)
+    args = parser.parse_args()
+
+    print(f"{'size':>10}" + ''.join(f"{name + ' ops/s':>30}" for name in CONTAINERS))
+    for size in args.sizes:
+        row = ''.join(f"{positional_ops_per_second(factory, size, args.operations):>30,.0f}" for factory in CONTAINERS.values())
+        print(f"{size:>10,}{row}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Compares full traversal of `DoubleLinkedList`/`SingleLinkedList` with `list` & `collections.deque` iteration.
+
+The "manual walk" rows follow `node.next` by hand, as callers had to before the lists became iterable:
+
+    python -m benchmarks.data_structures.bench_iteration --size 1000000 --repeat 5
+"""
+
+import argparse
+import timeit
+from collections import deque
+
+from algorithms.data_structures.double_linked_list import DoubleLinkedList
+from algorithms.data_structures.single_linked_list import SingleLinkedList
+
+
+def manual_walk(ll) -> int:
+    count = 0
+    node = ll.head
+    while node is not None:
+        count += 1
+        node = node.next
+    return count
+
+
+def consume(iterable) -> int:
+    count = 0
+    for _ in iterable:
+        count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    values = list(range(args.size))
+    dq = deque(values)
+    dll = DoubleLinkedList.from_iterable(values)
+    sll = SingleLinkedList.from_iterable(values)
+
+    cases = [
+        ('list', lambda: consume(values)),
+        ('deque', lambda: consume(dq)),
+        ('reversed(deque)', lambda: consume(reversed(dq))),
+        ('DoubleLinkedList', lambda: consume(dll)),
+        ('reversed(DoubleLinkedList)', lambda: consume(reversed(dll))),
+        ('DoubleLinkedList manual walk', lambda: manual_walk(dll)),
+        ('SingleLinkedList', lambda: consume(sll)),
+        ('SingleLinkedList manual walk', lambda: manual_walk(sll)),
+        ('x in DoubleLinkedList (miss)', lambda: -1 in dll),
+        ('x in list (miss)', lambda: -1 in values),
+    ]
+
+    print(f"{'traversal':<32}{'ns/element':>12}")
+    for name, case in cases:
+        best = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        print(f"{name:<32}{best / args.size * 1e9:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
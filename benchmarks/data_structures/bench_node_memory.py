@@ -0,0 +1,50 @@
+"""Reports bytes per element of the linked lists, measured with `tracemalloc`.
+
+Meant to be run on every release to catch memory regressions:
+
+    python -m benchmarks.data_structures.bench_node_memory --sizes 1000 100000 1000000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from algorithms.data_structures.double_linked_list import DoubleLinkedList
+from algorithms.data_structures.single_linked_list import SingleLinkedList
+from algorithms.data_structures.unrolled_double_linked_list import UnrolledDoubleLinkedList
+
+
+CONTAINERS = {
+    'SingleLinkedList': SingleLinkedList,
+    'DoubleLinkedList': DoubleLinkedList,
+    'UnrolledDoubleLinkedList': UnrolledDoubleLinkedList,
+}
+
+
+def bytes_per_element(factory, size:int) -> float:
+    """Measures bytes allocated by the container itself (values are preallocated ints)."""
+    values = list(range(size))
+    gc.collect()
+    tracemalloc.start()
+    container = factory()
+    for value in values:
+        container.append(value)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return current / size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'container':<26}" + ''.join(f"{size:>12,}" for size in args.sizes))
+    for name, factory in CONTAINERS.items():
+        row = ''.join(f"{bytes_per_element(factory, size):>12.1f}" for size in args.sizes)
+        print(f"{name:<26}{row}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Measures `PersistentLinkedList` operations per second under each fsync policy, plus reopen time.
+
+Each run appends `--operations` values, then drains them with `pop_head`. Results depend heavily on the
+filesystem - `'always'` issues two `msync` calls per operation:
+
+    python -m benchmarks.data_structures.bench_persistent_linked_list --operations 100000 --dir /var/tmp
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from algorithms.data_structures.persistent_linked_list import FSYNC_POLICIES, PersistentLinkedList
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--operations', type=int, default=100_000)
+    parser.add_argument('--always-operations', type=int, default=2_000, help="Operations for the 'always' policy")
+    parser.add_argument('--batch-size', type=int, default=1024)
+    parser.add_argument('--dir', type=str, default=None, help="Directory for the list files")
+    args = parser.parse_args()
+
+    print(f"{'fsync':<10}{'append ops/s':>16}{'pop_head ops/s':>16}{'reopen [ms]':>14}")
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        for fsync in FSYNC_POLICIES:
+            operations = args.always_operations if fsync == 'always' else args.operations
+            path = Path(directory) / f"{fsync}.pll"
+
+            with PersistentLinkedList(path, capacity=operations, fsync=fsync, batch_size=args.batch_size) as pll:
+                start = time.perf_counter()
+                for i in range(operations):
+                    pll.append(i)
+                append_rate = operations / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            pll = PersistentLinkedList(path, fsync=fsync, batch_size=args.batch_size)
+            reopen = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(operations):
+                pll.pop_head()
+            pop_rate = operations / (time.perf_counter() - start)
+            pll.close()
+
+            print(f"{fsync:<10}{append_rate:>16,.0f}{pop_rate:>16,.0f}{reopen * 1e3:>14.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Measures pickling & the compact binary format of linked lists against a plain `list`.
+
+Lists hold `--size` floats. Pickling the node chain itself (what `pickle` did before lists got `__reduce__`)
+raises `RecursionError` after a few thousand nodes, so it is not measured:
+
+    python -m benchmarks.data_structures.bench_serialization --size 1000000
+"""
+
+import argparse
+import pickle
+import time
+
+from algorithms.data_structures.double_linked_list import DoubleLinkedList
+from algorithms.data_structures.single_linked_list import SingleLinkedList
+
+
+def timed(function) -> tuple[float, object]:
+    start = time.perf_counter()
+    output = function()
+    return time.perf_counter() - start, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    values = [i * 0.5 for i in range(args.size)]
+    containers = {
+        'list': values,
+        'DoubleLinkedList': DoubleLinkedList.from_iterable(values),
+        'SingleLinkedList': SingleLinkedList.from_iterable(values),
+    }
+
+    print(f"{'container':<18}{'format':<10}{'dump [s]':>10}{'load [s]':>10}{'size [MB]':>11}")
+    for name, container in containers.items():
+        dump, data = timed(lambda: pickle.dumps(container, protocol=pickle.HIGHEST_PROTOCOL))
+        load, _ = timed(lambda: pickle.loads(data))
+        print(f"{name:<18}{'pickle':<10}{dump:>10.3f}{load:>10.3f}{len(data) / 1e6:>11.1f}")
+
+        if name != 'list':
+            dump, data = timed(lambda: container.to_bytes('d'))
+            load, _ = timed(lambda: type(container).from_bytes(data))
+            print(f"{name:<18}{'to_bytes':<10}{dump:>10.3f}{load:>10.3f}{len(data) / 1e6:>11.1f}")
+
+
+if __name__ == '__main__':
+    main()
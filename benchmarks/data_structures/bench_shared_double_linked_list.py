@@ -0,0 +1,91 @@
+"""Cross-process producer/consumer throughput of `SharedDoubleLinkedList` versus `multiprocessing.Queue`.
+
+Producers & consumers are separate processes. `multiprocessing.Queue` pickles every value through a pipe,
+`SharedDoubleLinkedList` packs it into a shared memory slot under a lock:
+
+    python -m benchmarks.data_structures.bench_shared_double_linked_list --items 200000 --processes 1 2 4
+"""
+
+import argparse
+import multiprocessing
+import time
+
+from algorithms.data_structures.shared_double_linked_list import SharedDoubleLinkedList
+
+
+STOP = -1
+
+
+def produce_shared(shared_list, count:int):
+    for value in range(count):
+        while True:
+            try:
+                shared_list.append(value)
+                break
+            except MemoryError: #~ Arena full, let consumers catch up
+                time.sleep(0)
+    shared_list.close()
+
+
+def consume_shared(shared_list):
+    while True:
+        value = shared_list.pop_head()
+        if value is None:
+            time.sleep(0)
+        elif value == STOP:
+            break
+    shared_list.close()
+
+
+def produce_queue(channel, count:int):
+    for value in range(count):
+        channel.put(value)
+
+
+def consume_queue(channel):
+    while channel.get() != STOP:
+        pass
+
+
+def run(produce, consume, channel, stop, items:int, processes:int) -> float:
+    per_producer = items // processes
+    consumers = [multiprocessing.Process(target=consume, args=(channel,)) for _ in range(processes)]
+    producers = [multiprocessing.Process(target=produce, args=(channel, per_producer)) for _ in range(processes)]
+
+    start = time.perf_counter()
+    for process in consumers + producers:
+        process.start()
+    for process in producers:
+        process.join()
+    for _ in consumers:
+        stop(STOP)
+    for process in consumers:
+        process.join()
+
+    return per_producer * processes / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=200_000)
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4], help="Producers (and as many consumers)")
+    parser.add_argument('--capacity', type=int, default=65_536, help="Slots of the shared arena")
+    args = parser.parse_args()
+
+    print(f"{'processes':>10}{'SharedDoubleLinkedList items/s':>34}{'multiprocessing.Queue items/s':>34}")
+    for processes in args.processes:
+        shared_list = SharedDoubleLinkedList(args.capacity, 'q')
+        try:
+            shared_rate = run(produce_shared, consume_shared, shared_list, shared_list.append, args.items, processes)
+        finally:
+            shared_list.close()
+            shared_list.unlink()
+
+        channel = multiprocessing.Queue()
+        queue_rate = run(produce_queue, consume_queue, channel, channel.put, args.items, processes)
+
+        print(f"{processes:>10}{shared_rate:>34,.0f}{queue_rate:>34,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Compares full tail-drain times of `SingleLinkedList` with & without `predecessor_index`.
+
+Without the index every `pop_tail` walks from head, so the baseline is skipped above `--max-baseline`:
+
+    python -m benchmarks.data_structures.bench_single_linked_list_tail_drain --sizes 1000 10000 100000
+"""
+
+import argparse
+import time
+
+from algorithms.data_structures.single_linked_list import SingleLinkedList
+
+
+def drain_seconds(size:int, predecessor_index:bool) -> float:
+    ll = SingleLinkedList(predecessor_index=predecessor_index)
+    for i in range(size):
+        ll.append(i)
+
+    start = time.perf_counter()
+    while ll.pop_tail() is not None:
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--max-baseline', type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{'size':>10}{'baseline [s]':>16}{'indexed [s]':>16}{'speedup':>10}")
+    for size in args.sizes:
+        indexed = drain_seconds(size, predecessor_index=True)
+        if size > args.max_baseline:
+            print(f"{size:>10,}{'skipped':>16}{indexed:>16.4f}{'-':>10}")
+            continue
+        baseline = drain_seconds(size, predecessor_index=False)
+        print(f"{size:>10,}{baseline:>16.4f}{indexed:>16.4f}{baseline / indexed:>9.0f}x")
+
+
+if __name__ == '__main__':
+    main()
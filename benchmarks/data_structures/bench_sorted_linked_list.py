@@ -0,0 +1,130 @@
+"""Compares `SortedLinkedList` with `bisect.insort` on a `list`, `heapq` & a `DoubleLinkedList` walked from head.
+
+Queues are filled with `size` random values, then timed on two workloads: "push/pop" alternates inserting a
+random value & popping the minimum (a priority queue), "insert/remove" inserts one random value & removes
+another by value (an ordered set with cancellations - `heapq` has to re-heapify). Linear time queues - the head
+walk & `heapq` removing by value - are skipped for sizes above `--max-linear-size`:
+
+    python -m benchmarks.data_structures.bench_sorted_linked_list --sizes 1000 10000 100000 1000000
+"""
+
+import argparse
+import bisect
+import heapq
+import random
+import time
+
+from algorithms.data_structures.double_linked_list import DoubleLinkedList
+from algorithms.data_structures.sorted_linked_list import SortedLinkedList
+
+
+class SortedListQueue:
+    def __init__(self, values):
+        self.values = sorted(values)
+
+    def push(self, value):
+        bisect.insort(self.values, value)
+
+    def pop_min(self):
+        return self.values.pop(0)
+
+    def remove(self, value):
+        del self.values[bisect.bisect_left(self.values, value)]
+
+
+class HeapQueue:
+    def __init__(self, values):
+        self.values = list(values)
+        heapq.heapify(self.values)
+
+    def push(self, value):
+        heapq.heappush(self.values, value)
+
+    def pop_min(self):
+        return heapq.heappop(self.values)
+
+    def remove(self, value):
+        self.values.remove(value)
+        heapq.heapify(self.values)
+
+
+class SkipListQueue:
+    def __init__(self, values):
+        self.values = SortedLinkedList.from_iterable(values)
+        self.push, self.pop_min, self.remove = self.values.add, self.values.pop_min, self.values.remove
+
+
+class WalkedQueue:
+    """What ordered queues did before - walks from head to the insertion point."""
+
+    def __init__(self, values):
+        self.values = DoubleLinkedList.from_iterable(sorted(values))
+
+    def push(self, value):
+        pos_idx, current_node = 0, self.values.head
+        while current_node is not None and not value < current_node.value:
+            pos_idx, current_node = pos_idx + 1, current_node.next
+        self.values.insert(pos_idx, value)
+
+    def pop_min(self):
+        return self.values.pop_head()
+
+    def remove(self, value):
+        current_node = self.values.head
+        while current_node.value != value:
+            current_node = current_node.next
+        self.values.remove_node(current_node)
+
+
+QUEUES = {
+    'SortedLinkedList': SkipListQueue,
+    'bisect.insort': SortedListQueue,
+    'heapq': HeapQueue,
+    'DLL head walk': WalkedQueue,
+}
+
+LINEAR = {('DLL head walk', 'push/pop'), ('DLL head walk', 'insert/remove'), ('heapq', 'insert/remove')}
+
+
+def ops_per_second(factory, size:int, operations:int, workload:str) -> float:
+    rng = random.Random(0)
+    values = [rng.random() for _ in range(size)]
+    queue = factory(values)
+    present = values[:] #~ Values in the queue, for picking ones to remove
+
+    start = time.perf_counter()
+    for _ in range(operations):
+        value = rng.random()
+        queue.push(value)
+        if workload == 'push/pop':
+            queue.pop_min()
+        else:
+            present.append(value)
+            i = rng.randrange(len(present))
+            present[i], present[-1] = present[-1], present[i]
+            queue.remove(present.pop())
+    return 2 * operations / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument('--operations', type=int, default=20_000)
+    parser.add_argument('--max-linear-size', type=int, default=10_000)
+    args = parser.parse_args()
+
+    for workload in ('push/pop', 'insert/remove'):
+        print(f"{workload:<14}{'size':>10}" + ''.join(f"{name + ' ops/s':>24}" for name in QUEUES))
+        for size in args.sizes:
+            row = ''
+            for name, factory in QUEUES.items():
+                if (name, workload) in LINEAR and size > args.max_linear_size:
+                    row += f"{'-':>24}"
+                else:
+                    row += f"{ops_per_second(factory, size, args.operations, workload):>24,.0f}"
+            print(f"{'':<14}{size:>10,}{row}")
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Compares memory per element & append/pop throughput of `UnrolledDoubleLinkedList`
+against `DoubleLinkedList` and `collections.deque`.
+
+Run from the repository root:
+
+    python -m benchmarks.data_structures.bench_unrolled_double_linked_list --size 1000000
+"""
+
+import argparse
+import time
+from collections import deque
+
+from benchmarks.data_structures.bench_node_memory import bytes_per_element
+from algorithms.data_structures.double_linked_list import DoubleLinkedList
+from algorithms.data_structures.unrolled_double_linked_list import UnrolledDoubleLinkedList
+
+
+CONTAINERS = {
+    'deque': deque,
+    'DoubleLinkedList': DoubleLinkedList,
+    'UnrolledDoubleLinkedList': UnrolledDoubleLinkedList,
+}
+
+
+def throughput(factory, size:int) -> dict[str, float]:
+    """Measures millions of operations per second for append, pop_head & pop_tail."""
+    container = factory()
+    pop_head = container.popleft if isinstance(container, deque) else container.pop_head
+    pop_tail = container.pop if isinstance(container, deque) else container.pop_tail
+    output = {}
+
+    start = time.perf_counter()
+    for i in range(size):
+        container.append(i)
+    output['append'] = size / (time.perf_counter() - start) / 1e6
+
+    start = time.perf_counter()
+    for _ in range(size//2):
+        pop_head()
+    for _ in range(size - size//2):
+        pop_tail()
+    output['pop'] = size / (time.perf_counter() - start) / 1e6
+
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{'container':<26}{'bytes/elem':>12}{'append Mops/s':>16}{'pop Mops/s':>14}")
+    for name, factory in CONTAINERS.items():
+        memory = bytes_per_element(factory, args.size)
+        speed = throughput(factory, args.size)
+        print(f"{name:<26}{memory:>12.1f}{speed['append']:>16.2f}{speed['pop']:>14.2f}")
+
+
+if __name__ == '__main__':
+    main()
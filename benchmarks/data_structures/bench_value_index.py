@@ -0,0 +1,99 @@
+"""Reports memory overhead of `value_index` against the speedup of `in`, `index_of` & `remove_value` it buys.
+
+Lists hold `size` distinct ints. Memory is measured with `tracemalloc` while building them (values are
+preallocated). Lookups are timed on random queries, half of them missing - scans stop halfway on average for
+present values & go through the whole list for missing ones. `index_of` & `remove_value` are timed on present
+values - `index_of` still counts the position of the node the index finds, so it gains the least:
+
+    python -m benchmarks.data_structures.bench_value_index --sizes 1000 10000 100000 1000000
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from algorithms.data_structures.double_linked_list import DoubleLinkedList
+from algorithms.data_structures.single_linked_list import SingleLinkedList
+
+
+CONTAINERS = {
+    'SingleLinkedList': SingleLinkedList,
+    'DoubleLinkedList': DoubleLinkedList,
+}
+
+
+def bytes_per_element(factory, values:list, value_index:bool) -> float:
+    gc.collect()
+    tracemalloc.start()
+    container = factory.from_iterable(values, value_index=value_index)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return current / len(values)
+
+
+def lookups_per_second(container, queries:list) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        query in container
+    return len(queries) / (time.perf_counter() - start)
+
+
+def index_lookups_per_second(container, queries:list) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        container.index_of(query)
+    return len(queries) / (time.perf_counter() - start)
+
+
+def removals_per_second(container, queries:list) -> float:
+    """Removes present values & adds them back, so that the list keeps its size."""
+    start = time.perf_counter()
+    for query in queries:
+        container.remove_value(query)
+        container.append(query)
+    return len(queries) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument('--queries', type=int, default=100_000, help="queries against indexed lists")
+    parser.add_argument('--scan-work', type=int, default=20_000_000, help="node visits spent on scanning lists")
+    args = parser.parse_args()
+
+    print(
+        f"{'container':<18}{'size':>11}{'B/elem':>9}{'indexed':>9}{'in/s':>12}{'indexed':>12}{'speedup':>9}"
+        f"{'index_of/s':>12}{'indexed':>12}{'speedup':>9}{'remove/s':>12}{'indexed':>12}{'speedup':>9}"
+    )
+    for name, factory in CONTAINERS.items():
+        for size in args.sizes:
+            rng = random.Random(0)
+            values = list(range(size))
+            plain_bytes = bytes_per_element(factory, values, False)
+            indexed_bytes = bytes_per_element(factory, values, True)
+
+            plain, indexed = factory.from_iterable(values), factory.from_iterable(values, value_index=True)
+            scan_queries = max(10, args.scan_work // size)
+            queries = [rng.randrange(2 * size) for _ in range(args.queries)]
+            present = [rng.randrange(size) for _ in range(args.queries)]
+
+            plain_lookups = lookups_per_second(plain, queries[:scan_queries])
+            indexed_lookups = lookups_per_second(indexed, queries)
+            plain_index_lookups = index_lookups_per_second(plain, present[:scan_queries])
+            indexed_index_lookups = index_lookups_per_second(indexed, present)
+            plain_removals = removals_per_second(plain, present[:scan_queries])
+            indexed_removals = removals_per_second(indexed, present)
+            print(
+                f"{name:<18}{size:>11,}{plain_bytes:>9.1f}{indexed_bytes:>9.1f}"
+                f"{plain_lookups:>12,.0f}{indexed_lookups:>12,.0f}{indexed_lookups / plain_lookups:>8,.0f}x"
+                f"{plain_index_lookups:>12,.0f}{indexed_index_lookups:>12,.0f}"
+                f"{indexed_index_lookups / plain_index_lookups:>8,.1f}x"
+                f"{plain_removals:>12,.0f}{indexed_removals:>12,.0f}{indexed_removals / plain_removals:>8,.0f}x"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Times every search of `algorithms.search.searches` on sorted ID tables of several distributions & picks the fastest.
+
+Queries are half present, half missing IDs. Scalar searches run over a `list` & a NumPy array, `search_many` looks
+up all queries in one batch:
+
+    python -m benchmarks.search.bench_searches --size 1000000 --queries 20000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from algorithms.search.searches import SEARCHES, search_many
+
+
+def distributions(size:int, rng:np.random.Generator) -> dict[str, np.ndarray]:
+    centers = rng.integers(0, 1 << 40, size=16)
+    return {
+        'uniform': rng.integers(0, 1 << 40, size=size),
+        'skewed': (rng.lognormal(0, 2.5, size=size) * 1e6).astype(np.int64),
+        'clustered': (rng.choice(centers, size=size) + rng.normal(0, 1e4, size=size)).astype(np.int64),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=1_000_000)
+    parser.add_argument('--queries', type=int, default=20_000)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    print(f"{'distribution':<13}{'search':<15}{'list µs/query':>14}{'array µs/query':>16}")
+    for distribution, ids in distributions(args.size, rng).items():
+        ids = np.unique(ids)
+        half = args.queries // 2
+        queries = np.concatenate((rng.choice(ids, size=half), rng.integers(ids[0], ids[-1], size=args.queries - half)))
+        rng.shuffle(queries)
+        ids_list, queries_list = ids.tolist(), queries.tolist()
+        expected = search_many(ids, queries)
+
+        timings = {}
+        for name, search in SEARCHES.items():
+            start = time.perf_counter()
+            list_results = [search(ids_list, query) for query in queries_list]
+            list_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            array_results = [search(ids, query) for query in queries]
+            array_time = time.perf_counter() - start
+
+            assert list_results == array_results == expected.tolist()
+            timings[name] = list_time
+            print(f"{distribution:<13}{name:<15}{list_time / len(queries) * 1e6:>14.2f}{array_time / len(queries) * 1e6:>16.2f}")
+
+        start = time.perf_counter()
+        search_many(ids, queries)
+        batch_time = time.perf_counter() - start
+        print(f"{distribution:<13}{'search_many':<15}{'':>14}{batch_time / len(queries) * 1e6:>16.2f}")
+        print(f"{'':<13}fastest scalar search on lists: {min(timings, key=timings.get)}\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Measures external merge sort of random 16-byte records under several memory budgets & worker counts.
+
+The budget is turned into records per run from the measured footprint of a record (a run is held twice while
+sorting). Peak memory of this process is traced in a separate, slower pass; worker processes are not traced:
+
+    python -m benchmarks.sort.bench_external_sort --records 2000000 --budgets-mb 8 32 128 --workers 0 1 2
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from algorithms.sort.external_sort import external_sort
+
+
+def records(count:int, seed:int):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield rng.randbytes(16)
+
+
+def record_footprint(seed:int) -> float:
+    tracemalloc.start()
+    sample = list(records(10_000, seed))
+    footprint = tracemalloc.get_traced_memory()[0] / len(sample)
+    tracemalloc.stop()
+    return footprint
+
+
+def consume(sorted_records) -> int:
+    count, previous = 0, b''
+    for record in sorted_records:
+        assert previous <= record
+        count, previous = count + 1, record
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=2_000_000)
+    parser.add_argument('--budgets-mb', type=float, nargs='+', default=[8, 32, 128])
+    parser.add_argument('--workers', type=int, nargs='+', default=[0, 1, 2])
+    parser.add_argument('--fanout', type=int, default=64)
+    args = parser.parse_args()
+    footprint = record_footprint(0)
+
+    start = time.perf_counter()
+    consume(sorted(records(args.records, 0)))
+    print(f"in-memory sorted(): {time.perf_counter() - start:.2f}s, record footprint {footprint:.0f} B\n")
+
+    print(f"{'budget MiB':>10}{'run size':>10}{'runs':>6}{'workers':>8}{'seconds':>9}{'traced peak MiB':>17}")
+    for budget in args.budgets_mb:
+        run_size = max(1, int(budget * 2 ** 20 / (2 * footprint)))
+        for workers in args.workers:
+            start = time.perf_counter()
+            count = consume(external_sort(records(args.records, 0), run_size=run_size, workers=workers, fanout=args.fanout))
+            seconds = time.perf_counter() - start
+            assert count == args.records
+
+            tracemalloc.start()
+            consume(external_sort(records(args.records, 0), run_size=run_size, workers=workers, fanout=args.fanout))
+            peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+            tracemalloc.stop()
+
+            runs = -(-args.records // run_size)
+            print(f"{budget:>10g}{run_size:>10}{runs:>6}{workers:>8}{seconds:>9.2f}{peak:>17.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Compares in-place merge sort of linked lists with `sorted()` on their values copied out.
+
+"sorted(copy)" copies values into a `list` & sorts them, "+ rebuild" also links a new `DoubleLinkedList`
+out of the result, which is what callers had to do before lists could sort themselves:
+
+    python -m benchmarks.sort.bench_linked_list_merge_sort --sizes 10000 100000 1000000
+"""
+
+import argparse
+import random
+import time
+
+from algorithms.data_structures.double_linked_list import DoubleLinkedList
+from algorithms.data_structures.single_linked_list import SingleLinkedList
+
+
+def shapes(size:int, rng:random.Random) -> dict[str, list[int]]:
+    nearly_sorted = list(range(size))
+    for _ in range(size // 100): #~ 1% of positions swapped
+        i, j = rng.randrange(size), rng.randrange(size)
+        nearly_sorted[i], nearly_sorted[j] = nearly_sorted[j], nearly_sorted[i]
+
+    return {
+        'random': [rng.randrange(size) for _ in range(size)],
+        'sorted': list(range(size)),
+        'reversed': list(range(size, 0, -1)),
+        'nearly-sorted': nearly_sorted,
+        'few-unique': [rng.randrange(10) for _ in range(size)],
+    }
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    print(f"{'size':>9} {'shape':<15}{'DLL.sort':>10}{'SLL.sort':>10}{'sorted(copy)':>14}{'+ rebuild':>11}")
+    for size in args.sizes:
+        for shape, values in shapes(size, rng).items():
+            dll = DoubleLinkedList.from_iterable(values)
+            sll = SingleLinkedList.from_iterable(values)
+            copied = DoubleLinkedList.from_iterable(values)
+
+            dll_time = timed(dll.sort)
+            sll_time = timed(sll.sort)
+            sorted_time = timed(lambda: sorted(copied))
+            rebuild_time = timed(lambda: DoubleLinkedList.from_iterable(sorted(copied)))
+
+            print(f"{size:>9} {shape:<15}{dll_time:>10.3f}{sll_time:>10.3f}{sorted_time:>14.3f}{rebuild_time:>11.3f}")
+
+
+if __name__ == '__main__':
+    main()
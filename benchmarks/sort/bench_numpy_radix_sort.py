@@ -0,0 +1,67 @@
+"""Compares NumPy radix & counting sorts with `np.sort` & `np.argsort(kind='stable')` on int64 keys.
+
+Key spans range from a few distinct values (counting sort territory) to the full 64-bit range. With `--memmap`
+also sorts an on-disk array chunk by chunk:
+
+    python -m benchmarks.sort.bench_numpy_radix_sort --sizes 1000000 10000000 --memmap 50000000
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from algorithms.sort.numpy_radix_sort import counting_sort, radix_argsort, radix_sort, radix_sort_memmap
+
+
+SPANS = {'2^10': 1 << 10, '2^16': 1 << 16, '2^32': 1 << 32, '2^64': None}
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def keys(size:int, span, rng:np.random.Generator) -> np.ndarray:
+    if span is None:
+        return rng.integers(np.iinfo(np.int64).min, np.iinfo(np.int64).max, size=size, dtype=np.int64)
+    return rng.integers(-span // 2, span // 2, size=size, dtype=np.int64)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000_000, 10_000_000])
+    parser.add_argument('--memmap', type=int, default=0, help="size of the on-disk array, skipped if 0")
+    parser.add_argument('--chunk-size', type=int, default=1 << 22)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    print(f"{'size':>9} {'span':<6}{'np.sort':>9}{'radix':>9}{'counting':>10}{'argsort stable':>16}{'radix_argsort':>15}")
+    for size in args.sizes:
+        for name, span in SPANS.items():
+            values = keys(size, span, rng)
+            counting = f"{timed(lambda: counting_sort(values)):>10.3f}" if span and span <= size else f"{'-':>10}"
+            print(
+                f"{size:>9} {name:<6}{timed(lambda: np.sort(values)):>9.3f}{timed(lambda: radix_sort(values)):>9.3f}{counting}"
+                f"{timed(lambda: np.argsort(values, kind='stable')):>16.3f}{timed(lambda: radix_argsort(values)):>15.3f}"
+            )
+
+    if args.memmap:
+        with tempfile.TemporaryDirectory() as directory:
+            source = np.memmap(f'{directory}/source', dtype=np.int64, mode='w+', shape=(args.memmap,))
+            for start in range(0, args.memmap, args.chunk_size):
+                source[start:start + args.chunk_size] = keys(len(source[start:start + args.chunk_size]), 1 << 32, rng)
+            target = np.memmap(f'{directory}/target', dtype=np.int64, mode='w+', shape=(args.memmap,))
+            indices = np.memmap(f'{directory}/indices', dtype=np.int64, mode='w+', shape=(args.memmap,))
+
+            seconds = timed(lambda: radix_sort_memmap(source, target, chunk_size=args.chunk_size, scratch_dir=directory))
+            print(f"\nmemmap {args.memmap} keys (2^32 span), chunks of {args.chunk_size}: {seconds:.3f}s sort", end='')
+            seconds = timed(lambda: radix_sort_memmap(source, target, indices, args.chunk_size, scratch_dir=directory))
+            print(f", {seconds:.3f}s sort + indices")
+            del source, target, indices
+
+
+if __name__ == '__main__':
+    main()
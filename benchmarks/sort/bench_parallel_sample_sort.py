@@ -0,0 +1,48 @@
+"""Speedup curve of parallel sample sort over `np.sort` for 1 to N worker processes.
+
+"warm pool" reuses a pool of `sample_sort_executor`, "cold" starts one per call. Speedups are relative to
+`np.sort` in a single process & cannot exceed the number of cores available:
+
+    python -m benchmarks.sort.bench_parallel_sample_sort --size 20000000 --max-workers 8
+"""
+
+import argparse
+import os
+import time
+import numpy as np
+
+from algorithms.sort.parallel_sample_sort import sample_sort, sample_sort_executor
+
+
+def best_of(repeat:int, function) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=10_000_000)
+    parser.add_argument('--max-workers', type=int, default=max(os.cpu_count(), 4))
+    parser.add_argument('--dtype', default='float64')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    values = np.random.default_rng(0).random(args.size).astype(args.dtype)
+    baseline = best_of(args.repeat, lambda: np.sort(values))
+    print(f"{args.size} {args.dtype} values, {os.cpu_count()} CPUs, np.sort {baseline:.3f}s\n")
+
+    print(f"{'workers':>7}{'warm pool':>11}{'speedup':>9}{'cold':>9}{'speedup':>9}")
+    for workers in range(1, args.max_workers + 1):
+        with sample_sort_executor(workers) as executor:
+            list(executor.map(abs, range(workers))) #~ Starts all processes
+            warm = best_of(args.repeat, lambda: sample_sort(values, workers, executor=executor))
+        cold = best_of(args.repeat, lambda: sample_sort(values, workers))
+        print(f"{workers:>7}{warm:>11.3f}{baseline / warm:>8.2f}x{cold:>9.3f}{baseline / cold:>8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
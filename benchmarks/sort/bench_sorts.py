@@ -0,0 +1,47 @@
+"""Measures wall-time, comparisons, swaps & peak memory of sorts of `algorithms.sort.sorts` on several input shapes.
+
+Prints a table, or CSV/JSON with `--format` (optionally into `--output`):
+
+    python -m benchmarks.sort.bench_sorts --sizes 1000 10000 100000 --format csv --output sorts.csv
+"""
+
+import argparse
+import sys
+
+from algorithms.sort.harness import FORMATS, run_benchmark, write_results
+from algorithms.sort.inputs import INPUTS
+from algorithms.sort.sorts import SORTS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--algorithms', nargs='+', choices=list(SORTS), default=list(SORTS))
+    parser.add_argument('--inputs', nargs='+', choices=list(INPUTS), default=list(INPUTS))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--format', choices=('table',) + FORMATS, default='table')
+    parser.add_argument('--output', help="file to write into instead of stdout")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.algorithms, args.inputs, args.sizes, args.repeat, args.seed)
+
+    if args.format != 'table':
+        if args.output:
+            with open(args.output, 'w', newline='') as file:
+                write_results(results, file, args.format)
+        else:
+            write_results(results, sys.stdout, args.format)
+        return
+
+    print(f"{'size':>7} {'input':<14}{'algorithm':<11}{'seconds':>9}{'comparisons':>13}{'swaps':>12}{'peak KiB':>10}")
+    for result in results:
+        swaps = '-' if result.swaps is None else result.swaps
+        print(
+            f"{result.size:>7} {result.input:<14}{result.algorithm:<11}{result.seconds:>9.4f}"
+            f"{result.comparisons:>13}{swaps:>12}{result.peak_bytes / 1024:>10.1f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+from algorithms.data_structures.async_queue import AsyncQueue
+
+
+class TestAsyncQueue:
+    """Tests for AsyncQueue class"""
+
+    def test_invalid_maxsize(self):
+        """Verify negative capacity is rejected."""
+        with pytest.raises(ValueError):
+            AsyncQueue(maxsize=-1)
+
+    def test_put_and_get_keep_fifo_order(self):
+        """Verify values come out in the order they were put."""
+        async def scenario():
+            queue = AsyncQueue()
+            for i in range(5):
+                await queue.put(i)
+            assert len(queue) == 5
+            return [await queue.get() for _ in range(5)]
+
+        assert asyncio.run(scenario()) == [0, 1, 2, 3, 4]
+
+    def test_nowait_variants_raise(self):
+        """Verify nowait operations raise instead of waiting."""
+        queue = AsyncQueue(maxsize=1)
+        with pytest.raises(asyncio.QueueEmpty):
+            queue.get_nowait()
+
+        queue.put_nowait('a')
+        assert queue.full()
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait('b')
+        assert queue.get_nowait() == 'a'
+        assert queue.empty()
+
+    def test_get_waits_for_put(self):
+        """Verify blocked getters are woken up in arrival order."""
+        async def scenario():
+            queue = AsyncQueue()
+            getters = [asyncio.create_task(queue.get()) for _ in range(3)]
+            await asyncio.sleep(0)
+            assert not any(getter.done() for getter in getters)
+
+            for value in 'abc':
+                await queue.put(value)
+            return await asyncio.gather(*getters)
+
+        assert asyncio.run(scenario()) == ['a', 'b', 'c']
+
+    def test_put_waits_while_full(self):
+        """Verify bounded queue applies backpressure until a value is taken."""
+        async def scenario():
+            queue = AsyncQueue(maxsize=2)
+            await queue.put(1)
+            await queue.put(2)
+            putter = asyncio.create_task(queue.put(3))
+            await asyncio.sleep(0)
+            assert not putter.done()
+
+            assert await queue.get() == 1
+            await putter
+            return [queue.get_nowait() for _ in range(len(queue))]
+
+        assert asyncio.run(scenario()) == [2, 3]
+
+    def test_cancelled_getter_does_not_swallow_value(self):
+        """Verify a cancelled waiter leaves the waiter list and the value goes to the next getter."""
+        async def scenario():
+            queue = AsyncQueue()
+            cancelled = asyncio.create_task(queue.get())
+            waiting = asyncio.create_task(queue.get())
+            await asyncio.sleep(0)
+
+            cancelled.cancel()
+            await asyncio.sleep(0)
+            assert len(queue._getters) == 1
+
+            await queue.put('x')
+            return await waiting
+
+        assert asyncio.run(scenario()) == 'x'
+
+    def test_woken_then_cancelled_getter_passes_wakeup_on(self):
+        """Verify a getter cancelled right after being woken hands the value over to the next one."""
+        async def scenario():
+            queue = AsyncQueue()
+            first = asyncio.create_task(queue.get())
+            second = asyncio.create_task(queue.get())
+            await asyncio.sleep(0)
+
+            queue.put_nowait('x')
+            first.cancel()
+            return await asyncio.wait_for(second, timeout=1)
+
+        assert asyncio.run(scenario()) == 'x'
+
+    def test_get_batch(self):
+        """Verify batches are capped by max_n and do not wait past the first value."""
+        async def scenario():
+            queue = AsyncQueue()
+            for i in range(5):
+                queue.put_nowait(i)
+            first = await queue.get_batch(3)
+            second = await queue.get_batch(3)
+            empty = await queue.get_batch(3, timeout=0.01)
+            return first, second, empty, len(queue._getters)
+
+        assert asyncio.run(scenario()) == ([0, 1, 2], [3, 4], [], 0)
+
+    def test_get_batch_frees_slots_for_producers(self):
+        """Verify draining a full queue in one batch wakes up every blocked producer."""
+        async def scenario():
+            queue = AsyncQueue(maxsize=2)
+            producers = [asyncio.create_task(queue.put(i)) for i in range(4)]
+            await asyncio.sleep(0)
+
+            batch = await queue.get_batch(2)
+            await asyncio.wait_for(asyncio.gather(*producers), timeout=1)
+            return batch, await queue.get_batch(2)
+
+        assert asyncio.run(scenario()) == ([0, 1], [2, 3])
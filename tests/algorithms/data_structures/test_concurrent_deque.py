@@ -0,0 +1,109 @@
+import threading
+import time
+
+from algorithms.data_structures.concurrent_deque import ConcurrentDeque
+
+
+class TestConcurrentDeque:
+    """Tests for ConcurrentDeque class"""
+
+    def test_empty_deque(self):
+        """Verify empty deque has zero length and pops return None without waiting."""
+        deque = ConcurrentDeque()
+        assert len(deque) == 0
+        assert deque.pop_head() is None
+        assert deque.pop_tail() is None
+
+    def test_append_and_pop_head_keep_fifo_order(self):
+        """Verify appended values come out of head in insertion order."""
+        deque = ConcurrentDeque()
+        for i in range(5):
+            deque.append(i)
+
+        assert len(deque) == 5
+        assert [deque.pop_head() for _ in range(5)] == [0, 1, 2, 3, 4]
+        assert len(deque) == 0
+
+    def test_prepend_and_pop_tail(self):
+        """Verify both ends work together like a deque."""
+        deque = ConcurrentDeque()
+        deque.append(2)
+        deque.prepend(1)
+        deque.append(3)
+        deque.prepend(0)
+
+        assert deque.pop_tail() == 3
+        assert deque.pop_head() == 0
+        assert deque.pop_tail() == 2
+        assert deque.pop_tail() == 1
+        assert deque.pop_tail() is None
+        assert deque.pop_head() is None
+
+        deque.append('a')
+        deque.prepend('b')
+        assert deque.pop_head() == 'b'
+        assert deque.pop_tail() == 'a'
+        assert len(deque) == 0
+
+    def test_blocking_pop_times_out(self):
+        """Verify blocking pop gives up after timeout."""
+        deque = ConcurrentDeque()
+
+        start = time.monotonic()
+        assert deque.pop_head(timeout=0.05) is None
+        assert deque.pop_tail(timeout=0.05) is None
+        assert time.monotonic() - start >= 0.1
+
+    def test_blocking_pop_wakes_up_on_append(self):
+        """Verify consumers blocked on both ends get values appended later."""
+        deque = ConcurrentDeque()
+        results = []
+        consumers = [
+            threading.Thread(target=lambda: results.append(deque.pop_head(timeout=None))),
+            threading.Thread(target=lambda: results.append(deque.pop_tail(timeout=5))),
+        ]
+        for consumer in consumers:
+            consumer.start()
+
+        time.sleep(0.05)
+        deque.append('x')
+        deque.prepend('y')
+        for consumer in consumers:
+            consumer.join(timeout=5)
+
+        assert sorted(results) == ['x', 'y']
+
+    def test_producers_and_consumers_exchange_every_value_once(self):
+        """Verify concurrent producers & consumers on both ends neither lose nor duplicate values."""
+        deque = ConcurrentDeque()
+        producers, consumers, per_producer = 4, 4, 2000
+        received = [[] for _ in range(consumers)]
+
+        def produce(offset):
+            for i in range(per_producer):
+                if i % 2:
+                    deque.append(offset + i)
+                else:
+                    deque.prepend(offset + i)
+
+        def consume(output, from_head):
+            pop = deque.pop_head if from_head else deque.pop_tail
+            while True:
+                value = pop(timeout=1)
+                if value is None or value < 0:
+                    return
+                output.append(value)
+
+        threads = [threading.Thread(target=consume, args=(received[i], i % 2 == 0)) for i in range(consumers)]
+        threads += [threading.Thread(target=produce, args=(p * per_producer,)) for p in range(producers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads[consumers:]:
+            thread.join()
+        for _ in range(consumers):
+            deque.append(-1)
+        for thread in threads[:consumers]:
+            thread.join()
+
+        values = sorted(value for output in received for value in output)
+        assert values == list(range(producers * per_producer))
@@ -1,3 +1,8 @@
+import copy
+import pickle
+import random
+
+import pytest
 from algorithms.data_structures.double_linked_list import DoubleLinkedList, Node
 
 
@@ -15,6 +20,11 @@ class TestNode:
         """Verify node string representation format."""
         node = Node(10)
         assert repr(node) == "Node(value=10)"
+    
+    def test_node_has_no_instance_dict(self):
+        """Verify node is slotted so it does not pay for a per-instance dict."""
+        node = Node(1)
+        assert not hasattr(node, '__dict__')
 
 
 class TestDoubleLinkedList:
@@ -658,3 +668,613 @@ class TestDoubleLinkedList:
         
         assert count == 9
         assert count == len(dll)
+    
+    def test_delete_closer_to_tail(self):
+        """Verify deleting an element in the back half walks the right distance from tail."""
+        dll = DoubleLinkedList()
+        for i in range(6):
+            dll.append(i)
+        
+        assert dll.delete(4) == 4
+        assert dll.delete(3) == 3
+        
+        values = []
+        current = dll.head
+        while current:
+            values.append(current.value)
+            current = current.next
+        assert values == [0, 1, 2, 5]
+    
+    def test_getitem(self):
+        """Verify positional access from both ends, including negative indices."""
+        dll = DoubleLinkedList()
+        for i in range(5):
+            dll.append(i * 10)
+        
+        assert [dll[i] for i in range(5)] == [0, 10, 20, 30, 40]
+        assert dll[-1] == 40
+        assert dll[-5] == 0
+    
+    def test_getitem_out_of_bounds(self):
+        """Verify out of bounds access raises IndexError."""
+        dll = DoubleLinkedList()
+        dll.append(1)
+        
+        with pytest.raises(IndexError):
+            dll[1]
+        with pytest.raises(IndexError):
+            dll[-2]
+    
+    def test_insert(self):
+        """Verify insert follows list.insert semantics and keeps bidirectional links intact."""
+        dll = DoubleLinkedList()
+        reference = []
+        for pos_idx, value in [(0, 'a'), (1, 'b'), (1, 'c'), (-1, 'd'), (100, 'e'), (-100, 'f'), (3, 'g')]:
+            dll.insert(pos_idx, value)
+            reference.insert(pos_idx, value)
+        
+        assert len(dll) == len(reference)
+        assert dll.head.value == reference[0]
+        assert dll.tail.value == reference[-1]
+        
+        values = []
+        current = dll.head
+        while current:
+            if current.next:
+                assert current.next.prev == current
+            values.append(current.value)
+            current = current.next
+        assert values == reference
+    
+    def test_sequential_deletes_hit_finger(self):
+        """Verify deleting neighbouring positions starts from the cached finger."""
+        dll = DoubleLinkedList()
+        for i in range(100):
+            dll.append(i)
+        
+        assert dll.delete(40) == 40
+        assert dll.finger_misses == 1
+        
+        assert dll.delete(40) == 41
+        assert dll.delete(41) == 43
+        assert dll.delete(39) == 39
+        assert dll.finger_hits == 3
+        assert dll.finger_misses == 1
+    
+    def test_finger_adjusts_on_prepend_and_pop_head(self):
+        """Verify the cached finger index follows shifts caused by head mutations."""
+        dll = DoubleLinkedList()
+        for i in range(10):
+            dll.append(i)
+        
+        assert dll[5] == 5
+        dll.prepend(-1)
+        assert dll[6] == 5
+        dll.pop_head()
+        dll.pop_head()
+        assert dll[4] == 5
+        assert dll.finger_hits == 2
+    
+    def test_finger_invalidated_when_popped(self):
+        """Verify popping the cached node drops the finger."""
+        dll = DoubleLinkedList()
+        for i in range(5):
+            dll.append(i)
+        
+        assert dll[4] == 4
+        dll.pop_tail()
+        assert dll._finger is None
+        
+        assert dll[0] == 0
+        dll.pop_head()
+        assert dll._finger is None
+        assert [dll[i] for i in range(3)] == [1, 2, 3]
+    
+    def test_finger_matches_reference_under_random_operations(self):
+        """Verify random local positional operations behave like a Python list."""
+        rng = random.Random(0)
+        dll = DoubleLinkedList()
+        reference = []
+        pos_idx = 0
+        
+        for i in range(3000):
+            operation = rng.randrange(7)
+            pos_idx = max(0, min(len(reference), pos_idx + rng.randrange(-3, 4)))
+            if operation == 0:
+                dll.append(i)
+                reference.append(i)
+            elif operation == 1:
+                dll.prepend(i)
+                reference.insert(0, i)
+            elif operation == 2:
+                assert dll.pop_head() == (reference.pop(0) if reference else None)
+            elif operation == 3:
+                assert dll.pop_tail() == (reference.pop() if reference else None)
+            elif operation == 4:
+                dll.insert(pos_idx, i)
+                reference.insert(pos_idx, i)
+            elif operation == 5 and pos_idx < len(reference):
+                assert dll[pos_idx] == reference[pos_idx]
+            else:
+                expected = reference.pop(pos_idx) if pos_idx < len(reference) else None
+                assert dll.delete(pos_idx) == expected
+            assert len(dll) == len(reference)
+        
+        assert [dll[i] for i in range(len(reference))] == reference
+        assert dll.finger_hits > 0
+    
+    def test_from_iterable(self):
+        """Verify building from an iterable links all nodes in both directions."""
+        dll = DoubleLinkedList.from_iterable(range(5))
+        
+        assert len(dll) == 5
+        assert dll.head.value == 0
+        assert dll.tail.value == 4
+        assert dll.head.prev is None
+        assert dll.tail.next is None
+        
+        values = []
+        current = dll.tail
+        while current:
+            values.append(current.value)
+            current = current.prev
+        assert values == [4, 3, 2, 1, 0]
+    
+    def test_from_empty_iterable(self):
+        """Verify building from an empty iterable gives an empty list."""
+        dll = DoubleLinkedList.from_iterable(iter([]))
+        
+        assert dll.head is None
+        assert dll.tail is None
+        assert len(dll) == 0
+    
+    def test_extend(self):
+        """Verify extend appends values in order, including generators and the list itself."""
+        dll = DoubleLinkedList()
+        dll.extend([1, 2])
+        dll.extend(i for i in range(3, 5))
+        dll.extend(dll)
+        
+        assert len(dll) == 8
+        assert [dll[i] for i in range(8)] == [1, 2, 3, 4, 1, 2, 3, 4]
+        assert dll.tail.value == 4
+        assert dll.tail.prev.value == 3
+    
+    def test_extendleft(self):
+        """Verify extendleft prepends values one by one, like deque.extendleft."""
+        dll = DoubleLinkedList()
+        dll.extendleft([1, 2])
+        dll.extendleft([3, 4])
+        
+        assert len(dll) == 4
+        assert [dll[i] for i in range(4)] == [4, 3, 2, 1]
+        assert dll.head.prev is None
+        assert dll.head.next.prev == dll.head
+        assert dll.tail.value == 1
+    
+    def test_extendleft_shifts_finger(self):
+        """Verify the cached finger index follows values added in front of it."""
+        dll = DoubleLinkedList.from_iterable(range(10))
+        
+        assert dll[5] == 5
+        dll.extendleft([-1, -2])
+        assert dll[7] == 5
+        assert dll.finger_hits == 1
+    
+    def test_extend_with_failing_iterator_keeps_linked_values(self):
+        """Verify values linked before the iterator raised stay consistent with head/tail/len."""
+        def values():
+            yield 1
+            yield 2
+            raise RuntimeError("boom")
+        
+        dll = DoubleLinkedList.from_iterable([0])
+        with pytest.raises(RuntimeError):
+            dll.extend(values())
+        
+        assert len(dll) == 3
+        assert dll.tail.value == 2
+        assert dll.pop_tail() == 2
+    
+    def test_concat(self):
+        """Verify concat moves all nodes of the other list and empties it."""
+        dll = DoubleLinkedList.from_iterable([1, 2])
+        other = DoubleLinkedList.from_iterable([3, 4])
+        moved_head = other.head
+        
+        dll.concat(other)
+        
+        assert len(dll) == 4
+        assert [dll[i] for i in range(4)] == [1, 2, 3, 4]
+        assert dll.head.next.next is moved_head
+        assert moved_head.prev.value == 2
+        assert dll.tail.value == 4
+        assert other.head is None
+        assert other.tail is None
+        assert len(other) == 0
+    
+    def test_concat_with_empty_lists(self):
+        """Verify concat handles empty lists on either side."""
+        dll = DoubleLinkedList()
+        dll.concat(DoubleLinkedList.from_iterable([1]))
+        dll.concat(DoubleLinkedList())
+        
+        assert len(dll) == 1
+        assert dll.head is dll.tail
+    
+    def test_concat_with_itself(self):
+        """Verify concatenating a list with itself is rejected."""
+        dll = DoubleLinkedList.from_iterable([1])
+        
+        with pytest.raises(ValueError):
+            dll.concat(dll)
+    
+    def test_split_at(self):
+        """Verify split_at cuts the list and returns the suffix with correct lengths and links."""
+        dll = DoubleLinkedList.from_iterable(range(6))
+        
+        suffix = dll.split_at(4)
+        
+        assert len(dll) == 4
+        assert len(suffix) == 2
+        assert dll.tail.value == 3
+        assert dll.tail.next is None
+        assert suffix.head.value == 4
+        assert suffix.head.prev is None
+        assert [suffix[i] for i in range(2)] == [4, 5]
+        assert [dll[i] for i in range(4)] == [0, 1, 2, 3]
+    
+    def test_split_at_bounds(self):
+        """Verify split_at follows slicing semantics at and beyond the bounds."""
+        dll = DoubleLinkedList.from_iterable(range(4))
+        
+        assert len(dll.split_at(10)) == 0
+        assert len(dll) == 4
+        
+        suffix = dll.split_at(-1)
+        assert [suffix[i] for i in range(len(suffix))] == [3]
+        
+        suffix = dll.split_at(-100)
+        assert len(dll) == 0
+        assert dll.head is None
+        assert [suffix[i] for i in range(len(suffix))] == [0, 1, 2]
+    
+    def test_append_and_prepend_return_handles(self):
+        """Verify append, prepend and insert return the created nodes."""
+        dll = DoubleLinkedList()
+        
+        assert dll.append(2) is dll.tail
+        assert dll.prepend(1) is dll.head
+        assert dll.insert(1, 'x') is dll.head.next
+    
+    def test_remove_node(self):
+        """Verify removing by handle relinks neighbours, updates head/tail and detaches the node."""
+        dll = DoubleLinkedList()
+        first, middle, last = dll.append(1), dll.append(2), dll.append(3)
+        
+        assert dll.remove_node(middle) == 2
+        assert first.next is last
+        assert last.prev is first
+        assert middle.prev is None and middle.next is None
+        
+        assert dll.remove_node(first) == 1
+        assert dll.head is last
+        assert dll.remove_node(last) == 3
+        assert dll.head is None
+        assert dll.tail is None
+        assert len(dll) == 0
+    
+    def test_remove_node_twice(self):
+        """Verify removing an already removed handle is rejected."""
+        dll = DoubleLinkedList()
+        node = dll.append(1)
+        dll.append(2)
+        dll.remove_node(node)
+        
+        with pytest.raises(ValueError):
+            dll.remove_node(node)
+        assert len(dll) == 1
+    
+    def test_end_node_of_other_list_rejected(self):
+        """Verify *head* & *tail* handles of another list are rejected & leave both lists intact."""
+        dll, other = DoubleLinkedList(), DoubleLinkedList()
+        for i in range(3):
+            dll.append(i)
+            other.append(i + 10)
+        
+        for method in (dll.remove_node, dll.move_to_front, dll.move_to_back):
+            for node in (other.head, other.tail):
+                with pytest.raises(ValueError):
+                    method(node)
+        assert list(dll) == [0, 1, 2]
+        assert list(other) == [10, 11, 12]
+        assert len(dll) == len(other) == 3
+    
+    def test_popped_node_is_detached(self):
+        """Verify handles of popped and deleted elements are rejected."""
+        dll = DoubleLinkedList()
+        handles = [dll.append(i) for i in range(4)]
+        dll.pop_head()
+        dll.pop_tail()
+        dll.delete(1)
+        
+        for node in (handles[0], handles[3], handles[2]):
+            with pytest.raises(ValueError):
+                dll.remove_node(node)
+    
+    def test_move_to_front_and_back(self):
+        """Verify moving handles to either end keeps bidirectional links intact."""
+        dll = DoubleLinkedList()
+        nodes = [dll.append(i) for i in range(4)]
+        
+        dll.move_to_front(nodes[2])
+        dll.move_to_back(nodes[0])
+        dll.move_to_front(nodes[2])
+        dll.move_to_back(nodes[0])
+        
+        assert [dll[i] for i in range(4)] == [2, 1, 3, 0]
+        assert dll.head is nodes[2]
+        assert dll.tail is nodes[0]
+        assert len(dll) == 4
+        
+        current = dll.head
+        while current.next:
+            assert current.next.prev is current
+            current = current.next
+    
+    def test_handles_drop_finger(self):
+        """Verify positional access stays correct after handle operations."""
+        dll = DoubleLinkedList()
+        nodes = [dll.append(i) for i in range(10)]
+        
+        assert dll[5] == 5
+        dll.remove_node(nodes[1])
+        dll.move_to_front(nodes[9])
+        
+        assert [dll[i] for i in range(9)] == [9, 0, 2, 3, 4, 5, 6, 7, 8]
+    
+    def test_iter_and_reversed(self):
+        """Verify iteration yields values in both directions."""
+        dll = DoubleLinkedList.from_iterable(range(5))
+        
+        assert list(dll) == [0, 1, 2, 3, 4]
+        assert list(reversed(dll)) == [4, 3, 2, 1, 0]
+        assert list(DoubleLinkedList()) == []
+        assert list(reversed(DoubleLinkedList())) == []
+    
+    def test_contains(self):
+        """Verify membership compares by identity first, then by equality."""
+        nan = float('nan')
+        dll = DoubleLinkedList.from_iterable([1, 'two', nan])
+        
+        assert 1 in dll
+        assert 'two' in dll
+        assert nan in dll
+        assert 3 not in dll
+    
+    @pytest.mark.parametrize('mutate', [
+        lambda dll: dll.append(9),
+        lambda dll: dll.prepend(9),
+        lambda dll: dll.pop_head(),
+        lambda dll: dll.pop_tail(),
+        lambda dll: dll.insert(1, 9),
+        lambda dll: dll.delete(1),
+        lambda dll: dll.extend([9]),
+        lambda dll: dll.move_to_back(dll.head),
+        lambda dll: dll.clear(),
+    ])
+    def test_mutation_during_iteration_raises(self, mutate):
+        """Verify structural changes while iterating are detected in both directions."""
+        for direction in (iter, reversed):
+            dll = DoubleLinkedList.from_iterable(range(4))
+            with pytest.raises(RuntimeError):
+                for _ in direction(dll):
+                    mutate(dll)
+    
+    def test_updating_values_during_iteration_is_allowed(self):
+        """Verify reading & assigning node values does not count as mutation."""
+        dll = DoubleLinkedList.from_iterable(range(4))
+        
+        for value in dll:
+            assert dll[value] == value
+        
+        node = dll.head
+        for value in dll:
+            node.value = value * 10
+            node = node.next
+        assert list(dll) == [0, 10, 20, 30]
+    
+    def test_pickle_long_list(self):
+        """Verify pickling does not recurse through nodes & keeps bidirectional links."""
+        dll = DoubleLinkedList.from_iterable(range(100_000))
+        restored = pickle.loads(pickle.dumps(dll))
+        
+        assert type(restored) is DoubleLinkedList
+        assert list(restored) == list(range(100_000))
+        assert list(reversed(restored)) == list(range(99_999, -1, -1))
+        assert len(restored) == 100_000
+    
+    def test_pickle_empty_list(self):
+        """Verify an empty list round-trips."""
+        restored = pickle.loads(pickle.dumps(DoubleLinkedList()))
+        assert len(restored) == 0
+        assert restored.head is None
+    
+    def test_copy_and_deepcopy(self):
+        """Verify copies get their own nodes & deep copies their own values."""
+        dll = DoubleLinkedList.from_iterable([[1], [2]])
+        shallow = copy.copy(dll)
+        deep = copy.deepcopy(dll)
+        
+        shallow.append([3])
+        dll[0].append('x')
+        
+        assert list(dll) == [[1, 'x'], [2]]
+        assert list(shallow) == [[1, 'x'], [2], [3]]
+        assert list(deep) == [[1], [2]]
+    
+    def test_to_bytes_round_trip(self):
+        """Verify numbers survive the compact binary format."""
+        dll = DoubleLinkedList.from_iterable([1.5, -2.0, 3.25])
+        
+        assert list(DoubleLinkedList.from_bytes(dll.to_bytes())) == [1.5, -2.0, 3.25]
+        assert list(DoubleLinkedList.from_bytes(DoubleLinkedList.from_iterable([1, 2]).to_bytes('q'))) == [1, 2]
+        with pytest.raises(TypeError):
+            DoubleLinkedList.from_iterable(['a']).to_bytes()
+    
+    def test_sort(self):
+        """Verify sorting relinks both directions, keeps handles & detects running iterators."""
+        dll = DoubleLinkedList()
+        nodes = [dll.append(value) for value in [3, 1, 2]]
+        dll[1]
+        
+        iterator = iter(dll)
+        next(iterator)
+        dll.sort()
+        
+        assert list(dll) == [1, 2, 3]
+        assert list(reversed(dll)) == [3, 2, 1]
+        assert dll.head is nodes[1]
+        assert dll.tail is nodes[0]
+        assert [dll[i] for i in range(3)] == [1, 2, 3]
+        with pytest.raises(RuntimeError):
+            next(iterator)
+        
+        dll.sort(key=lambda value: -value)
+        assert list(dll) == [3, 2, 1]
+        dll.sort(reverse=True)
+        assert list(dll) == [3, 2, 1]
+
+
+class TestDoubleLinkedListValueIndex:
+    """Tests for DoubleLinkedList with value_index=True"""
+    
+    def assert_index_in_sync(self, dll):
+        nodes = []
+        current = dll.head
+        while current:
+            nodes.append(current)
+            current = current.next
+        for node in nodes:
+            expected = {id(other) for other in nodes if other.value == node.value}
+            assert {id(other) for other in dll._index.lookup(node.value)} == expected
+    
+    def test_contains_index_of_remove_value(self):
+        """Verify lookups by value find the first equal element."""
+        dll = DoubleLinkedList.from_iterable([4, 5, 4, 6], value_index=True)
+        
+        assert 5 in dll
+        assert 7 not in dll
+        assert dll.index_of(4) == 0
+        assert dll.index_of(6) == 3
+        dll.remove_value(4)
+        assert list(dll) == [5, 4, 6]
+        assert dll.index_of(4) == 1
+        with pytest.raises(ValueError):
+            dll.index_of(7)
+        with pytest.raises(ValueError):
+            dll.remove_value(7)
+        self.assert_index_in_sync(dll)
+    
+    def test_lookups_without_index(self):
+        """Verify index_of & remove_value scan lists without an index."""
+        dll = DoubleLinkedList.from_iterable([1, [2], 1])
+        
+        assert dll.index_of([2]) == 1
+        dll.remove_value(1)
+        assert list(dll) == [[2], 1]
+        with pytest.raises(ValueError):
+            dll.remove_value(3)
+    
+    def test_unhashable_values(self):
+        """Verify unhashable values are found & missing ones rejected."""
+        dll = DoubleLinkedList.from_iterable([{'a': [1]}, bytearray(b'x'), 2], value_index=True)
+        
+        assert {'a': [1]} in dll
+        assert {'a': [2]} not in dll
+        assert b'x' in dll # Hashable value equal to an unhashable one
+        assert dll.index_of(b'x') == 1
+        dll.remove_value({'a': [1]})
+        assert list(dll) == [bytearray(b'x'), 2]
+        self.assert_index_in_sync(dll)
+    
+    def test_unhashable_queries_of_hashable_values(self):
+        """Verify unhashable queries give the same answers as without an index."""
+        for value_index in (False, True):
+            dll = DoubleLinkedList.from_iterable([b'a', frozenset({1}), (1, 2)], value_index=value_index)
+            
+            assert bytearray(b'a') in dll
+            assert {1} in dll
+            assert [1, 2] not in dll
+            assert dll.index_of({1}) == 1
+            dll.remove_value(bytearray(b'a'))
+            assert list(dll) == [frozenset({1}), (1, 2)]
+            with pytest.raises(ValueError):
+                dll.remove_value([1, 2])
+    
+    def test_concat_split_at_clear(self):
+        """Verify moving nodes between lists moves them between indices."""
+        dll = DoubleLinkedList.from_iterable([1, 2], value_index=True)
+        other = DoubleLinkedList.from_iterable([3, 4], value_index=True)
+        
+        dll.concat(other)
+        assert 4 in dll
+        assert 4 not in other
+        
+        suffix = dll.split_at(1)
+        assert list(suffix) == [2, 3, 4]
+        assert 3 in suffix
+        assert 3 not in dll
+        assert 1 in dll
+        self.assert_index_in_sync(dll)
+        self.assert_index_in_sync(suffix)
+        
+        suffix.clear()
+        assert 2 not in suffix
+    
+    def test_pickle_and_copy_keep_index(self):
+        """Verify pickled & copied lists are indexed too."""
+        dll = DoubleLinkedList.from_iterable([1, 2], value_index=True)
+        
+        for restored in (pickle.loads(pickle.dumps(dll)), copy.copy(dll)):
+            assert restored._index is not None
+            assert restored.index_of(2) == 1
+    
+    def test_matches_list_under_random_operations(self):
+        """Verify index stays in sync with values under random mutations."""
+        rng = random.Random(0)
+        dll = DoubleLinkedList(value_index=True)
+        expected = []
+        
+        for i in range(2000):
+            operation = rng.randrange(9)
+            value = rng.choice([rng.randrange(20), [rng.randrange(3)]])
+            if operation == 0:
+                dll.append(value)
+                expected.append(value)
+            elif operation == 1:
+                dll.prepend(value)
+                expected.insert(0, value)
+            elif operation == 2:
+                assert dll.pop_head() == (expected.pop(0) if expected else None)
+            elif operation == 3:
+                assert dll.pop_tail() == (expected.pop() if expected else None)
+            elif operation == 4:
+                pos_idx = rng.randrange(len(expected) + 1)
+                assert dll.delete(pos_idx) == (expected.pop(pos_idx) if pos_idx < len(expected) else None)
+            elif operation == 5:
+                pos_idx = rng.randrange(len(expected) + 1)
+                dll.insert(pos_idx, value)
+                expected.insert(pos_idx, value)
+            elif operation == 6:
+                dll.extendleft([value, i])
+                expected[:0] = [i, value]
+            elif operation == 7 and expected:
+                dll.remove_node(dll.head.next or dll.head)
+                del expected[1 if len(expected) > 1 else 0]
+            elif value in expected:
+                dll.remove_value(value)
+                expected.remove(value)
+            assert list(dll) == expected
+            assert (value in dll) == (value in expected)
+        self.assert_index_in_sync(dll)
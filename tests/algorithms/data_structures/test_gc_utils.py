@@ -0,0 +1,32 @@
+import gc
+
+import pytest
+from algorithms.data_structures.gc_utils import gc_paused
+
+
+class TestGcPaused:
+    """Tests for gc_paused context manager"""
+    
+    def test_pauses_and_resumes_collector(self):
+        """Verify collector is disabled inside the block and re-enabled after it."""
+        assert gc.isenabled()
+        with gc_paused():
+            assert not gc.isenabled()
+        assert gc.isenabled()
+    
+    def test_resumes_collector_on_error(self):
+        """Verify collector is re-enabled when the block raises."""
+        with pytest.raises(ValueError):
+            with gc_paused():
+                raise ValueError
+        assert gc.isenabled()
+    
+    def test_keeps_disabled_collector_disabled(self):
+        """Verify a collector disabled by the caller stays disabled."""
+        gc.disable()
+        try:
+            with gc_paused():
+                pass
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
@@ -0,0 +1,317 @@
+import pickle
+import random
+
+import pytest
+from algorithms.data_structures.double_linked_list import DoubleLinkedList
+from algorithms.data_structures.indexed_double_linked_list import IndexedDoubleLinkedList, IndexedNode
+
+
+def values(dll):
+    """Collects values walking level 0 from head & verifies backward links along the way."""
+    output = []
+    current = dll.head
+    while current:
+        if current.next:
+            assert current.next.prev is current
+        output.append(current.value)
+        current = current.next
+    return output
+
+
+def assert_index_consistent(dll):
+    """Verifies every express link points at the right node & jumps over the right number of nodes."""
+    nodes = []
+    current = dll.head
+    while current:
+        nodes.append(current)
+        current = current.next
+    positions = {id(node): pos for pos, node in enumerate(nodes)}
+    positions[id(dll._sentinel)] = -1
+
+    for node in [dll._sentinel] + nodes:
+        pos = positions[id(node)]
+        height = dll._height if node is dll._sentinel else len(node.skips)
+        for level in range(height):
+            target = node.skips[level]
+            target_pos = len(nodes) if target is None else positions[id(target)]
+            assert node.widths[level] == target_pos - pos
+            between = nodes[pos+1:target_pos]
+            assert all(len(other.skips) <= level for other in between)
+
+
+class TestIndexedNode:
+    """Tests for IndexedNode class"""
+
+    def test_node_creation(self):
+        """Verify node initializes with value, null level 0 links & a tower of given height."""
+        node = IndexedNode(5, 3)
+        assert node.value == 5
+        assert node.prev is None
+        assert node.next is None
+        assert node.skips == [None] * 3
+        assert node.widths == [0] * 3
+
+    def test_node_repr(self):
+        """Verify node string representation format."""
+        assert repr(IndexedNode(10)) == "Node(value=10)"
+
+
+class TestIndexedDoubleLinkedList:
+    """Tests for IndexedDoubleLinkedList class"""
+
+    def test_empty_list_initialization(self):
+        """Verify empty list has null head/tail and zero length."""
+        dll = IndexedDoubleLinkedList()
+        assert dll.head is None
+        assert dll.tail is None
+        assert len(dll) == 0
+        assert dll.pop_head() is None
+        assert dll.pop_tail() is None
+        assert dll.delete(0) is None
+
+    def test_append_and_prepend(self):
+        """Verify appending & prepending keep both level 0 and express links consistent."""
+        dll = IndexedDoubleLinkedList(seed=1)
+        for i in range(50):
+            dll.append(i)
+            dll.prepend(-i)
+
+        assert values(dll) == [-i for i in range(49, -1, -1)] + list(range(50))
+        assert dll.head.prev is None
+        assert dll.tail.next is None
+        assert_index_consistent(dll)
+
+    def test_getitem(self):
+        """Verify positional access including negative indices."""
+        dll = IndexedDoubleLinkedList(seed=2)
+        for i in range(100):
+            dll.append(i * 10)
+
+        assert [dll[i] for i in range(100)] == [i * 10 for i in range(100)]
+        assert dll[-1] == 990
+        assert dll[-100] == 0
+
+    def test_getitem_out_of_bounds(self):
+        """Verify out of bounds access raises IndexError."""
+        dll = IndexedDoubleLinkedList()
+        dll.append(1)
+
+        with pytest.raises(IndexError):
+            dll[1]
+        with pytest.raises(IndexError):
+            dll[-2]
+
+    def test_insert(self):
+        """Verify insert follows list.insert semantics."""
+        dll = IndexedDoubleLinkedList(seed=3)
+        reference = []
+        for pos_idx, value in [(0, 'a'), (1, 'b'), (1, 'c'), (-1, 'd'), (100, 'e'), (-100, 'f')]:
+            dll.insert(pos_idx, value)
+            reference.insert(pos_idx, value)
+
+        assert values(dll) == reference
+        assert_index_consistent(dll)
+
+    def test_delete(self):
+        """Verify deleting by position from head, middle & tail."""
+        dll = IndexedDoubleLinkedList(seed=4)
+        for i in range(10):
+            dll.append(i)
+
+        assert dll.delete(0) == 0
+        assert dll.delete(8) == 9
+        assert dll.delete(3) == 4
+        assert dll.delete(-1) is None
+        assert dll.delete(7) is None
+        assert values(dll) == [1, 2, 3, 5, 6, 7, 8]
+        assert dll.head.value == 1
+        assert dll.tail.value == 8
+        assert_index_consistent(dll)
+
+    def test_pop_until_empty(self):
+        """Verify popping everything resets head and tail."""
+        dll = IndexedDoubleLinkedList(seed=5)
+        for i in range(20):
+            dll.append(i)
+
+        assert [dll.pop_head() for _ in range(10)] == list(range(10))
+        assert [dll.pop_tail() for _ in range(10)] == list(range(19, 9, -1))
+        assert dll.head is None
+        assert dll.tail is None
+        assert len(dll) == 0
+
+        dll.append(1)
+        assert dll[0] == 1
+        assert_index_consistent(dll)
+
+    def test_matches_reference_under_random_operations(self):
+        """Verify random positional operations behave like a Python list."""
+        rng = random.Random(0)
+        dll = IndexedDoubleLinkedList(seed=0)
+        reference = []
+
+        for i in range(3000):
+            operation = rng.randrange(6)
+            if operation == 0:
+                dll.append(i)
+                reference.append(i)
+            elif operation == 1:
+                dll.prepend(i)
+                reference.insert(0, i)
+            elif operation == 2:
+                pos_idx = rng.randrange(-len(reference) - 2, len(reference) + 2)
+                dll.insert(pos_idx, i)
+                reference.insert(pos_idx, i)
+            elif operation == 3:
+                assert dll.pop_tail() == (reference.pop() if reference else None)
+            elif operation == 4 and reference:
+                pos_idx = rng.randrange(len(reference))
+                assert dll[pos_idx] == reference[pos_idx]
+            else:
+                pos_idx = rng.randrange(-1, len(reference) + 1)
+                expected = reference.pop(pos_idx) if 0 <= pos_idx < len(reference) else None
+                assert dll.delete(pos_idx) == expected
+            assert len(dll) == len(reference)
+
+        assert values(dll) == reference
+        assert_index_consistent(dll)
+
+    def test_from_iterable(self):
+        """Verify bulk construction builds a consistent index."""
+        dll = IndexedDoubleLinkedList.from_iterable(range(200))
+
+        assert len(dll) == 200
+        assert dll[137] == 137
+        assert dll.tail.value == 199
+        assert_index_consistent(dll)
+
+    def test_extend_and_extendleft(self):
+        """Verify bulk extension on both ends keeps the index consistent."""
+        dll = IndexedDoubleLinkedList(seed=6)
+        dll.extend([])
+        dll.extend(range(50))
+        dll.insert(10, 'x')
+        dll.extend(i for i in range(50, 100))
+        dll.extendleft([-1, -2])
+        dll.extend(dll)
+
+        expected = [-2, -1] + list(range(10)) + ['x'] + list(range(10, 100))
+        assert values(dll) == expected * 2
+        assert_index_consistent(dll)
+
+    def test_split_at_and_concat(self):
+        """Verify splitting & concatenating splice express links consistently."""
+        rng = random.Random(7)
+        for _ in range(50):
+            reference = list(range(rng.randrange(0, 80)))
+            dll = IndexedDoubleLinkedList.from_iterable(reference)
+            pos_idx = rng.randrange(-5, len(reference) + 5)
+
+            suffix = dll.split_at(pos_idx)
+
+            assert values(dll) == reference[:pos_idx]
+            assert values(dll) + values(suffix) == reference
+            assert len(dll) + len(suffix) == len(reference)
+            assert_index_consistent(dll)
+            assert_index_consistent(suffix)
+
+            suffix.append('x')
+            dll.concat(suffix)
+
+            assert values(dll) == reference + ['x']
+            assert len(suffix) == 0
+            assert [dll[i] for i in range(len(dll))] == reference + ['x']
+            assert_index_consistent(dll)
+            assert_index_consistent(suffix)
+
+    def test_concat_plain_list(self):
+        """Verify concatenating a list without an index re-adds its values."""
+        dll = IndexedDoubleLinkedList.from_iterable([1, 2])
+        other = DoubleLinkedList.from_iterable([3, 4])
+
+        dll.concat(other)
+
+        assert values(dll) == [1, 2, 3, 4]
+        assert len(other) == 0
+        assert_index_consistent(dll)
+
+    def test_node_handles(self):
+        """Verify handle operations keep the index consistent."""
+        dll = IndexedDoubleLinkedList(seed=8)
+        nodes = [dll.append(i) for i in range(30)]
+        dll.prepend(-1)
+
+        assert dll.remove_node(nodes[10]) == 10
+        dll.move_to_front(nodes[20])
+        dll.move_to_back(nodes[0])
+        dll.move_to_back(nodes[0])
+
+        with pytest.raises(ValueError):
+            dll.remove_node(nodes[10])
+
+        expected = [20, -1] + [i for i in range(1, 30) if i not in (10, 20)] + [0]
+        assert values(dll) == expected
+        assert [dll[i] for i in range(len(dll))] == expected
+        assert dll.head is nodes[20]
+        assert dll.tail is nodes[0]
+
+    def test_node_of_other_list_rejected(self):
+        """Verify handles from anywhere in another list are rejected & leave both lists intact."""
+        dll, other = IndexedDoubleLinkedList(seed=9), IndexedDoubleLinkedList(seed=10)
+        dll.extend(range(5))
+        nodes = [other.append(i) for i in range(10, 15)]
+
+        for method in (dll.remove_node, dll.move_to_front, dll.move_to_back):
+            for node in (nodes[0], nodes[2], nodes[-1]):
+                with pytest.raises(ValueError):
+                    method(node)
+        assert values(dll) == list(range(5))
+        assert values(other) == list(range(10, 15))
+        assert_index_consistent(dll)
+        assert_index_consistent(other)
+        assert_index_consistent(dll)
+
+    @pytest.mark.parametrize('mutate', [
+        lambda dll: dll.append(9),
+        lambda dll: dll.pop_head(),
+        lambda dll: dll.delete(1),
+        lambda dll: dll.extend([9]),
+        lambda dll: dll.move_to_front(dll.tail),
+        lambda dll: dll.split_at(2),
+        lambda dll: dll.concat(IndexedDoubleLinkedList.from_iterable([9])),
+    ])
+    def test_mutation_during_iteration_raises(self, mutate):
+        """Verify overridden mutators are detected by the inherited iterators."""
+        dll = IndexedDoubleLinkedList.from_iterable(range(4))
+
+        with pytest.raises(RuntimeError):
+            for _ in dll:
+                mutate(dll)
+        assert list(reversed(dll)) == values(dll)[::-1]
+
+    def test_pickle_rebuilds_index(self):
+        """Verify unpickled lists get a consistent index of their own."""
+        dll = IndexedDoubleLinkedList.from_iterable(range(5000))
+        restored = pickle.loads(pickle.dumps(dll))
+
+        assert type(restored) is IndexedDoubleLinkedList
+        assert restored[4321] == 4321
+        assert_index_consistent(restored)
+
+    def test_sort_rethreads_index(self):
+        """Verify positional access works on the new order after sorting."""
+        rng = random.Random(9)
+        reference = [rng.randrange(1000) for _ in range(500)]
+        dll = IndexedDoubleLinkedList.from_iterable(reference)
+        dll.delete(10)
+        del reference[10]
+
+        dll.sort()
+        assert_index_consistent(dll)
+        assert [dll[i] for i in range(len(dll))] == sorted(reference)
+
+        dll.sort(key=str, reverse=True)
+        assert_index_consistent(dll)
+        assert values(dll) == sorted(reference, key=str, reverse=True)
+        dll.insert(7, -1)
+        assert dll[7] == -1
@@ -0,0 +1,194 @@
+import pytest
+from algorithms.data_structures.lru_cache import LRUCache, CacheStats, memoize
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache:
+    """Tests for LRUCache class"""
+
+    def test_invalid_limits(self):
+        """Verify non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            LRUCache(max_entries=0)
+        with pytest.raises(ValueError):
+            LRUCache(max_bytes=0)
+
+    def test_get_and_put(self):
+        """Verify stored values are returned and missing keys give default."""
+        cache = LRUCache()
+        cache.put('a', 1)
+        cache['b'] = 2
+
+        assert cache.get('a') == 1
+        assert cache['b'] == 2
+        assert cache.get('c') is None
+        assert cache.get('c', 'default') == 'default'
+        assert len(cache) == 2
+        with pytest.raises(KeyError):
+            cache['c']
+
+    def test_evicts_least_recently_used_entry(self):
+        """Verify exceeding max_entries evicts the entry used longest ago."""
+        cache = LRUCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+        assert cache.stats.evictions == 1
+
+    def test_put_existing_key_refreshes_recency(self):
+        """Verify overwriting a key replaces its value and makes it most recently used."""
+        cache = LRUCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('a', 10)
+        cache.put('c', 3)
+
+        assert cache.get('a') == 10
+        assert 'b' not in cache
+        assert len(cache) == 2
+
+    def test_evicts_by_bytes(self):
+        """Verify exceeding max_bytes evicts entries until total size fits."""
+        cache = LRUCache(max_bytes=10, sizeof=len)
+        cache.put('a', 'xxxx')
+        cache.put('b', 'yyyy')
+        cache.put('c', 'zzzz')
+
+        assert 'a' not in cache
+        assert cache.total_bytes == 8
+        assert cache.stats.evictions == 1
+
+    def test_value_larger_than_max_bytes_is_not_stored(self):
+        """Verify a value that can never fit is skipped without evicting others."""
+        cache = LRUCache(max_bytes=10, sizeof=len)
+        cache.put('a', 'xx')
+        cache.put('b', 'y' * 11)
+
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert cache.total_bytes == 2
+
+    def test_ttl_expiry(self):
+        """Verify entries expire after their TTL and count as misses."""
+        clock = FakeClock()
+        cache = LRUCache(ttl=10, clock=clock)
+        cache.put('a', 1)
+        cache.put('b', 2, ttl=30)
+
+        clock.now = 9
+        assert cache.get('a') == 1
+
+        clock.now = 10
+        assert 'a' not in cache
+        assert cache.get('a') is None
+        assert cache.get('b') == 2
+        assert cache.stats == CacheStats(hits=2, misses=1, evictions=0, expirations=1)
+        assert len(cache) == 1
+
+    def test_purge_expired(self):
+        """Verify purge removes every expired entry at once."""
+        clock = FakeClock()
+        cache = LRUCache(clock=clock)
+        cache.put('a', 1, ttl=1)
+        cache.put('b', 2, ttl=1)
+        cache.put('c', 3)
+
+        clock.now = 5
+        assert cache.purge_expired() == 2
+        assert len(cache) == 1
+        assert cache.stats.expirations == 2
+
+    def test_pop_and_delete(self):
+        """Verify pop returns removed values and raises without default."""
+        cache = LRUCache(sizeof=len, max_bytes=100)
+        cache.put('a', 'xyz')
+        cache.put('b', 'q')
+
+        assert cache.pop('a') == 'xyz'
+        assert cache.pop('a', None) is None
+        with pytest.raises(KeyError):
+            cache.pop('a')
+        del cache['b']
+        assert len(cache) == 0
+        assert cache.total_bytes == 0
+
+    def test_stats_hit_rate(self):
+        """Verify hit rate is computed out of hits and misses."""
+        cache = LRUCache()
+        assert cache.stats.hit_rate == 0.0
+
+        cache.put('a', 1)
+        cache.get('a')
+        cache.get('a')
+        cache.get('b')
+        assert cache.stats.hit_rate == pytest.approx(2 / 3)
+
+    def test_clear(self):
+        """Verify clear drops all entries but keeps statistics."""
+        cache = LRUCache()
+        cache.put('a', 1)
+        cache.get('a')
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get('a') is None
+        assert cache.stats.hits == 1
+
+
+class TestMemoize:
+    """Tests for memoize decorator"""
+
+    def test_caches_results(self):
+        """Verify repeated calls with equal arguments hit the cache."""
+        calls = []
+
+        @memoize(max_entries=2)
+        def square(x, power=2):
+            calls.append(x)
+            return x ** power
+
+        assert square(3) == 9
+        assert square(3) == 9
+        assert square(3, power=3) == 27
+        assert square(x=3) == 9
+        assert calls == [3, 3, 3]
+        assert square.cache.stats.hits == 1
+        assert square.__name__ == 'square'
+
+    def test_positional_tuple_does_not_collide_with_arguments(self):
+        """Verify a single tuple argument and several positional arguments get different keys."""
+        @memoize()
+        def identity(*args):
+            return args
+
+        assert identity(1, 2) == (1, 2)
+        assert identity((1, 2)) == ((1, 2),)
+
+    def test_evicts_old_results(self):
+        """Verify memoized results obey max_entries."""
+        calls = []
+
+        @memoize(max_entries=1)
+        def double(x):
+            calls.append(x)
+            return 2 * x
+
+        double(1)
+        double(2)
+        double(1)
+        assert calls == [1, 2, 1]
+        assert double.cache.stats.evictions == 2
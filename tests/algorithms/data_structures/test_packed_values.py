@@ -0,0 +1,41 @@
+import sys
+from array import array
+
+import pytest
+from algorithms.data_structures.packed_values import HEADER, MAGIC, pack_values, unpack_values
+
+
+class TestPackedValues:
+    """Tests for pack_values & unpack_values functions"""
+
+    def test_round_trip(self):
+        """Verify values come back with the typecode they were packed with."""
+        for typecode, values in [('d', [0.5, -1.0]), ('q', [2 ** 40, -3]), ('B', [0, 255]), ('d', [])]:
+            items = unpack_values(pack_values(values, typecode))
+            assert items.typecode == typecode
+            assert items.tolist() == values
+
+    def test_is_compact(self):
+        """Verify blob is header plus raw items."""
+        assert len(pack_values(range(1000), 'q')) == HEADER.size + 8000
+
+    def test_foreign_byte_order_is_swapped(self):
+        """Verify blobs packed on a platform of other endianness are read correctly."""
+        items = array('q', [1, 2, 3])
+        items.byteswap()
+        foreign = b'>' if sys.byteorder == 'little' else b'<'
+        data = HEADER.pack(MAGIC, b'q', foreign, 8) + items.tobytes()
+
+        assert unpack_values(data).tolist() == [1, 2, 3]
+
+    def test_invalid_data(self):
+        """Verify foreign blobs & mismatching item sizes are rejected."""
+        with pytest.raises(ValueError):
+            unpack_values(b'XXXX' + pack_values([1])[4:])
+        with pytest.raises(ValueError):
+            unpack_values(HEADER.pack(MAGIC, b'q', b'<', 4))
+
+    def test_values_must_fit_typecode(self):
+        """Verify values out of range of typecode are rejected."""
+        with pytest.raises(OverflowError):
+            pack_values([256], 'B')
@@ -0,0 +1,132 @@
+import pytest
+from algorithms.data_structures.persistent_linked_list import PersistentLinkedList, RECORD_OFFSETS
+
+
+class SimulatedCrash(Exception):
+    pass
+
+
+class CrashingList(PersistentLinkedList):
+    """Dies right after writing the header record, before applying link writes of the operation."""
+
+    crash = False
+
+    def _apply(self, links):
+        if self.crash and links:
+            raise SimulatedCrash
+        super()._apply(links)
+
+
+class TestPersistentLinkedList:
+    """Tests for PersistentLinkedList class"""
+
+    def test_invalid_arguments(self, tmp_path):
+        """Verify unknown fsync policies & empty capacity are rejected."""
+        with pytest.raises(ValueError):
+            PersistentLinkedList(tmp_path / 'list', fsync='sometimes')
+        with pytest.raises(ValueError):
+            PersistentLinkedList(tmp_path / 'list', capacity=0)
+
+    @pytest.mark.parametrize('fsync', ['always', 'batched', 'never'])
+    def test_operations_survive_reopen(self, tmp_path, fsync):
+        """Verify contents written under every policy are there after reopening."""
+        path = tmp_path / 'list'
+        with PersistentLinkedList(path, fsync=fsync, batch_size=3) as pll:
+            for i in range(6):
+                pll.append(i)
+            assert pll.pop_head() == 0
+            assert pll.pop_tail() == 5
+            assert pll.delete(1) == 2
+            assert pll.delete(10) is None
+
+        with PersistentLinkedList(path) as pll:
+            assert list(pll) == [1, 3, 4]
+            assert len(pll) == 3
+
+    def test_reopen_keeps_format(self, tmp_path):
+        """Verify existing files keep their payload format regardless of arguments."""
+        path = tmp_path / 'list'
+        with PersistentLinkedList(path, fmt='d') as pll:
+            pll.append(0.5)
+
+        with PersistentLinkedList(path, fmt='q') as pll:
+            assert pll.fmt == 'd'
+            assert pll.pop_head() == 0.5
+            assert pll.pop_head() is None
+
+    def test_grows_when_full(self, tmp_path):
+        """Verify the file doubles instead of running out of slots."""
+        path = tmp_path / 'list'
+        with PersistentLinkedList(path, capacity=2) as pll:
+            for i in range(9):
+                pll.append(i)
+            assert pll.capacity == 16
+
+        with PersistentLinkedList(path) as pll:
+            assert list(pll) == list(range(9))
+            assert pll.capacity == 16
+
+    def test_freed_slots_are_reused(self, tmp_path):
+        """Verify a queue that never holds more than capacity elements does not grow."""
+        with PersistentLinkedList(tmp_path / 'list', capacity=4) as pll:
+            for i in range(100):
+                pll.append(i)
+                if len(pll) == 4:
+                    pll.pop_head()
+            assert pll.capacity == 4
+            assert list(pll) == [97, 98, 99]
+
+    @pytest.mark.parametrize('operation, expected', [
+        (lambda pll: pll.append(9), [0, 1, 2, 3, 4, 9]),
+        (lambda pll: pll.pop_head(), [1, 2, 3, 4]),
+        (lambda pll: pll.pop_tail(), [0, 1, 2, 3]),
+        (lambda pll: pll.delete(2), [0, 1, 3, 4]),
+    ])
+    def test_crash_after_header_record_is_redone(self, tmp_path, operation, expected):
+        """Verify operations whose links were not written yet are finished on reopen."""
+        path = tmp_path / 'list'
+        crashed = CrashingList(path, fsync='never')
+        for i in range(5):
+            crashed.append(i)
+
+        crashed.crash = True
+        with pytest.raises(SimulatedCrash):
+            operation(crashed)
+
+        with PersistentLinkedList(path) as pll: # Crashed instance is never closed
+            assert list(pll) == expected
+            assert list(reversed([pll.pop_tail() for _ in range(len(pll))])) == expected
+        crashed.close()
+
+    def test_torn_header_record_falls_back_to_previous(self, tmp_path):
+        """Verify a corrupted latest record makes the list open in its previous state."""
+        path = tmp_path / 'list'
+        with PersistentLinkedList(path) as pll:
+            pll.append(1)
+            pll.append(2)
+            latest = RECORD_OFFSETS[pll._seq % 2]
+
+        with open(path, 'r+b') as file:
+            file.seek(latest + 8)
+            file.write(b'\xff' * 8)
+
+        with PersistentLinkedList(path) as pll:
+            assert list(pll) == [1]
+            pll.append(3)
+            assert pll.pop_tail() == 3
+            assert pll.pop_tail() == 1
+            assert pll.pop_tail() is None
+
+    def test_no_valid_header_record(self, tmp_path):
+        """Verify files without a valid header are refused."""
+        path = tmp_path / 'list'
+        with PersistentLinkedList(path) as pll:
+            pll.append(1)
+
+        with open(path, 'r+b') as file:
+            for offset in RECORD_OFFSETS:
+                file.seek(offset)
+                file.write(b'\xff' * 8)
+
+        with pytest.raises(ValueError):
+            PersistentLinkedList(path)
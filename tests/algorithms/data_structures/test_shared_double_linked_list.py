@@ -0,0 +1,175 @@
+import multiprocessing
+import pickle
+import struct
+
+import pytest
+from algorithms.data_structures.shared_double_linked_list import SharedDoubleLinkedList
+from algorithms.data_structures.slot_arena import SlotArena, arena_size
+
+
+@pytest.fixture
+def shared():
+    created = []
+
+    def factory(*args, **kwargs):
+        sll = SharedDoubleLinkedList(*args, **kwargs)
+        created.append(sll)
+        return sll
+
+    yield factory
+
+    for sll in created:
+        sll.close()
+        sll.unlink()
+
+
+def produce(shared_list, start, count):
+    for value in range(start, start + count):
+        shared_list.append(value)
+    shared_list.close()
+
+
+def drain(shared_list, output):
+    while (value := shared_list.pop_head()) is not None:
+        output.put(value)
+    output.put(None)
+    shared_list.close()
+
+
+class TestSlotArena:
+    """Tests for SlotArena class"""
+
+    def test_operations_on_both_ends(self):
+        """Verify the arena behaves like a deque."""
+        arena = SlotArena(memoryview(bytearray(arena_size('q', 8))), 'q', 8)
+        arena.append(1)
+        arena.append(2)
+        arena.prepend(0)
+
+        assert list(arena) == [0, 1, 2]
+        assert arena.pop_tail() == 2
+        assert arena.pop_head() == 0
+        assert arena.pop_head() == 1
+        assert arena.pop_head() is None
+        assert arena.pop_tail() is None
+        assert len(arena) == 0
+
+    def test_delete(self):
+        """Verify delete unlinks from any position & ignores out of bounds indices."""
+        arena = SlotArena(memoryview(bytearray(arena_size('q', 8))), 'q', 8)
+        for i in range(6):
+            arena.append(i)
+
+        assert arena.delete(6) is None
+        assert arena.delete(-1) is None
+        assert arena.delete(4) == 4
+        assert arena.delete(1) == 1
+        assert arena.delete(0) == 0
+        assert list(arena) == [2, 3, 5]
+
+    def test_freed_slots_are_reused(self):
+        """Verify the free list keeps a full arena usable after pops."""
+        arena = SlotArena(memoryview(bytearray(arena_size('q', 3))), 'q', 3)
+        for i in range(3):
+            arena.append(i)
+        with pytest.raises(MemoryError):
+            arena.append(3)
+
+        arena.delete(1)
+        arena.pop_head()
+        arena.append(3)
+        arena.prepend(4)
+
+        assert list(arena) == [4, 2, 3]
+        with pytest.raises(MemoryError):
+            arena.append(5)
+
+    def test_rejected_value_allocates_nothing(self):
+        """Verify a value not matching fmt leaves the arena untouched."""
+        arena = SlotArena(memoryview(bytearray(arena_size('q', 1))), 'q', 1)
+
+        with pytest.raises(struct.error):
+            arena.append('not a number')
+        arena.append(1)
+        assert list(arena) == [1]
+
+    def test_payload_formats(self):
+        """Verify bytes & multi-field payloads round-trip."""
+        buffer = memoryview(bytearray(arena_size('8s', 2)))
+        arena = SlotArena(buffer, '8s', 2)
+        arena.append(b'abc')
+        assert arena.pop_head() == b'abc\0\0\0\0\0'
+
+        arena = SlotArena(memoryview(bytearray(arena_size('dq', 2))), 'dq', 2)
+        arena.append((1.5, 7))
+        assert arena.pop_head() == (1.5, 7)
+
+    def test_reopen_buffer(self):
+        """Verify an existing arena is picked up from its buffer without formatting."""
+        buffer = memoryview(bytearray(arena_size('d', 4)))
+        arena = SlotArena(buffer, 'd', 4)
+        arena.append(0.5)
+        arena.append(1.5)
+
+        reopened = SlotArena(buffer)
+        assert reopened.fmt == 'd'
+        assert reopened.capacity == 4
+        assert list(reopened) == [0.5, 1.5]
+
+        with pytest.raises(ValueError):
+            SlotArena(memoryview(bytearray(arena_size('d', 4))))
+
+
+class TestSharedDoubleLinkedList:
+    """Tests for SharedDoubleLinkedList class"""
+
+    def test_attach_sees_same_elements(self, shared):
+        """Verify a second handle to the same memory shares contents."""
+        sll = shared(16, 'q')
+        sll.append(1)
+
+        other = SharedDoubleLinkedList.attach(sll.name, sll._lock)
+        other.append(2)
+        assert sll.pop_head() == 1
+        assert list(other) == [2]
+        assert len(sll) == 1
+        other.close()
+
+    def test_pickles_to_name_and_lock(self, shared):
+        """Verify pickling attaches instead of copying elements."""
+        sll = shared(16, 'd')
+        sll.append(2.5)
+
+        function, args = sll.__reduce__()
+        assert function == SharedDoubleLinkedList.attach
+        assert args == (sll.name, sll._lock)
+        with pytest.raises(RuntimeError): # Locks only travel when spawning processes
+            pickle.dumps(sll)
+
+    def test_processes_append_and_pop_concurrently(self, shared):
+        """Verify producers & consumers in other processes exchange every value once."""
+        sll = shared(4000, 'q')
+        producers = [multiprocessing.Process(target=produce, args=(sll, p * 1000, 1000)) for p in range(3)]
+        for process in producers:
+            process.start()
+        for process in producers:
+            process.join()
+        assert len(sll) == 3000
+
+        output = multiprocessing.Queue()
+        consumers = [multiprocessing.Process(target=drain, args=(sll, output)) for _ in range(2)]
+        for process in consumers:
+            process.start()
+
+        values, finished = [], 0
+        while finished < len(consumers):
+            value = output.get(timeout=30)
+            if value is None:
+                finished += 1
+            else:
+                values.append(value)
+        for process in consumers:
+            process.join()
+
+        assert sorted(values) == list(range(3000))
+        assert len(sll) == 0
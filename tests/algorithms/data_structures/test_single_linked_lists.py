@@ -1,3 +1,6 @@
+import pickle
+import random
+
 import pytest
 from algorithms.data_structures.single_linked_list import SingleLinkedList, Node
 
@@ -13,6 +16,10 @@ class TestNode:
     def test_node_repr(self):
         node = Node(10)
         assert repr(node) == "Node(value=10)"
+    
+    def test_node_has_no_instance_dict(self):
+        node = Node(1)
+        assert not hasattr(node, '__dict__')
 
 
 class TestSingleLinkedList:
@@ -426,3 +433,364 @@ class TestSingleLinkedList:
         assert ll.tail.value == 3
 
 
+
+
+class TestSingleLinkedListPredecessorIndex:
+    """Tests for SingleLinkedList with predecessor_index=True"""
+    
+    def values(self, ll):
+        values = []
+        current = ll.head
+        while current:
+            values.append(current.value)
+            current = current.next
+        return values
+    
+    def test_pop_tail_drains_in_reverse_order(self):
+        ll = SingleLinkedList(predecessor_index=True)
+        for i in range(100):
+            ll.append(i)
+        
+        assert [ll.pop_tail() for _ in range(100)] == list(range(99, -1, -1))
+        assert ll.head is None
+        assert ll.tail is None
+        assert ll.pop_tail() is None
+    
+    def test_pop_tail_after_prepend(self):
+        ll = SingleLinkedList(predecessor_index=True)
+        ll.prepend(2)
+        ll.prepend(1)
+        ll.append(3)
+        
+        assert ll.pop_tail() == 3
+        assert ll.tail.value == 2
+        assert ll.tail.next is None
+        assert self.values(ll) == [1, 2]
+    
+    def test_pop_tail_after_pop_head(self):
+        ll = SingleLinkedList(predecessor_index=True)
+        for i in range(4):
+            ll.append(i)
+        
+        assert ll.pop_head() == 0
+        assert ll.pop_tail() == 3
+        assert ll.pop_tail() == 2
+        assert ll.head is ll.tail
+        assert ll.head.value == 1
+    
+    def test_delete_keeps_index_in_sync(self):
+        ll = SingleLinkedList(predecessor_index=True)
+        for i in range(5):
+            ll.append(i)
+        
+        assert ll.delete(2) == 2
+        assert ll.delete(3) == 4
+        assert ll.delete(3) is None
+        assert ll.tail.value == 3
+        assert ll.pop_tail() == 3
+        assert self.values(ll) == [0, 1]
+    
+    def test_remove_value_keeps_index_in_sync(self):
+        for value_index in (False, True):
+            ll = SingleLinkedList.from_iterable([0, 1, 2, 1, 3, 4], predecessor_index=True, value_index=value_index)
+            
+            for value in (1, 3, 0, 4, 1):
+                ll.remove_value(value)
+                assert [ll[i] for i in range(len(ll))] == self.values(ll)
+            assert self.values(ll) == [2]
+            assert ll.pop_tail() == 2
+            assert ll.head is None
+    
+    def test_matches_plain_list_under_random_operations(self):
+        rng = random.Random(0)
+        indexed = SingleLinkedList(predecessor_index=True)
+        plain = SingleLinkedList()
+        
+        for i in range(1000):
+            operation = rng.randrange(5)
+            if operation == 0:
+                indexed.append(i)
+                plain.append(i)
+            elif operation == 1:
+                indexed.prepend(i)
+                plain.prepend(i)
+            elif operation == 2:
+                assert indexed.pop_head() == plain.pop_head()
+            elif operation == 3:
+                assert indexed.pop_tail() == plain.pop_tail()
+            else:
+                pos_idx = rng.randrange(-1, 20)
+                assert indexed.delete(pos_idx) == plain.delete(pos_idx)
+            assert self.values(indexed) == self.values(plain)
+            assert (indexed.tail and indexed.tail.value) == (plain.tail and plain.tail.value)
+
+
+class TestSingleLinkedListBulkOperations:
+    """Tests for SingleLinkedList from_iterable, extend & extendleft"""
+    
+    def values(self, ll):
+        values = []
+        current = ll.head
+        while current:
+            values.append(current.value)
+            current = current.next
+        return values
+    
+    def test_from_iterable(self):
+        ll = SingleLinkedList.from_iterable(range(5))
+        assert self.values(ll) == [0, 1, 2, 3, 4]
+        assert ll.tail.value == 4
+        assert ll.tail.next is None
+    
+    def test_from_empty_iterable(self):
+        ll = SingleLinkedList.from_iterable([])
+        assert ll.head is None
+        assert ll.tail is None
+    
+    def test_from_generator(self):
+        ll = SingleLinkedList.from_iterable(i * i for i in range(4))
+        assert self.values(ll) == [0, 1, 4, 9]
+    
+    def test_extend(self):
+        ll = SingleLinkedList()
+        ll.extend([1, 2])
+        ll.extend(iter([3, 4]))
+        ll.extend([])
+        assert self.values(ll) == [1, 2, 3, 4]
+        assert ll.tail.value == 4
+    
+    def test_extend_with_itself(self):
+        ll = SingleLinkedList.from_iterable([1, 2])
+        ll.extend(ll)
+        assert self.values(ll) == [1, 2, 1, 2]
+    
+    def test_extendleft(self):
+        ll = SingleLinkedList()
+        ll.extendleft([1, 2])
+        ll.extendleft([3])
+        assert self.values(ll) == [3, 2, 1]
+        assert ll.head.value == 3
+        assert ll.tail.value == 1
+    
+    def test_bulk_operations_keep_predecessor_index(self):
+        ll = SingleLinkedList.from_iterable(range(3), predecessor_index=True)
+        ll.extendleft([-1, -2])
+        ll.extend([3, 4])
+        
+        assert [ll.pop_tail() for _ in range(7)] == [4, 3, 2, 1, 0, -1, -2]
+        assert ll.head is None
+
+
+class TestSingleLinkedListProtocols:
+    """Tests for SingleLinkedList __len__, __iter__, __contains__ & __getitem__"""
+    
+    def test_len_tracks_every_operation(self):
+        for predecessor_index in (False, True):
+            ll = SingleLinkedList(predecessor_index=predecessor_index)
+            assert len(ll) == 0
+            ll.extend([1, 2, 3])
+            ll.extendleft([0])
+            ll.append(4)
+            ll.prepend(-1)
+            assert len(ll) == 6
+            ll.pop_head()
+            ll.pop_tail()
+            ll.delete(1)
+            ll.delete(10)
+            assert len(ll) == 3
+            assert list(ll) == [0, 2, 3]
+    
+    def test_iter_and_contains(self):
+        ll = SingleLinkedList.from_iterable(['a', 'b', 'c'])
+        assert list(ll) == ['a', 'b', 'c']
+        assert 'b' in ll
+        assert 'd' not in ll
+        assert list(SingleLinkedList()) == []
+    
+    def test_getitem(self):
+        for predecessor_index in (False, True):
+            ll = SingleLinkedList.from_iterable(range(5), predecessor_index=predecessor_index)
+            assert [ll[i] for i in range(5)] == [0, 1, 2, 3, 4]
+            assert ll[-1] == 4
+            assert ll[-5] == 0
+            with pytest.raises(IndexError):
+                ll[5]
+            with pytest.raises(IndexError):
+                ll[-6]
+    
+    def test_mutation_during_iteration_raises(self):
+        ll = SingleLinkedList.from_iterable(range(3))
+        with pytest.raises(RuntimeError):
+            for value in ll:
+                ll.pop_head()
+    
+    def test_iteration_after_mutation_is_fine(self):
+        ll = SingleLinkedList.from_iterable(range(3))
+        iterator = iter(ll)
+        ll.append(3)
+        assert list(iterator) == [0, 1, 2, 3] # Generator did not start before the append
+
+    def test_pickle_long_list(self):
+        for predecessor_index in (False, True):
+            ll = SingleLinkedList.from_iterable(range(100_000), predecessor_index=predecessor_index)
+            restored = pickle.loads(pickle.dumps(ll))
+            assert list(restored) == list(range(100_000))
+            assert len(restored) == 100_000
+            assert (restored._spine is not None) == predecessor_index
+            assert restored.pop_tail() == 99_999
+    
+    def test_to_bytes_round_trip(self):
+        ll = SingleLinkedList.from_iterable([3, 1, 2])
+        restored = SingleLinkedList.from_bytes(ll.to_bytes('q'), predecessor_index=True)
+        assert list(restored) == [3, 1, 2]
+        assert restored.pop_tail() == 2
+    
+    def test_sort(self):
+        for predecessor_index in (False, True):
+            ll = SingleLinkedList.from_iterable([3, 1, 2, 1], predecessor_index=predecessor_index)
+            ll.sort()
+            assert list(ll) == [1, 1, 2, 3]
+            assert ll.tail.value == 3
+            ll.sort(reverse=True)
+            assert list(ll) == [3, 2, 1, 1]
+            assert ll.pop_tail() == 1
+            assert ll[1] == 2
+
+
+class TestSingleLinkedListValueIndex:
+    """Tests for SingleLinkedList with value_index=True"""
+    
+    def values(self, ll):
+        values = []
+        current = ll.head
+        while current:
+            values.append(current.value)
+            current = current.next
+        return values
+    
+    def assert_index_in_sync(self, ll):
+        nodes = []
+        current = ll.head
+        while current:
+            nodes.append(current)
+            current = current.next
+        for node in nodes:
+            expected = {id(other) for other in nodes if other.value == node.value}
+            assert {id(other) for other in ll._index.lookup(node.value)} == expected
+    
+    def test_contains_uses_index(self):
+        ll = SingleLinkedList.from_iterable([1, 'a', (2, 3)], value_index=True)
+        
+        assert 1 in ll
+        assert 'a' in ll
+        assert (2, 3) in ll
+        assert 2 not in ll
+        assert 1.0 in ll # Equal values hash equally
+    
+    def test_index_of(self):
+        ll = SingleLinkedList.from_iterable([5, 6, 5, 7], value_index=True)
+        
+        assert ll.index_of(5) == 0
+        assert ll.index_of(7) == 3
+        with pytest.raises(ValueError):
+            ll.index_of(8)
+    
+    def test_remove_value_first_occurrence(self):
+        ll = SingleLinkedList.from_iterable([1, 2, 1, 3, 1], value_index=True)
+        
+        ll.remove_value(1)
+        assert self.values(ll) == [2, 1, 3, 1]
+        ll.remove_value(3)
+        assert self.values(ll) == [2, 1, 1]
+        assert ll.tail.value == 1
+        ll.remove_value(1)
+        ll.remove_value(1)
+        assert self.values(ll) == [2]
+        assert ll.head is ll.tail
+        with pytest.raises(ValueError):
+            ll.remove_value(1)
+        self.assert_index_in_sync(ll)
+    
+    def test_remove_value_before_tail_moves_tail(self):
+        ll = SingleLinkedList.from_iterable([1, 2, 3], value_index=True, predecessor_index=True)
+        
+        ll.remove_value(2)
+        assert self.values(ll) == [1, 3]
+        assert ll.tail.value == 3
+        assert ll.pop_tail() == 3
+        assert ll.tail.value == 1
+        self.assert_index_in_sync(ll)
+    
+    def test_remove_value_without_index(self):
+        ll = SingleLinkedList.from_iterable([1, 2, 3, 2])
+        
+        ll.remove_value(2)
+        assert self.values(ll) == [1, 3, 2]
+        assert ll.index_of(2) == 2
+        with pytest.raises(ValueError):
+            ll.remove_value(4)
+    
+    def test_unhashable_values(self):
+        ll = SingleLinkedList.from_iterable([[1, 2], {'a': 1}, 3], value_index=True)
+        
+        assert [1, 2] in ll
+        assert {'a': 1} in ll
+        assert [2, 1] not in ll
+        assert (1, 2) not in ll
+        assert ll.index_of({'a': 1}) == 1
+        ll.remove_value([1, 2])
+        assert [1, 2] not in ll
+        assert self.values(ll) == [{'a': 1}, 3]
+    
+    def test_unhashable_queries_of_hashable_values(self):
+        for value_index in (False, True):
+            ll = SingleLinkedList.from_iterable([b'a', frozenset({1}), (1, 2)], value_index=value_index)
+            
+            assert bytearray(b'a') in ll
+            assert {1} in ll
+            assert [1, 2] not in ll
+            assert ll.index_of({1}) == 1
+            ll.remove_value(bytearray(b'a'))
+            assert self.values(ll) == [frozenset({1}), (1, 2)]
+            with pytest.raises(ValueError):
+                ll.remove_value([1, 2])
+    
+    def test_pickle_keeps_index(self):
+        ll = pickle.loads(pickle.dumps(SingleLinkedList.from_iterable([1, 2], value_index=True)))
+        
+        assert ll._index is not None
+        assert 2 in ll
+        assert ll.index_of(2) == 1
+    
+    def test_matches_list_under_random_operations(self):
+        rng = random.Random(0)
+        ll = SingleLinkedList(value_index=True)
+        expected = []
+        
+        for i in range(2000):
+            operation = rng.randrange(7)
+            value = rng.choice([rng.randrange(20), [rng.randrange(3)]])
+            if operation == 0:
+                ll.append(value)
+                expected.append(value)
+            elif operation == 1:
+                ll.prepend(value)
+                expected.insert(0, value)
+            elif operation == 2:
+                assert ll.pop_head() == (expected.pop(0) if expected else None)
+            elif operation == 3:
+                assert ll.pop_tail() == (expected.pop() if expected else None)
+            elif operation == 4:
+                pos_idx = rng.randrange(len(expected) + 1)
+                assert ll.delete(pos_idx) == (expected.pop(pos_idx) if pos_idx < len(expected) else None)
+            elif operation == 5:
+                ll.extend([value, i])
+                expected.extend([value, i])
+            elif value in expected:
+                ll.remove_value(value)
+                expected.remove(value)
+            else:
+                assert value not in ll
+            assert self.values(ll) == expected
+            assert (value in ll) == (value in expected)
+        self.assert_index_in_sync(ll)
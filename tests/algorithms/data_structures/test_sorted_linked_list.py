@@ -0,0 +1,216 @@
+import bisect
+import pickle
+import random
+
+import pytest
+from algorithms.data_structures.sorted_linked_list import SortedLinkedList
+
+
+def values(sll):
+    """Collects values walking level 0 from head & verifies backward links along the way."""
+    output = []
+    current = sll._list.head
+    while current:
+        if current.next:
+            assert current.next.prev is current
+        output.append(current.value)
+        current = current.next
+    return output
+
+
+def assert_index_consistent(sll):
+    """Verifies every express link points at the right node & jumps over the right number of nodes."""
+    sll = sll._list
+    nodes = []
+    current = sll.head
+    while current:
+        nodes.append(current)
+        current = current.next
+    positions = {id(node): pos for pos, node in enumerate(nodes)}
+    positions[id(sll._sentinel)] = -1
+
+    for node in [sll._sentinel] + nodes:
+        pos = positions[id(node)]
+        height = sll._height if node is sll._sentinel else len(node.skips)
+        for level in range(height):
+            target = node.skips[level]
+            target_pos = len(nodes) if target is None else positions[id(target)]
+            assert node.widths[level] == target_pos - pos
+
+
+class Item:
+    """Value ordered by `key` only, so equal values can still be told apart."""
+
+    def __init__(self, key, tag):
+        self.key, self.tag = key, tag
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+class TestSortedLinkedList:
+    """Tests for SortedLinkedList class"""
+
+    def test_add_keeps_order(self):
+        """Verify added values are kept in ascending order."""
+        sll = SortedLinkedList()
+        for value in [5, 1, 4, 2, 3]:
+            sll.add(value)
+        assert values(sll) == [1, 2, 3, 4, 5]
+        assert len(sll) == 5
+        assert_index_consistent(sll)
+
+    def test_add_after_equal_values(self):
+        """Verify equal values stay in insertion order."""
+        sll = SortedLinkedList()
+        for tag, key in enumerate([2, 1, 2, 1, 2]):
+            sll.add(Item(key, tag))
+        assert [(item.key, item.tag) for item in values(sll)] == [(1, 1), (1, 3), (2, 0), (2, 2), (2, 4)]
+
+    def test_from_iterable_sorts(self):
+        """Verify construction from unordered iterable sorts values."""
+        sll = SortedLinkedList.from_iterable([3, 1, 2])
+        assert values(sll) == [1, 2, 3]
+        assert_index_consistent(sll)
+
+    def test_update_after_tail(self):
+        """Verify update with values after tail links them in order."""
+        sll = SortedLinkedList.from_iterable([1, 2])
+        sll.update([5, 3, 4])
+        assert values(sll) == [1, 2, 3, 4, 5]
+        assert_index_consistent(sll)
+
+    def test_update_interleaved(self):
+        """Verify update with values before tail adds each of them in place."""
+        sll = SortedLinkedList.from_iterable([2, 4])
+        sll.update([5, 1, 3])
+        assert values(sll) == [1, 2, 3, 4, 5]
+        assert_index_consistent(sll)
+
+    def test_remove(self):
+        """Verify remove deletes first element equal to value."""
+        sll = SortedLinkedList.from_iterable([Item(1, 'a'), Item(2, 'b'), Item(2, 'c')])
+        sll.remove(Item(2, None))
+        assert [item.tag for item in values(sll)] == ['a', 'c']
+        assert_index_consistent(sll)
+
+    def test_remove_missing_raises(self):
+        """Verify remove of missing value raises ValueError."""
+        sll = SortedLinkedList.from_iterable([1, 3])
+        with pytest.raises(ValueError):
+            sll.remove(2)
+        with pytest.raises(ValueError):
+            sll.remove(4)
+        with pytest.raises(ValueError):
+            SortedLinkedList().remove(1)
+
+    def test_remove_node_among_equal_values(self):
+        """Verify remove_node deletes exactly the handled node among equal values."""
+        sll = SortedLinkedList()
+        nodes = [sll.add(Item(1, tag)) for tag in range(50)]
+        assert sll.remove_node(nodes[30]).tag == 30
+        assert [item.tag for item in values(sll)] == [tag for tag in range(50) if tag != 30]
+        assert_index_consistent(sll)
+        with pytest.raises(ValueError):
+            sll.remove_node(nodes[30])
+
+    def test_bisect(self):
+        """Verify bisect_left & bisect_right agree with bisect module."""
+        data = sorted(random.Random(0).choices(range(20), k=100))
+        sll = SortedLinkedList.from_iterable(data)
+        for value in range(-1, 22):
+            assert sll.bisect_left(value) == bisect.bisect_left(data, value)
+            assert sll.bisect_right(value) == bisect.bisect_right(data, value)
+        assert sll.bisect(5) == bisect.bisect(data, 5)
+
+    def test_contains(self):
+        """Verify membership checks values by order."""
+        sll = SortedLinkedList.from_iterable([1, 3, 5])
+        assert 3 in sll
+        assert 4 not in sll
+        assert 6 not in sll
+        assert 1 not in SortedLinkedList()
+
+    def test_irange(self):
+        """Verify irange yields values within inclusive bounds."""
+        sll = SortedLinkedList.from_iterable(range(10))
+        assert list(sll.irange(3, 6)) == [3, 4, 5, 6]
+        assert list(sll.irange(maximum=2)) == [0, 1, 2]
+        assert list(sll.irange(minimum=8)) == [8, 9]
+        assert list(sll.irange()) == list(range(10))
+        assert list(sll.irange(6, 3)) == []
+
+    def test_irange_mutation_raises(self):
+        """Verify irange raises RuntimeError if list changes while iterating."""
+        sll = SortedLinkedList.from_iterable(range(5))
+        with pytest.raises(RuntimeError):
+            for value in sll.irange():
+                sll.add(value)
+
+    def test_pop_min_max(self):
+        """Verify pop_min & pop_max return smallest & largest values."""
+        sll = SortedLinkedList.from_iterable([3, 1, 2])
+        assert sll.pop_min() == 1
+        assert sll.pop_max() == 3
+        assert values(sll) == [2]
+        sll.pop_min()
+        assert sll.pop_min() is None
+        assert sll.pop_max() is None
+
+    def test_positional_access(self):
+        """Verify positional indexing & delete keep working."""
+        sll = SortedLinkedList.from_iterable([4, 2, 3, 1])
+        assert sll[1] == 2
+        assert sll[-1] == 4
+        sll.delete(1)
+        assert values(sll) == [1, 3, 4]
+        assert_index_consistent(sll)
+
+    def test_positional_placement_not_offered(self):
+        """Verify operations placing values by position are not part of the interface."""
+        for method in ('append', 'prepend', 'insert', 'extend', 'extendleft', 'move_to_front', 'move_to_back', 'sort'):
+            assert not hasattr(SortedLinkedList(), method)
+
+    def test_remove_node_of_other_list_raises(self):
+        """Verify handles of another list are rejected."""
+        sll, other = SortedLinkedList.from_iterable([1, 2]), SortedLinkedList()
+        node = other.add(3)
+        with pytest.raises(ValueError):
+            sll.remove_node(node)
+        assert values(sll) == [1, 2]
+
+    def test_iteration_and_clear(self):
+        """Verify iteration in both directions & clearing."""
+        sll = SortedLinkedList.from_iterable([2, 3, 1])
+        assert list(sll) == [1, 2, 3]
+        assert list(reversed(sll)) == [3, 2, 1]
+        sll.clear()
+        assert len(sll) == 0
+        assert 1 not in sll
+
+    def test_pickle_roundtrip(self):
+        """Verify pickled list restores with values & keeps accepting added values."""
+        sll = pickle.loads(pickle.dumps(SortedLinkedList.from_iterable([3, 1, 2])))
+        sll.add(0)
+        assert values(sll) == [0, 1, 2, 3]
+        assert_index_consistent(sll)
+
+    def test_random_operations_match_sorted_list(self):
+        """Verify random additions & removals keep the same values as bisect.insort on list."""
+        rng = random.Random(1)
+        sll, expected = SortedLinkedList(), []
+        for _ in range(2_000):
+            if expected and rng.random() < 0.4:
+                value = rng.choice(expected)
+                sll.remove(value)
+                expected.remove(value)
+            else:
+                value = rng.randrange(100)
+                sll.add(value)
+                bisect.insort(expected, value)
+        assert values(sll) == expected
+        assert len(sll) == len(expected)
+        assert_index_consistent(sll)
@@ -0,0 +1,171 @@
+import random
+
+import pytest
+from algorithms.data_structures.unrolled_double_linked_list import UnrolledDoubleLinkedList, Block
+
+
+def drain(ull):
+    """Pops every value from head, returning them in order."""
+    values = []
+    while len(ull):
+        values.append(ull.pop_head())
+    return values
+
+
+def blocks(ull):
+    """Collects blocks from head to tail."""
+    output = []
+    current = ull.head
+    while current:
+        output.append(current)
+        current = current.next
+    return output
+
+
+class TestBlock:
+    """Tests for Block class"""
+
+    def test_block_creation(self):
+        """Verify block initializes with an empty window and null links."""
+        block = Block(4, 2)
+        assert block.values == [None] * 4
+        assert len(block) == 0
+        assert block.prev is None
+        assert block.next is None
+
+    def test_block_has_no_instance_dict(self):
+        """Verify block is slotted."""
+        assert not hasattr(Block(4, 0), '__dict__')
+
+
+class TestUnrolledDoubleLinkedList:
+    """Tests for UnrolledDoubleLinkedList class"""
+
+    def test_invalid_block_capacity(self):
+        """Verify block capacity below 2 is rejected."""
+        with pytest.raises(ValueError):
+            UnrolledDoubleLinkedList(block_capacity=1)
+
+    def test_empty_list_initialization(self):
+        """Verify empty list has zero length and returns None on pops."""
+        ull = UnrolledDoubleLinkedList()
+        assert len(ull) == 0
+        assert ull.pop_head() is None
+        assert ull.pop_tail() is None
+        assert ull.delete(0) is None
+
+    def test_append_spills_into_new_blocks(self):
+        """Verify appending past block capacity links new tail blocks."""
+        ull = UnrolledDoubleLinkedList(block_capacity=4)
+        for i in range(10):
+            ull.append(i)
+
+        assert len(ull) == 10
+        assert len(blocks(ull)) > 1
+        assert ull.head.prev is None
+        assert ull.tail.next is None
+        assert drain(ull) == list(range(10))
+
+    def test_prepend_spills_into_new_blocks(self):
+        """Verify prepending past block capacity links new head blocks."""
+        ull = UnrolledDoubleLinkedList(block_capacity=4)
+        for i in range(10):
+            ull.prepend(i)
+
+        assert len(ull) == 10
+        assert len(blocks(ull)) > 1
+        assert drain(ull) == list(range(9, -1, -1))
+
+    def test_block_links_are_bidirectional(self):
+        """Verify each block's prev and next pointers are correctly linked."""
+        ull = UnrolledDoubleLinkedList(block_capacity=4)
+        for i in range(20):
+            ull.append(i)
+            ull.prepend(-i)
+
+        chain = blocks(ull)
+        for left, right in zip(chain, chain[1:]):
+            assert left.next is right
+            assert right.prev is left
+        assert chain[-1] is ull.tail
+
+    def test_pop_tail_multiple_times(self):
+        """Verify popping tail repeatedly returns values in reverse order across blocks."""
+        ull = UnrolledDoubleLinkedList(block_capacity=4)
+        for i in range(10):
+            ull.append(i)
+
+        assert [ull.pop_tail() for _ in range(10)] == list(range(9, -1, -1))
+        assert len(ull) == 0
+        assert ull.pop_tail() is None
+
+    def test_emptied_blocks_are_released(self):
+        """Verify popping releases emptied blocks, keeping a single block when empty."""
+        ull = UnrolledDoubleLinkedList(block_capacity=4)
+        for i in range(20):
+            ull.append(i)
+
+        drain(ull)
+        assert ull.head is ull.tail
+        assert len(ull.head) == 0
+
+        ull.append(1)
+        ull.prepend(0)
+        assert drain(ull) == [0, 1]
+
+    def test_delete_out_of_bounds_index(self):
+        """Verify deleting with negative or too large index returns None without changes."""
+        ull = UnrolledDoubleLinkedList()
+        ull.append(1)
+
+        assert ull.delete(-1) is None
+        assert ull.delete(1) is None
+        assert len(ull) == 1
+
+    def test_delete_middle_elements(self):
+        """Verify deleting from the middle of blocks near head and near tail."""
+        ull = UnrolledDoubleLinkedList(block_capacity=4)
+        for i in range(12):
+            ull.append(i)
+
+        assert ull.delete(2) == 2
+        assert ull.delete(8) == 9
+        assert len(ull) == 10
+        assert drain(ull) == [0, 1, 3, 4, 5, 6, 7, 8, 10, 11]
+
+    def test_delete_merges_sparse_blocks(self):
+        """Verify deleting from the middle keeps block count bounded."""
+        ull = UnrolledDoubleLinkedList(block_capacity=8)
+        for i in range(64):
+            ull.append(i)
+
+        while len(ull) > 2:
+            ull.delete(len(ull)//2)
+
+        assert len(blocks(ull)) <= 2
+
+    def test_matches_reference_under_random_operations(self):
+        """Verify random mixed operations behave like a Python list."""
+        rng = random.Random(0)
+        ull = UnrolledDoubleLinkedList(block_capacity=4)
+        reference = []
+
+        for i in range(2000):
+            operation = rng.randrange(5)
+            if operation == 0:
+                ull.append(i)
+                reference.append(i)
+            elif operation == 1:
+                ull.prepend(i)
+                reference.insert(0, i)
+            elif operation == 2:
+                assert ull.pop_head() == (reference.pop(0) if reference else None)
+            elif operation == 3:
+                assert ull.pop_tail() == (reference.pop() if reference else None)
+            else:
+                pos_idx = rng.randrange(-1, len(reference) + 1)
+                expected = reference.pop(pos_idx) if 0 <= pos_idx < len(reference) else None
+                assert ull.delete(pos_idx) == expected
+            assert len(ull) == len(reference)
+
+        assert drain(ull) == reference
@@ -0,0 +1,113 @@
+from algorithms.data_structures.double_linked_list import Node
+from algorithms.data_structures.value_index import CountingBloomFilter, ValueIndex
+
+
+class Opaque:
+    """Unhashable value without a fingerprint, equal by `key`."""
+
+    __hash__ = None
+
+    def __init__(self, key):
+        self.key = key
+
+    def __eq__(self, other):
+        return isinstance(other, Opaque) and self.key == other.key
+
+
+class TestCountingBloomFilter:
+    """Tests for CountingBloomFilter class"""
+
+    def test_no_false_negatives(self):
+        """Verify every added key is reported as possibly present."""
+        bloom = CountingBloomFilter(1_000)
+        for key in range(1_000):
+            bloom.add(key)
+        assert all(bloom.might_contain(key) for key in range(1_000))
+
+    def test_false_positive_rate(self):
+        """Verify keys never added are mostly ruled out at full capacity."""
+        bloom = CountingBloomFilter(1_000)
+        for key in range(1_000):
+            bloom.add(key)
+        false_positives = sum(bloom.might_contain(('other', key)) for key in range(10_000))
+        assert false_positives < 500
+
+    def test_discard(self):
+        """Verify discarded keys are ruled out while others stay."""
+        bloom = CountingBloomFilter(10)
+        bloom.add('a')
+        bloom.add('b')
+        bloom.discard('a')
+        assert not bloom.might_contain('a')
+        assert bloom.might_contain('b')
+
+
+class TestValueIndex:
+    """Tests for ValueIndex class"""
+
+    def test_repeated_values(self):
+        """Verify repeated values collect all their nodes & drop back to a single one."""
+        index = ValueIndex()
+        first, second = Node(1), Node(1)
+        index.add(first)
+        index.add(second)
+        assert set(index.lookup(1)) == {first, second}
+
+        index.discard(first)
+        assert list(index.lookup(1)) == [second]
+        index.discard(second)
+        assert not index.lookup(1)
+
+    def test_add_chain(self):
+        """Verify chains of nodes are indexed up to the stop node."""
+        nodes = [Node(value) for value in range(4)]
+        for node, following in zip(nodes, nodes[1:]):
+            node.next = following
+        index = ValueIndex()
+        index.add_chain(nodes[0], nodes[3])
+        assert [bool(index.lookup(value)) for value in range(4)] == [True, True, True, False]
+
+    def test_unhashable_values(self):
+        """Verify unhashable values are found by equality & the filter grows with them."""
+        index = ValueIndex()
+        nodes = [Node([value]) for value in range(100)]
+        for node in nodes:
+            index.add(node)
+        assert all(list(index.lookup([value])) == [nodes[value]] for value in range(100))
+        assert not index.lookup([100])
+        assert not index.lookup(5)
+
+        for node in nodes:
+            index.discard(node)
+        assert not index.lookup([5])
+
+    def test_values_without_fingerprint(self):
+        """Verify unhashable values that cannot be frozen are still found."""
+        index = ValueIndex()
+        node = Node(Opaque(1))
+        index.add(node)
+        assert list(index.lookup(Opaque(1))) == [node]
+        assert not index.lookup(Opaque(2))
+
+        index.discard(node)
+        assert not index.lookup(Opaque(1))
+
+    def test_clear(self):
+        """Verify clearing forgets every value."""
+        index = ValueIndex()
+        index.add(Node(1))
+        index.add(Node([1]))
+        index.clear()
+        assert not index.lookup(1)
+        assert not index.lookup([1])
+
+    def test_unhashable_query_equal_to_hashable_value(self):
+        """Verify unhashable queries find equal hashable values & skip merely similar ones."""
+        index = ValueIndex()
+        nodes = [Node(b'a'), Node(frozenset({1})), Node((1, 2))]
+        for node in nodes:
+            index.add(node)
+        assert list(index.lookup(bytearray(b'a'))) == [nodes[0]]
+        assert list(index.lookup({1})) == [nodes[1]]
+        assert not index.lookup([1, 2]) # Lists never equal tuples
+        assert not index.lookup(bytearray(b'b'))
@@ -0,0 +1,66 @@
+import random
+from bisect import bisect_left
+
+import numpy as np
+import pytest
+from algorithms.search.searches import SEARCHES, exponential_search, interpolation_search, search_many
+
+
+def expected_index(values, target):
+    index = bisect_left(values, target)
+    return index if index < len(values) and values[index] == target else -1
+
+
+class TestSearches:
+    """Tests for searches of the SEARCHES registry"""
+
+    @pytest.mark.parametrize('name', list(SEARCHES))
+    @pytest.mark.parametrize('size', [0, 1, 2, 3, 5, 8, 13, 100, 1000])
+    def test_matches_bisect(self, name, size):
+        """Verify every search finds first occurrences & misses in lists & arrays with duplicates."""
+        rng = random.Random(size)
+        values = sorted(rng.randrange(size // 2 + 1) for _ in range(size))
+        for sequence in (values, np.array(values, dtype=np.int64)):
+            for target in range(-1, size // 2 + 2):
+                assert SEARCHES[name](sequence, target) == expected_index(values, target)
+
+    @pytest.mark.parametrize('name', ['binary', 'exponential', 'fibonacci'])
+    def test_non_numeric(self, name):
+        """Verify comparison-only searches work on any ordered values."""
+        values = ['apple', 'banana', 'cherry', 'cherry', 'date']
+        assert SEARCHES[name](values, 'cherry') == 2
+        assert SEARCHES[name](values, 'coconut') == -1
+
+    def test_exponential_from_start(self):
+        """Verify galloping only looks at & after the start position."""
+        values = list(range(0, 100, 2))
+        assert exponential_search(values, 50, start=10) == 25
+        assert exponential_search(values, 20, start=10) == 10
+        assert exponential_search(values, 10, start=10) == -1
+
+    def test_interpolation_on_skewed_values(self):
+        """Verify interpolation search stays correct where interpolating guesses badly."""
+        values = sorted(2 ** i for i in range(60)) + [2 ** 60] * 3
+        for target in values + [3, 2 ** 61]:
+            assert interpolation_search(values, target) == expected_index(values, target)
+
+        floats = sorted(random.Random(0).random() ** 8 for _ in range(1000))
+        for target in floats[::10]:
+            assert interpolation_search(floats, target) == expected_index(floats, target)
+
+
+class TestSearchMany:
+    """Tests for search_many function"""
+
+    def test_matches_scalar_search(self):
+        """Verify batched lookups agree with one-by-one lookups, including queries beyond both ends."""
+        rng = random.Random(0)
+        values = sorted(rng.randrange(500) for _ in range(1000))
+        queries = [rng.randrange(-10, 510) for _ in range(2000)]
+        result = search_many(values, queries)
+        assert result.tolist() == [expected_index(values, query) for query in queries]
+
+    def test_empty(self):
+        """Verify empty tables & empty batches."""
+        assert search_many([], [1, 2]).tolist() == [-1, -1]
+        assert search_many([1, 2], []).tolist() == []
@@ -0,0 +1,62 @@
+import operator
+import random
+
+import pytest
+from algorithms.sort.external_sort import external_sort
+
+
+def records(count, seed=0):
+    rng = random.Random(seed)
+    return [(rng.randrange(20), i) for i in range(count)]
+
+
+class TestExternalSort:
+    """Tests for external_sort function"""
+
+    @pytest.mark.parametrize('count', [0, 1, 99, 100, 101, 1000])
+    def test_matches_sorted(self, tmp_path, count):
+        """Verify inputs around the run size, including ones fitting a single run, sort like sorted()."""
+        values = [value for value, _ in records(count)]
+        assert list(external_sort(values, run_size=100, workers=0, temp_dir=tmp_path)) == sorted(values)
+
+    @pytest.mark.parametrize('reverse', [False, True])
+    def test_stable_with_intermediate_merges(self, tmp_path, reverse):
+        """Verify equal keys keep input order when runs are merged in several passes."""
+        values = records(2000)
+        key = operator.itemgetter(0)
+        result = external_sort(iter(values), key=key, reverse=reverse, run_size=30, workers=0, fanout=3, temp_dir=tmp_path)
+        assert list(result) == sorted(values, key=key, reverse=reverse)
+
+    def test_process_pool(self, tmp_path):
+        """Verify runs sorted by worker processes merge like in-process ones."""
+        values = records(5000)
+        result = external_sort(values, key=operator.itemgetter(0), run_size=700, workers=2, temp_dir=tmp_path)
+        assert list(result) == sorted(values, key=operator.itemgetter(0))
+
+    def test_lazy_and_cleaned_up(self, tmp_path):
+        """Verify nothing happens before the first record is requested & run files are removed once closed."""
+        consumed = []
+
+        def source():
+            for value in range(1000, 0, -1):
+                consumed.append(value)
+                yield value
+
+        result = external_sort(source(), run_size=100, workers=0, temp_dir=tmp_path)
+        assert consumed == []
+
+        assert next(result) == 1
+        assert len(consumed) == 1000
+        assert len(list(tmp_path.iterdir())) == 1
+        result.close()
+        assert list(tmp_path.iterdir()) == []
+
+        assert list(external_sort(source(), run_size=100, workers=0, temp_dir=tmp_path))[-1] == 1000
+        assert list(tmp_path.iterdir()) == []
+
+    def test_invalid_arguments(self):
+        """Verify non-positive run sizes & fanouts below two are refused."""
+        with pytest.raises(ValueError):
+            next(external_sort([1], run_size=0))
+        with pytest.raises(ValueError):
+            next(external_sort([1], fanout=1))
@@ -0,0 +1,59 @@
+import csv
+import io
+import json
+
+import pytest
+from algorithms.sort.harness import SortResult, measure, run_benchmark, write_results
+from algorithms.sort.sorts import SORTS, SortAlgorithm
+
+
+class TestHarness:
+    """Tests for sort benchmark harness functions"""
+
+    def test_run_benchmark(self):
+        """Verify every algorithm, shape & size combination is measured, skipping sizes above max_size."""
+        results = run_benchmark(['insertion', 'quick', 'radix', 'timsort'], ['random', 'sorted'], [10, 6000], repeat=1)
+        measured = {(result.algorithm, result.input, result.size) for result in results}
+
+        assert ('insertion', 'random', 10) in measured
+        assert ('insertion', 'random', 6000) not in measured
+        assert ('quick', 'sorted', 6000) in measured
+        assert len(results) == 14
+
+    def test_counters(self):
+        """Verify comparisons are counted for comparison sorts only & swaps only where the sort reports them."""
+        values = list(range(50, 0, -1))
+        by_name = {result.algorithm: result for result in (measure(SORTS[name], 'reversed', values, 1) for name in SORTS)}
+
+        assert by_name['insertion'].comparisons == 50 * 49 // 2
+        assert by_name['timsort'].comparisons == 49
+        assert by_name['timsort'].swaps is None
+        assert by_name['radix'].comparisons == 0
+        assert by_name['radix'].swaps > 0
+        assert all(result.seconds >= 0 and result.peak_bytes >= 0 for result in by_name.values())
+
+    def test_unsorted_output_is_reported(self):
+        """Verify broken sorts are caught instead of being timed."""
+        broken = SortAlgorithm('broken', lambda values, stats=None: None)
+        with pytest.raises(RuntimeError):
+            measure(broken, 'reversed', [3, 2, 1], 1)
+
+    def test_write_results(self):
+        """Verify CSV & JSON output carry every field of every result."""
+        results = [SortResult('quick', 'random', 10, 0.5, 20, 5, 128), SortResult('timsort', 'random', 10, 0.1, 15, None, 64)]
+
+        output = io.StringIO()
+        write_results(results, output, 'csv')
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        assert rows[0] == {
+            'algorithm': 'quick', 'input': 'random', 'size': '10', 'seconds': '0.5',
+            'comparisons': '20', 'swaps': '5', 'peak_bytes': '128',
+        }
+        assert rows[1]['swaps'] == ''
+
+        output = io.StringIO()
+        write_results(results, output, 'json')
+        assert json.loads(output.getvalue())[1]['swaps'] is None
+
+        with pytest.raises(ValueError):
+            write_results(results, output, 'xml')
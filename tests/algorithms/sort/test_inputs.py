@@ -0,0 +1,38 @@
+from collections import Counter
+
+import pytest
+from algorithms.sort.inputs import INPUTS, make_input
+
+
+class TestInputs:
+    """Tests for input generators of the INPUTS registry"""
+
+    @pytest.mark.parametrize('name', list(INPUTS))
+    def test_size_and_reproducibility(self, name):
+        """Verify generators produce exactly size integers, the same ones for the same seed."""
+        values = make_input(name, 1000, seed=3)
+        assert len(values) == 1000
+        assert all(isinstance(value, int) for value in values)
+        assert make_input(name, 1000, seed=3) == values
+        assert make_input(name, 0) == []
+
+    def test_shapes(self):
+        """Verify generators produce inputs of the shape they are named after."""
+        assert make_input('sorted', 100) == sorted(make_input('sorted', 100))
+        assert make_input('reversed', 100) == sorted(make_input('reversed', 100), reverse=True)
+        assert len(set(make_input('few-unique', 1000))) <= 10
+
+        nearly_sorted = make_input('nearly-sorted', 1000)
+        assert sum(value != i for i, value in enumerate(nearly_sorted)) <= 20
+
+    def test_zipf_is_skewed(self):
+        """Verify the most common Zipf rank is 1 & covers a large share of the values."""
+        counts = Counter(make_input('zipf', 10_000))
+        rank, count = counts.most_common(1)[0]
+        assert rank == 1
+        assert count > 10_000 // 10
+
+    def test_unknown_input(self):
+        """Verify unknown shapes raise KeyError."""
+        with pytest.raises(KeyError):
+            make_input('spiral', 10)
@@ -0,0 +1,68 @@
+import random
+
+import pytest
+from algorithms.data_structures.single_linked_list import Node
+from algorithms.sort.linked_list_merge_sort import merge_sort_nodes
+
+
+def chain(values):
+    head = None
+    for value in reversed(values):
+        node = Node(value)
+        node.next = head
+        head = node
+    return head
+
+
+def unchain(head):
+    values = []
+    while head is not None:
+        values.append(head.value)
+        head = head.next
+    return values
+
+
+class TestMergeSortNodes:
+    """Tests for merge_sort_nodes function"""
+
+    def test_empty_and_single(self):
+        """Verify trivial chains are returned as they are."""
+        assert merge_sort_nodes(None) == (None, None)
+
+        node = Node(1)
+        assert merge_sort_nodes(node) == (node, node)
+
+    @pytest.mark.parametrize('size', [2, 3, 7, 8, 9, 100, 1000])
+    def test_matches_sorted(self, size):
+        """Verify random chains of sizes around powers of two end up sorted with correct tail."""
+        rng = random.Random(size)
+        values = [rng.randrange(size) for _ in range(size)]
+        head, tail = merge_sort_nodes(chain(values))
+
+        assert unchain(head) == sorted(values)
+        assert tail.value == max(values)
+        assert tail.next is None
+
+    @pytest.mark.parametrize('reverse', [False, True])
+    def test_stable_with_key(self, reverse):
+        """Verify equal keys keep their original order in both directions, like sorted()."""
+        rng = random.Random(0)
+        values = [(rng.randrange(4), i) for i in range(200)]
+        head, _ = merge_sort_nodes(chain(values), key=lambda value: value[0], reverse=reverse)
+
+        assert unchain(head) == sorted(values, key=lambda value: value[0], reverse=reverse)
+
+    @pytest.mark.parametrize('values', [list(range(50)), list(range(50, 0, -1)), [3] * 20])
+    def test_presorted_inputs(self, values):
+        """Verify sorted, reversed & constant chains."""
+        head, tail = merge_sort_nodes(chain(values))
+        assert unchain(head) == sorted(values)
+        assert tail.next is None
+
+    def test_relinks_same_nodes(self):
+        """Verify nodes are relinked, not copied."""
+        head = chain([2, 1])
+        nodes = {id(head), id(head.next)}
+        new_head, new_tail = merge_sort_nodes(head)
+
+        assert {id(new_head), id(new_tail)} == nodes
@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+from algorithms.sort.numpy_radix_sort import counting_sort, radix_argsort, radix_sort, radix_sort_memmap
+
+
+DTYPES = ['int8', 'int16', 'int32', 'int64', 'uint8', 'uint16', 'uint32', 'uint64', '>i8']
+
+
+def random_keys(dtype, size=3000, low=None, high=None, seed=0):
+    info = np.iinfo(np.dtype(dtype))
+    low = info.min if low is None else max(low, info.min)
+    high = info.max if high is None else min(high, info.max)
+    native = np.dtype(dtype).newbyteorder('=')
+    return np.random.default_rng(seed).integers(low, high, size=size, endpoint=True, dtype=native).astype(dtype)
+
+
+class TestRadixSort:
+    """Tests for radix_sort & radix_argsort functions"""
+
+    @pytest.mark.parametrize('dtype', DTYPES)
+    @pytest.mark.parametrize('digit_bits', [8, 16])
+    def test_matches_numpy(self, dtype, digit_bits):
+        """Verify full-range keys of every integer dtype sort like np.sort & np.argsort(kind='stable')."""
+        keys = random_keys(dtype)
+        result = radix_sort(keys, digit_bits)
+        assert result.dtype == keys.dtype
+        assert np.array_equal(result, np.sort(keys))
+        assert np.array_equal(radix_argsort(keys, digit_bits), np.argsort(keys, kind='stable'))
+
+    def test_narrow_span_and_duplicates(self):
+        """Verify keys spanning little of the dtype range, with many duplicates, keep stable order."""
+        keys = random_keys('int64', low=-3, high=3)
+        assert np.array_equal(radix_sort(keys), np.sort(keys))
+        assert np.array_equal(radix_argsort(keys), np.argsort(keys, kind='stable'))
+
+    @pytest.mark.parametrize('keys', [np.array([], dtype=np.int64), np.array([7]), np.full(10, -4)])
+    def test_trivial(self, keys):
+        """Verify empty, single & all-equal inputs."""
+        assert np.array_equal(radix_sort(keys), keys)
+        assert np.array_equal(radix_argsort(keys), np.arange(len(keys)))
+
+    def test_input_untouched(self):
+        """Verify keys are not modified."""
+        keys = random_keys('int32')
+        copy = keys.copy()
+        radix_sort(keys)
+        radix_argsort(keys)
+        assert np.array_equal(keys, copy)
+
+    def test_rejects_floats(self):
+        """Verify non-integer keys raise TypeError."""
+        with pytest.raises(TypeError):
+            radix_sort(np.array([1.5, 0.5]))
+        with pytest.raises(TypeError):
+            counting_sort(np.array([1.5, 0.5]))
+
+
+class TestCountingSort:
+    """Tests for counting_sort function"""
+
+    @pytest.mark.parametrize('dtype', DTYPES)
+    def test_matches_numpy(self, dtype):
+        """Verify keys of every dtype sort like np.sort."""
+        keys = random_keys(dtype, low=-100, high=1000)
+        result = counting_sort(keys)
+        assert result.dtype == keys.dtype
+        assert np.array_equal(result, np.sort(keys))
+        assert len(counting_sort(keys[:0])) == 0
+
+    def test_span_limit(self):
+        """Verify spans above max_span are refused instead of allocating a huge histogram."""
+        with pytest.raises(ValueError):
+            counting_sort(np.array([0, 1 << 40]))
+        assert np.array_equal(counting_sort(np.array([5, 0, 9]), max_span=10), [0, 5, 9])
+
+
+class TestRadixSortMemmap:
+    """Tests for radix_sort_memmap function"""
+
+    @pytest.mark.parametrize('dtype', ['int16', 'int64', 'uint32'])
+    @pytest.mark.parametrize('chunk_size', [64, 999, 1 << 20])
+    def test_matches_numpy(self, tmp_path, dtype, chunk_size):
+        """Verify on-disk keys sort into the target with stable indices, whatever the chunk size."""
+        keys = random_keys(dtype, size=5000)
+        source = np.memmap(tmp_path / 'source', dtype=dtype, mode='w+', shape=keys.shape)
+        source[:] = keys
+        target = np.memmap(tmp_path / 'target', dtype=dtype, mode='w+', shape=keys.shape)
+        indices = np.memmap(tmp_path / 'indices', dtype=np.int64, mode='w+', shape=keys.shape)
+
+        assert radix_sort_memmap(source, target, indices, chunk_size, scratch_dir=tmp_path) is target
+        assert np.array_equal(target, np.sort(keys))
+        assert np.array_equal(indices, np.argsort(keys, kind='stable'))
+        assert np.array_equal(source, keys)
+        assert sorted(path.name for path in tmp_path.iterdir()) == ['indices', 'source', 'target']
+
+    @pytest.mark.parametrize('keys', [np.arange(100, dtype=np.int64) % 7, np.full(100, 3, dtype=np.int64)])
+    def test_skipped_passes(self, keys):
+        """Verify small spans (one digit pass) & equal keys (no pass) end up in the target."""
+        target = np.empty_like(keys)
+        indices = np.empty(len(keys), dtype=np.int64)
+        radix_sort_memmap(keys, target, indices, chunk_size=30)
+        assert np.array_equal(target, np.sort(keys))
+        assert np.array_equal(indices, np.argsort(keys, kind='stable'))
+
+    def test_mismatched_arrays(self):
+        """Verify targets of a different shape or dtype are refused."""
+        keys = np.arange(10)
+        with pytest.raises(ValueError):
+            radix_sort_memmap(keys, np.empty(9, dtype=keys.dtype))
+        with pytest.raises(ValueError):
+            radix_sort_memmap(keys, np.empty(10, dtype=np.float64))
+        with pytest.raises(ValueError):
+            radix_sort_memmap(keys, np.empty_like(keys), np.empty(10, dtype=np.float64))
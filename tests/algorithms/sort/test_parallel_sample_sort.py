@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from algorithms.sort.parallel_sample_sort import MIN_PARALLEL_SIZE, sample_sort, sample_sort_executor
+
+
+SIZE = MIN_PARALLEL_SIZE + 1001
+
+
+class TestSampleSort:
+    """Tests for sample_sort function"""
+
+    @pytest.mark.parametrize('values', [
+        np.random.default_rng(0).integers(-10 ** 9, 10 ** 9, SIZE),
+        np.random.default_rng(0).random(SIZE).astype(np.float32),
+        np.random.default_rng(0).integers(0, 3, SIZE, dtype=np.uint8),
+        np.arange(SIZE)[::-1],
+        np.zeros(SIZE),
+    ], ids=['int64', 'float32', 'few-unique', 'reversed', 'equal'])
+    def test_matches_numpy(self, values):
+        """Verify values of several dtypes & shapes sort like np.sort, leaving the input untouched."""
+        copy = values.copy()
+        with sample_sort_executor(2) as executor:
+            for workers in (2, 5):
+                result = sample_sort(values, workers, executor=executor)
+                assert result.dtype == values.dtype
+                assert np.array_equal(result, np.sort(values))
+        assert np.array_equal(values, copy)
+
+    def test_own_executor(self):
+        """Verify a pool is started & shut down per call when none is given."""
+        values = np.random.default_rng(1).random(SIZE)
+        assert np.array_equal(sample_sort(values, 3), np.sort(values))
+
+    def test_serial_fallback(self):
+        """Verify single worker & small inputs are sorted in this process."""
+        assert np.array_equal(sample_sort(np.array([3, 1, 2]), 4), [1, 2, 3])
+        assert np.array_equal(sample_sort(np.arange(SIZE)[::-1], 1), np.arange(SIZE))
+        assert len(sample_sort(np.array([]), 4)) == 0
+
+    def test_invalid_values(self):
+        """Verify multi-dimensional & object arrays are refused."""
+        with pytest.raises(ValueError):
+            sample_sort(np.zeros((2, 2)))
+        with pytest.raises(TypeError):
+            sample_sort(np.array(['a', 1], dtype=object))
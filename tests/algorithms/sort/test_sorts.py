@@ -0,0 +1,71 @@
+import random
+
+import pytest
+from algorithms.sort.inputs import INPUTS, make_input
+from algorithms.sort.sorts import SORTS, SortStats, radix_sort
+
+
+class TestSorts:
+    """Tests for sorts of the SORTS registry"""
+
+    @pytest.mark.parametrize('name', list(SORTS))
+    @pytest.mark.parametrize('size', [0, 1, 2, 3, 15, 16, 17, 100, 1000])
+    def test_matches_sorted(self, name, size):
+        """Verify every sort agrees with sorted() on random input of sizes around partition & radix thresholds."""
+        rng = random.Random(size)
+        values = [rng.randrange(-size, size + 1) for _ in range(size)]
+        expected = sorted(values)
+        SORTS[name].function(values)
+        assert values == expected
+
+    @pytest.mark.parametrize('name', list(SORTS))
+    @pytest.mark.parametrize('input_name', list(INPUTS))
+    def test_every_input_shape(self, name, input_name):
+        """Verify every sort handles every input shape, counting swaps where it can."""
+        values = make_input(input_name, 500, seed=1)
+        expected = sorted(values)
+        stats = SortStats()
+        SORTS[name].function(values, stats)
+        assert values == expected
+        if SORTS[name].counts_swaps and input_name == 'random':
+            assert stats.swaps > 0
+
+    @pytest.mark.parametrize('name', ['insertion', 'merge', 'radix', 'timsort'])
+    def test_stable(self, name):
+        """Verify sorts documented as stable keep order of equal values."""
+        values = [(key, i) for i, key in enumerate([3, 1, 3, 2, 1, 3, 2])]
+        if name == 'radix': # Ints only, encode the original position in low bits
+            keys = [key * 100 + i for key, i in values]
+            SORTS[name].function(keys)
+            assert keys == sorted(keys)
+            return
+
+        class Key:
+            def __init__(self, item):
+                self.item = item
+
+            def __lt__(self, other):
+                return self.item[0] < other.item[0]
+
+        wrapped = [Key(item) for item in values]
+        SORTS[name].function(wrapped)
+        assert [key.item for key in wrapped] == sorted(values, key=lambda item: item[0])
+
+    def test_radix_rejects_non_ints(self):
+        """Verify radix sort refuses values it cannot bucket."""
+        with pytest.raises(TypeError):
+            radix_sort([1, 2.5])
+
+    def test_radix_large_and_negative(self):
+        """Verify radix sort handles keys spanning many bytes on both sides of zero."""
+        rng = random.Random(0)
+        values = [rng.randrange(-2 ** 70, 2 ** 70) for _ in range(1000)]
+        expected = sorted(values)
+        radix_sort(values)
+        assert values == expected
+
+    def test_insertion_sort_swaps_on_sorted_input(self):
+        """Verify insertion sort only writes every element once when nothing is out of order."""
+        stats = SortStats()
+        SORTS['insertion'].function(list(range(100)), stats)
+        assert stats.swaps == 99
@@ -0,0 +1,210 @@
+import random
+import sys
+from concurrent.futures import Executor, Future
+from pathlib import Path
+
+import pytest
+from chromadb.errors import InvalidArgumentError
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / 'vector-db')) # Scripts import each other by module name
+import ingest as ingest_module
+from ingest import IngestStats, ingest, read_documents
+
+
+class FakeClient:
+    """Client answering only what `ingest` asks for - the max batch size."""
+
+    def __init__(self, max_batch_size=2):
+        self.max_batch_size = max_batch_size
+
+    def get_max_batch_size(self):
+        return self.max_batch_size
+
+
+class FakeCollection:
+    """Collection keeping upserted records in a dict, failing upserts listed in `failures` by their number."""
+
+    def __init__(self, existing=(), failures=None):
+        self.records = {id_: None for id_ in existing}
+        self.failures = failures or {}
+        self.upserts = 0
+        self.looked_up = []
+
+    def get(self, ids, include):
+        self.looked_up.append(list(ids))
+        return {'ids': [id_ for id_ in ids if id_ in self.records]}
+
+    def upsert(self, ids, embeddings, documents, metadatas):
+        self.upserts += 1
+        if (error := self.failures.get(self.upserts)) is not None:
+            raise error
+        for i, id_ in enumerate(ids):
+            self.records[id_] = (embeddings[i], documents[i], None if metadatas is None else metadatas[i])
+
+
+class FakeEmbeddingFunction:
+    """Embeds every document as its length & remembers all the documents it embedded."""
+
+    def __init__(self):
+        self.embedded = []
+
+    def __call__(self, documents):
+        self.embedded.extend(documents)
+        return [[float(len(document))] for document in documents]
+
+
+class ImmediateExecutor(Executor):
+    """Runs the first `run` submissions right away & never runs the rest, counting batches in flight."""
+
+    def __init__(self, collection, run=None):
+        self.collection = collection
+        self.run = run
+        self.futures = []
+        self.max_in_flight = 0
+
+    def submit(self, function, *args):
+        future = Future()
+        if self.run is None or len(self.futures) < self.run:
+            future.set_result(function(*args))
+        self.futures.append(future)
+        self.max_in_flight = max(self.max_in_flight, len(self.futures) - self.collection.upserts)
+        return future
+
+
+def make_records(count, metadata=None):
+    return [(f'id{i}', f'document {i}', metadata) for i in range(count)]
+
+
+class TestIngest:
+    """Tests for ingest function"""
+
+    def test_upserts_all_records_in_batches(self):
+        """Verify every record is upserted once, in batches of the client's max batch size."""
+        collection, embedding_function = FakeCollection(), FakeEmbeddingFunction()
+        stats = ingest(FakeClient(2), collection, make_records(5, {'topic': 'x'}), embedding_function, workers=2)
+
+        assert stats.documents == 5
+        assert stats.batches == 3
+        assert stats.retries == 0
+        assert collection.records['id4'] == ([10.0], 'document 4', {'topic': 'x'})
+        assert sorted(embedding_function.embedded) == sorted(record[1] for record in make_records(5))
+
+    def test_records_without_metadata(self):
+        """Verify batches without any metadata are upserted with `metadatas=None`."""
+        collection = FakeCollection()
+        ingest(FakeClient(), collection, make_records(3), FakeEmbeddingFunction())
+        assert all(record[2] is None for record in collection.records.values())
+
+    def test_transient_error_retried(self):
+        """Verify failed upserts are retried with backoff until they succeed."""
+        failures = {attempt: ConnectionError("unavailable") for attempt in (1, 3, 5, 7)} # Every other upsert
+        collection = FakeCollection(failures=failures)
+        stats = ingest(FakeClient(2), collection, make_records(8), FakeEmbeddingFunction(), backoff=0)
+
+        assert stats.retries == 4
+        assert stats.documents == 8
+        assert len(collection.records) == 8
+
+    def test_retries_exhausted_raises(self):
+        """Verify the last error is raised once all retries fail."""
+        collection = FakeCollection(failures={attempt: ConnectionError("unavailable") for attempt in range(1, 5)})
+        with pytest.raises(ConnectionError):
+            ingest(FakeClient(), collection, make_records(2), FakeEmbeddingFunction(), retries=3, backoff=0)
+        assert collection.upserts == 4
+
+    def test_permanent_error_not_retried(self):
+        """Verify validation errors are raised on the first attempt."""
+        collection = FakeCollection(failures={1: InvalidArgumentError("bad embedding")})
+        with pytest.raises(InvalidArgumentError):
+            ingest(FakeClient(), collection, make_records(2), FakeEmbeddingFunction(), backoff=0)
+        assert collection.upserts == 1
+
+    def test_skip_existing(self):
+        """Verify IDs the collection already has are dropped before embedding."""
+        collection, embedding_function = FakeCollection(existing=['id1', 'id2', 'id3']), FakeEmbeddingFunction()
+        stats = ingest(FakeClient(2), collection, make_records(5), embedding_function, skip_existing=True)
+
+        assert stats.skipped == 3
+        assert stats.documents == 2
+        assert sorted(embedding_function.embedded) == ['document 0', 'document 4']
+        assert collection.looked_up == [['id0', 'id1'], ['id2', 'id3'], ['id4']]
+
+    def test_in_flight_bounded(self):
+        """Verify at most `2 * workers` batches are embedded or waiting for upsert at once."""
+        collection = FakeCollection()
+        executor = ImmediateExecutor(collection)
+        stats = ingest(
+            FakeClient(1), collection, make_records(50), FakeEmbeddingFunction(), executor=executor, workers=3
+        )
+
+        assert stats.documents == 50
+        assert executor.max_in_flight == 6
+
+    def test_pending_batches_cancelled_after_failure(self):
+        """Verify batches still waiting for embedding are cancelled once an upsert fails."""
+        collection = FakeCollection(failures={1: InvalidArgumentError("bad embedding")})
+        executor = ImmediateExecutor(collection, run=1)
+        with pytest.raises(InvalidArgumentError):
+            ingest(FakeClient(1), collection, make_records(10), FakeEmbeddingFunction(), executor=executor, workers=2)
+
+        assert len(executor.futures) == 4
+        assert all(future.cancelled() for future in executor.futures[1:])
+
+    def test_progress_reported_per_batch(self):
+        """Verify progress is called after every upserted batch with the running totals."""
+        reported = []
+        ingest(
+            FakeClient(2), FakeCollection(), make_records(5), FakeEmbeddingFunction(),
+            progress=lambda stats: reported.append(stats.documents)
+        )
+        assert reported == [2, 4, 5]
+
+
+class TestIngestStats:
+    """Tests for IngestStats class"""
+
+    def test_latency_percentile(self):
+        """Verify percentiles pick from sorted latencies & are 0 without any."""
+        stats = IngestStats()
+        assert stats.latency_percentile(50) == 0.0
+
+        stats.latencies = [float(i) for i in range(100, 0, -1)]
+        assert stats.latency_percentile(0) == 1.0
+        assert stats.latency_percentile(50) == 51.0
+        assert stats.latency_percentile(100) == 100.0
+
+    def test_latency_sample_bounded(self, monkeypatch):
+        """Verify latencies beyond the sample size replace sampled ones uniformly."""
+        monkeypatch.setattr(ingest_module, 'LATENCY_SAMPLE_SIZE', 100)
+        stats, rng = IngestStats(), random.Random(0)
+        for i in range(10_000):
+            stats._record_latency(float(i), rng)
+
+        assert stats.embedded_batches == 10_000
+        assert len(stats.latencies) == 100
+        assert 3_000 < stats.latency_percentile(50) < 7_000 # Mostly later latencies, not the first 100
+
+
+class TestReadDocuments:
+    """Tests for read_documents function"""
+
+    def test_jsonl(self, tmp_path):
+        """Verify JSONL lines become records with other fields as metadata, skipping blank lines."""
+        path = tmp_path / 'documents.jsonl'
+        path.write_text('{"id": 1, "document": "a", "topic": "x"}\n\n{"id": "b", "document": "b"}\n', encoding='utf-8')
+        assert list(read_documents(str(path))) == [('1', 'a', {'topic': 'x'}), ('b', 'b', None)]
+
+    def test_csv(self, tmp_path):
+        """Verify CSV rows become records with other columns as metadata."""
+        path = tmp_path / 'documents.CSV'
+        path.write_text('key,text,topic\n1,"a, b",x\n2,c,y\n', encoding='utf-8')
+        assert list(read_documents(str(path), id_field='key', text_field='text')) == [
+            ('1', 'a, b', {'topic': 'x'}), ('2', 'c', {'topic': 'y'})
+        ]
+
+    def test_unsupported_suffix_raises(self, tmp_path):
+        """Verify files other than .jsonl & .csv are rejected."""
+        path = tmp_path / 'documents.txt'
+        path.write_text('a\n', encoding='utf-8')
+        with pytest.raises(ValueError):
+            next(read_documents(str(path)))
@@ -0,0 +1,82 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / 'vector-db')) # Scripts import each other by module name
+from main import add_documents, missing_ids
+
+
+class FakeClient:
+    """Client answering only what `add_documents` asks for - the max batch size."""
+
+    def __init__(self, max_batch_size):
+        self.max_batch_size = max_batch_size
+
+    def get_max_batch_size(self):
+        return self.max_batch_size
+
+
+class FakeCollection:
+    """Collection keeping added documents in a dict & recording every lookup & add call."""
+
+    def __init__(self, existing=()):
+        self.documents = {id_: None for id_ in existing}
+        self.looked_up = []
+        self.added = []
+
+    def count(self):
+        return len(self.documents)
+
+    def get(self, ids, include):
+        assert include == [] # Neither embeddings nor documents are fetched
+        self.looked_up.append(list(ids))
+        return {'ids': [id_ for id_ in ids if id_ in self.documents]}
+
+    def add(self, documents, metadatas, ids):
+        self.added.append(list(ids))
+        self.documents.update(zip(ids, documents))
+
+
+def make_documents(count):
+    ids = [f'id{i}' for i in range(count)]
+    return ids, [f'document {i}' for i in range(count)], [{'topic': str(i % 2)} for i in range(count)]
+
+
+class TestAddDocuments:
+    """Tests for add_documents & missing_ids functions"""
+
+    def test_existing_ids_not_added(self):
+        """Verify documents of already indexed IDs are not sent to the collection to be embedded."""
+        collection = FakeCollection(existing=['id1', 'id3'])
+        ids, documents, metadatas = make_documents(5)
+
+        assert add_documents(FakeClient(10), collection, ids, documents, metadatas) == 3
+        assert collection.added == [['id0', 'id2', 'id4']]
+        assert collection.documents['id2'] == 'document 2'
+        assert collection.documents['id1'] is None
+
+    def test_rerun_adds_nothing(self):
+        """Verify adding the same documents twice only adds them once."""
+        collection = FakeCollection()
+        ids, documents, metadatas = make_documents(4)
+
+        assert add_documents(FakeClient(10), collection, ids, documents, metadatas) == 4
+        assert add_documents(FakeClient(10), collection, ids, documents, metadatas) == 0
+        assert collection.added == [ids]
+
+    def test_empty_collection_not_looked_up(self):
+        """Verify IDs are not looked up when the collection is empty."""
+        collection = FakeCollection()
+        ids, documents, _ = make_documents(3)
+
+        assert missing_ids(collection, ids, 10) == set(ids)
+        add_documents(FakeClient(10), collection, ids, documents)
+        assert collection.looked_up == []
+
+    def test_lookups_and_adds_batched(self):
+        """Verify lookups & adds are split into batches of the client's max batch size."""
+        collection = FakeCollection(existing=['id0'])
+        ids, documents, metadatas = make_documents(8)
+
+        assert add_documents(FakeClient(3), collection, ids, documents, metadatas) == 7
+        assert collection.looked_up == [ids[0:3], ids[3:6], ids[6:8]]
+        assert collection.added == [ids[1:4], ids[4:7], ids[7:8]]
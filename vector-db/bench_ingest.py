@@ -0,0 +1,84 @@
+"""Measures throughput & memory of `ingest` streaming a JSONL corpus into an in-memory collection.
+
+For every size a corpus is written to a temporary JSONL file, then ingested with thread & process pools of
+`--workers` sizes - reporting docs/s & embedding latency percentiles per batch. Peak memory allocated by Python
+(`tracemalloc`) is measured in a separate run per size, against reading the whole file into a list first.
+Documents are embedded with the hashing embedding function of `bench_startup.py`. Run from the repository root:
+
+    python vector-db/bench_ingest.py --sizes 10000 50000 --workers 1 2 4
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import chromadb
+
+from bench_startup import HashingEmbeddingFunction, make_documents
+from ingest import ingest, read_documents
+
+
+POOLS = {
+    'threads': ThreadPoolExecutor,
+    'processes': ProcessPoolExecutor,
+}
+
+
+def write_corpus(path:str, size:int):
+    ids, documents, metadatas = make_documents(size)
+    with open(path, 'w', encoding='utf-8') as file:
+        for id_, document, metadata in zip(ids, documents, metadatas):
+            file.write(json.dumps({'id': id_, 'document': document, **metadata}) + '\n')
+
+
+def run(path:str, pool, workers:int, records=None):
+    client = chromadb.Client()
+    collection = client.create_collection(name='bench-ingest', metadata={'hnsw:space': 'l2'})
+    try:
+        with pool(workers) as executor:
+            return ingest(
+                client, collection, read_documents(path) if records is None else records,
+                HashingEmbeddingFunction(), executor=executor, workers=workers
+            )
+    finally:
+        client.delete_collection('bench-ingest')
+
+
+def peak_megabytes(path:str, whole_file:bool) -> float:
+    tracemalloc.start()
+    run(path, ThreadPoolExecutor, 1, list(read_documents(path)) if whole_file else None)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 50_000])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'size':>10}{'pool':>11}{'workers':>9}{'docs/s':>10}{'p50 ms':>9}{'p99 ms':>9}")
+        for size in args.sizes:
+            path = os.path.join(directory, f'{size}.jsonl')
+            write_corpus(path, size)
+            for name, pool in POOLS.items():
+                for workers in args.workers:
+                    stats = run(path, pool, workers)
+                    print(
+                        f"{size:>10,}{name:>11}{workers:>9}{stats.docs_per_second:>10,.0f}"
+                        f"{stats.latency_percentile(50) * 1000:>9.1f}{stats.latency_percentile(99) * 1000:>9.1f}"
+                    )
+
+        print(f"\n{'size':>10}{'streamed MB':>13}{'whole file MB':>15}")
+        for size in args.sizes:
+            path = os.path.join(directory, f'{size}.jsonl')
+            print(f"{size:>10,}{peak_megabytes(path, False):>13.1f}{peak_megabytes(path, True):>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Measures startup time of `main.py` - opening the collection & indexing documents - ephemeral vs persistent.
+
+Every start runs in a fresh process, like a new run of `main.py`. "ephemeral" embeds & adds all documents
+into `chromadb.Client()`, as every start did before. "persistent cold" does the same into an empty
+`PersistentClient` directory, "persistent warm" reopens it with every ID already indexed, & "warm +1%"
+reopens it with 1% new documents to embed.
+
+By default documents are embedded with a hashing embedding function, which needs no model download & costs
+next to nothing - real models make ephemeral & cold starts slower still. `--embedding default` uses
+Chroma's default model instead. Run from the repository root:
+
+    python vector-db/bench_startup.py --sizes 10000 100000
+"""
+
+import argparse
+import multiprocessing
+import tempfile
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from main import add_documents, open_collection
+
+
+class HashingEmbeddingFunction(EmbeddingFunction):
+    """Embeds documents as normalized counts of their words hashed into `dimensions` buckets."""
+
+    def __init__(self, dimensions:int=384):
+        self.dimensions = dimensions
+
+    def __call__(self, input:Documents) -> Embeddings:
+        embeddings = np.zeros((len(input), self.dimensions), dtype=np.float32)
+        for row, document in enumerate(input):
+            for word in document.split():
+                embeddings[row, zlib.crc32(word.encode()) % self.dimensions] += 1
+        embeddings /= np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+        return list(embeddings)
+
+
+WORDS = 'swimming running gaming food music sport queen king ace cards body mind people rhythm team'.split()
+
+
+def make_documents(size:int, seed:int=0) -> tuple[list[str], list[str], list[dict]]:
+    rng = np.random.default_rng(seed)
+    words = np.array(WORDS)[rng.integers(len(WORDS), size=(size, 12))]
+    documents = [' '.join(row) for row in words]
+    return [f'doc{i}' for i in range(size)], documents, [{'topic': row[0]} for row in words]
+
+
+def start(path:Optional[str], size:int, embedding:str) -> tuple[float, int]:
+    """One process start - returns seconds spent opening & indexing, & number of documents added."""
+    ids, documents, metadatas = make_documents(size)
+    embedding_function = HashingEmbeddingFunction() if embedding == 'hashing' else None
+    started = time.perf_counter()
+    client, collection = open_collection(path, embedding_function)
+    added = add_documents(client, collection, ids, documents, metadatas)
+    return time.perf_counter() - started, added
+
+
+def start_in_new_process(path:Optional[str], size:int, embedding:str) -> tuple[float, int]:
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        return executor.submit(start, path, size, embedding).result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--embedding', choices=['hashing', 'default'], default='hashing')
+    args = parser.parse_args()
+
+    print(f"{'size':>10}{'ephemeral s':>14}{'persistent cold s':>20}{'persistent warm s':>20}{'warm +1% s':>13}{'speedup':>9}")
+    for size in args.sizes:
+        ephemeral, _ = start_in_new_process(None, size, args.embedding)
+        with tempfile.TemporaryDirectory() as path:
+            cold, _ = start_in_new_process(path, size, args.embedding)
+            warm, added = start_in_new_process(path, size, args.embedding)
+            assert added == 0, "warm start embedded documents again"
+            grown, added = start_in_new_process(path, size + size // 100, args.embedding)
+            assert added == size // 100
+        print(f"{size:>10,}{ephemeral:>14.2f}{cold:>20.2f}{warm:>20.2f}{grown:>13.2f}{ephemeral / warm:>8.0f}x")
+
+
+if __name__ == '__main__':
+    main()
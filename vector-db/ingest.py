@@ -0,0 +1,177 @@
+import csv
+import json
+import random
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import batched
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+from chromadb.api import ClientAPI
+from chromadb.api.models.Collection import Collection
+from chromadb.errors import DuplicateIDError, InvalidArgumentError
+
+
+LATENCY_SAMPLE_SIZE = 10_000 #~ Embedding latencies kept for percentiles, a uniform sample once there are more
+PERMANENT_ERRORS = (ValueError, TypeError, InvalidArgumentError, DuplicateIDError) #~ Retrying cannot fix these
+
+Record = tuple[str, str, Optional[dict]] #~ ID, document, metadata
+
+
+@dataclass
+class IngestStats:
+    """Progress of `ingest`, updated after every upserted batch.
+    """
+
+    documents:int = 0
+    skipped:int = 0 #~ Already indexed, with `skip_existing`
+    batches:int = 0
+    retries:int = 0
+    seconds:float = 0.0
+    latencies:list[float] = field(default_factory=list, repr=False) #~ Seconds per embedded batch, sampled
+    embedded_batches:int = 0
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.documents / self.seconds if self.seconds else 0.0
+
+    def latency_percentile(self, percentile:float) -> float:
+        """Returns embedding latency of a batch in seconds at `percentile` (0-100), 0 if nothing was embedded.
+        """
+
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(int(len(ordered) * percentile / 100), len(ordered) - 1)]
+
+    def _record_latency(self, seconds:float, rng:random.Random):
+        self.embedded_batches += 1
+        if len(self.latencies) < LATENCY_SAMPLE_SIZE:
+            self.latencies.append(seconds)
+        elif (slot := rng.randrange(self.embedded_batches)) < LATENCY_SAMPLE_SIZE: #~ Reservoir sampling
+            self.latencies[slot] = seconds
+
+
+def read_documents(path:str, id_field:str='id', text_field:str='document') -> Iterator[Record]: #~ -> O(1) memory
+    """Yields records of a `.jsonl` or `.csv` file one line at a time.
+
+    Fields other than `id_field` & `text_field` become metadata of the record, `None` if there are none.
+
+    Raises:
+        ValueError: If the file is neither `.jsonl` nor `.csv`.
+    """
+
+    suffix = Path(path).suffix.lower()
+    if suffix not in ('.jsonl', '.csv'):
+        raise ValueError(f"cannot read {suffix!r} files, expected .jsonl or .csv")
+
+    with open(path, newline='' if suffix == '.csv' else None, encoding='utf-8') as file:
+        rows = csv.DictReader(file) if suffix == '.csv' else (json.loads(line) for line in file if line.strip())
+        for row in rows:
+            id_, document = str(row.pop(id_field)), row.pop(text_field)
+            yield id_, document, row or None
+
+
+def ingest(
+    client:ClientAPI,
+    collection:Collection,
+    records:Iterable[Record],
+    embedding_function:Callable[[list[str]], list],
+    batch_size:Optional[int]=None,
+    executor:Optional[Executor]=None,
+    workers:int=4,
+    retries:int=3,
+    backoff:float=0.5,
+    skip_existing:bool=False,
+    progress:Optional[Callable[[IngestStats], None]]=None,
+) -> IngestStats:
+    """Embeds & upserts `records` into `collection` in batches, embedding several batches at once.
+
+    Records are consumed lazily & at most `2 * workers` batches are embedded or waiting for upsert at any time,
+    so memory stays bounded however many records there are. Batches are upserted in order by this thread.
+
+    Args:
+        client (ClientAPI): Client of `collection`, asked for its max batch size.
+        collection (Collection): Collection to upsert into.
+        records (Iterable[Record]): `(id, document, metadata)` tuples, e.g. from `read_documents`.
+        embedding_function (Callable): Turns a list of documents into a list of embeddings. Has to be picklable
+            for a process pool.
+        batch_size (Optional[int]): Records per batch, capped at (& by default) Chroma's max batch size.
+        executor (Optional[Executor]): Pool embedding batches, a `ThreadPoolExecutor` of `workers` threads
+            (started & shut down per call) if `None`.
+        workers (int): Threads of the default pool, also bounds batches in flight.
+        retries (int): Attempts to repeat a failed upsert, waiting `backoff * 2 ** attempt` seconds before each.
+            Validation errors (`PERMANENT_ERRORS`) are raised right away.
+        backoff (float): Seconds to wait before the first retry.
+        skip_existing (bool): Leaves out IDs the collection already has before embedding, so that re-running
+            an ingestion only embeds new records. Costs one lookup per batch.
+        progress (Optional[Callable]): Called with the `IngestStats` after every batch.
+    """
+
+    batch_size = min(batch_size or client.get_max_batch_size(), client.get_max_batch_size())
+    stats, rng = IngestStats(), random.Random(0)
+    own_executor = executor is None
+    executor = ThreadPoolExecutor(workers) if own_executor else executor
+    pending:deque[tuple[list[Record], Future]] = deque()
+    started = time.perf_counter()
+
+    def upsert_oldest():
+        batch, future = pending.popleft()
+        embeddings, seconds = future.result()
+        stats._record_latency(seconds, rng)
+        _upsert(collection, batch, embeddings, retries, backoff, stats)
+        stats.documents += len(batch)
+        stats.batches += 1
+        stats.seconds = time.perf_counter() - started
+        if progress is not None:
+            progress(stats)
+
+    try:
+        for batch in batched(records, batch_size):
+            if skip_existing:
+                existing = set(collection.get(ids=[record[0] for record in batch], include=[])['ids'])
+                stats.skipped += len(existing)
+                batch = [record for record in batch if record[0] not in existing]
+                if not batch:
+                    continue
+            pending.append((batch, executor.submit(_embed, embedding_function, [record[1] for record in batch])))
+            if len(pending) >= 2 * workers: #~ Waits for the oldest batch before reading further
+                upsert_oldest()
+        while pending:
+            upsert_oldest()
+    finally:
+        for _, future in pending: #~ Batches left after a failure
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
+
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def _embed(embedding_function:Callable[[list[str]], list], documents:list[str]) -> tuple[list, float]:
+    """Embeds `documents` in a pool worker & returns embeddings with seconds it took.
+    """
+
+    started = time.perf_counter()
+    embeddings = embedding_function(documents)
+    return embeddings, time.perf_counter() - started
+
+
+def _upsert(collection:Collection, batch:list[Record], embeddings:list, retries:int, backoff:float, stats:IngestStats):
+    ids, documents, metadatas = (list(column) for column in zip(*batch))
+    if not any(metadatas): #~ Chroma rejects empty metadata, but takes none at all
+        metadatas = None
+    for attempt in range(retries + 1):
+        try:
+            collection.upsert(ids=ids, embeddings=embeddings, documents=documents, metadatas=metadatas)
+            return
+        except PERMANENT_ERRORS:
+            raise
+        except Exception:
+            if attempt == retries:
+                raise
+            stats.retries += 1
+            time.sleep(backoff * 2 ** attempt)
@@ -1,47 +1,120 @@
+import argparse
+import copy
+import sys
+from pathlib import Path
+from typing import Optional
+
 import chromadb
+from chromadb.api import ClientAPI
+from chromadb.api.models.Collection import Collection
+from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
 from pprint import pprint
 
+from ingest import IngestStats, ingest, read_documents
+
+sys.path.append(str(Path(__file__).resolve().parents[1])) # Repository root, for `algorithms`
+from algorithms.data_structures.lru_cache import memoize
+
+
+COLLECTION_NAME = 'my-documents'
+
+DOCUMENTS = [
+    'Swimming strengthens the entire body while providing a refreshing escape from daily stress.',
+    'Running clears the mind and builds endurance with every rhythmic stride.',
+    'Gaming connects people worldwide through strategy, creativity, and shared adventures.',
+    'Food brings people together, offering comfort, culture, and creativity in every bite.',
+    'Music speaks the language of emotion, connecting hearts through rhythm and melody.',
+    'Sport teaches discipline, teamwork, and the thrill of striving toward greatness.',
+    'Queen',
+    'King',
+    'Ace'
+]
+METADATAS = [
+    {'topic': 'sport'},
+    {'topic': 'sport'},
+    {'topic': 'gaming'},
+    {'topic': 'food'},
+    {'topic': 'music'},
+    {'topic': 'sport'},
+    {'topic': 'people'},
+    {'topic': 'people'},
+    {'topic': 'people'}
+]
+IDS = ['doc1', 'doc2', 'doc3', 'doc4', 'doc5', 'doc6', 'doc7', 'doc8', 'doc9']
 
 collection = None
 
-def main():
-    global collection
-    
-    client = chromadb.Client()
-    collection = client.get_or_create_collection(
-        name='my-documents',
-        metadata={'hnsw:space': 'l2'}
+def open_collection(path:Optional[str]=None, embedding_function=None) -> tuple[ClientAPI, Collection]:
+    # In memory if path is None - everything is gone once the process exits
+    # Otherwise persisted in the path directory, so documents added by earlier runs are there on reopen
+    client = chromadb.Client() if path is None else chromadb.PersistentClient(path=path)
+    options = {} if embedding_function is None else {'embedding_function': embedding_function}
+    return client, client.get_or_create_collection(
+        name=COLLECTION_NAME,
+        metadata={'hnsw:space': 'l2'},
+        **options
     )
-    collection.add(
-        documents=[
-            'Swimming strengthens the entire body while providing a refreshing escape from daily stress.',
-            'Running clears the mind and builds endurance with every rhythmic stride.',
-            'Gaming connects people worldwide through strategy, creativity, and shared adventures.',
-            'Food brings people together, offering comfort, culture, and creativity in every bite.',
-            'Music speaks the language of emotion, connecting hearts through rhythm and melody.',
-            'Sport teaches discipline, teamwork, and the thrill of striving toward greatness.',
-            'Queen',
-            'King',
-            'Ace'
-        ],
-        metadatas=[
-            {'topic': 'sport'},
-            {'topic': 'sport'},
-            {'topic': 'gaming'},
-            {'topic': 'food'},
-            {'topic': 'music'},
-            {'topic': 'sport'},
-            {'topic': 'people'},
-            {'topic': 'people'},
-            {'topic': 'people'}
-        ],
-        ids=['doc1', 'doc2', 'doc3', 'doc4', 'doc5', 'doc6', 'doc7', 'doc8', 'doc9']
+    
+def missing_ids(collection:Collection, ids:list[str], batch_size:int) -> set[str]:
+    # IDs not in the collection yet, looked up without fetching embeddings or documents
+    if not collection.count(): # Empty collection - nothing to look up
+        return set(ids)
+    
+    missing = set(ids)
+    for start in range(0, len(ids), batch_size):
+        missing.difference_update(collection.get(ids=ids[start:start + batch_size], include=[])['ids'])
+    return missing
+    
+def add_documents(
+    client:ClientAPI,
+    collection:Collection,
+    ids:list[str],
+    documents:list[str],
+    metadatas:Optional[list[dict]]=None
+) -> int:
+    # Adds documents whose IDs are missing from the collection & returns how many were added
+    # Documents indexed by earlier runs of a persistent collection are neither embedded nor sent again
+    batch_size = client.get_max_batch_size() # Larger `add` calls are rejected
+    missing = missing_ids(collection, ids, batch_size)
+    selected = [i for i, id_ in enumerate(ids) if id_ in missing]
+    
+    for start in range(0, len(selected), batch_size):
+        batch = selected[start:start + batch_size]
+        collection.add(
+            documents=[documents[i] for i in batch],
+            metadatas=None if metadatas is None else [metadatas[i] for i in batch],
+            ids=[ids[i] for i in batch]
+        )
+    return len(selected)
+    
+def print_progress(stats:IngestStats):
+    print(
+        f"\r{stats.documents:,} documents ({stats.skipped:,} skipped), {stats.docs_per_second:,.0f} docs/s, "
+        f"embedding p50 {stats.latency_percentile(50) * 1000:.0f} ms, p99 {stats.latency_percentile(99) * 1000:.0f} ms",
+        end='', flush=True
     )
     
+def main(path:Optional[str]=None, input_path:Optional[str]=None, workers:int=4):
+    global collection
+    
+    embedding_function = DefaultEmbeddingFunction() # What the collection embeds queries with
+    client, collection = open_collection(path, embedding_function)
+    if input_path is None:
+        add_documents(client, collection, IDS, DOCUMENTS, METADATAS)
+    else: # Streams the file, documents already in a persistent collection are not embedded again
+        ingest(
+            client, collection, read_documents(input_path), embedding_function,
+            workers=workers, skip_existing=True, progress=print_progress
+        )
+        print()
+    query_results.cache.clear() # Results cached before the documents were added are stale
+    
     # document_idx -> metadata_idx -> ids_idx
-    # document -> llm (feed instructions) -> topic 
+    # document -> llm (feed instructions) -> topic
     
-def query_db(text:str):
+@memoize(max_entries=1024, ttl=300) # Repeated query texts skip embedding & the HNSW search
+def query_results(text:str):
+    # Cleared by main - documents added to the collection any other way are missed for up to ttl seconds
     global collection
     
     return collection.query(
@@ -49,10 +122,20 @@ def query_db(text:str):
         n_results=3
     )
     
+def query_db(text:str):
+    # Every caller gets its own copy, so changing a result does not change what later callers get
+    return copy.deepcopy(query_results(text))
+    
     
     
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Indexes example documents in ChromaDB & queries them.")
+    parser.add_argument('--path', help="directory to persist the collection in, kept in memory if omitted")
+    parser.add_argument('--input', help="JSONL or CSV file with id & document fields to ingest instead of examples")
+    parser.add_argument('--workers', type=int, default=4, help="threads embedding batches of --input")
+    args = parser.parse_args()
+    
+    main(args.path, args.input, args.workers)
     pprint(query_db(
         text='Let us play cards!'
     ))
\ No newline at end of file